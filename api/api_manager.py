@@ -1,21 +1,25 @@
 from api.auth_api import AuthAPI
 from api.movies_api import MoviesAPI
 from api.user_api import UserAPI
+from custom_requester.auth_context import AuthContext
 
 
 class ApiManager:
     """
     Класс для управления API-классами с единой HTTP-сессией.
     """
-    def __init__(self, session):
+    def __init__(self, session, auth=None):
         """
         Инициализация ApiManager
         :param session: HTTP-сессия, используемая всем API-слассами.
+        :param auth: AuthContext идентичности (по умолчанию новая анонимная идентичность).
+                     Несколько ApiManager с разными идентичностями могут использовать одну сессию.
         """
         self.session = session
-        self.auth_api = AuthAPI(session)
-        self.user_api = UserAPI(session)
-        self.movies_api = MoviesAPI(session)
+        self.auth = auth if auth is not None else AuthContext()
+        self.auth_api = AuthAPI(session, self.auth)
+        self.user_api = UserAPI(session, self.auth)
+        self.movies_api = MoviesAPI(session, self.auth)
 
     def close_session(self):
         self.session.close()
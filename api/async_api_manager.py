@@ -0,0 +1,40 @@
+from api.async_auth_api import AsyncAuthAPI
+from api.async_movies_api import AsyncMoviesAPI
+from api.async_user_api import AsyncUserAPI
+from custom_requester.async_custom_requester import AsyncCustomRequester
+from custom_requester.auth_context import AuthContext
+
+
+class AsyncApiManager:
+    """
+    Класс для управления асинхронными API-классами с единой aiohttp-сессией.
+    """
+    def __init__(self, session, auth=None):
+        """
+        Инициализация AsyncApiManager
+        :param session: aiohttp-сессия, используемая всеми API-классами.
+        :param auth: AuthContext идентичности (по умолчанию новая анонимная идентичность).
+                     Несколько AsyncApiManager с разными идентичностями могут использовать одну сессию.
+        """
+        self.session = session
+        self.auth = auth if auth is not None else AuthContext()
+        self.auth_api = AsyncAuthAPI(session, self.auth)
+        self.user_api = AsyncUserAPI(session, self.auth)
+        self.movies_api = AsyncMoviesAPI(session, self.auth)
+
+    @classmethod
+    def create(cls, limit=100, limit_per_host=0):
+        """
+        Создание AsyncApiManager с собственной aiohttp-сессией и ограниченным пулом соединений.
+        Должен вызываться внутри работающего event loop.
+        """
+        return cls(AsyncCustomRequester.create_session(limit=limit, limit_per_host=limit_per_host))
+
+    async def close_session(self):
+        await self.session.close()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close_session()
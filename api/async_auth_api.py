@@ -0,0 +1,35 @@
+from api.auth_api import AuthAPI
+from api.token_cache import TOKEN_CACHE
+from custom_requester.async_custom_requester import AsyncCustomRequester
+
+
+class AsyncAuthAPI(AuthAPI, AsyncCustomRequester):
+    """
+    Асинхронный класс для работы с аутентификацией.
+    Методы register_user и login_user наследуются от AuthAPI и возвращают корутины.
+    """
+
+    async def authenticate(self, user_creds, use_cache=True):
+        token = TOKEN_CACHE.get(user_creds) if use_cache else None
+        if token is None:
+            token = await self._login_for_token(user_creds)
+            TOKEN_CACHE.put(user_creds, token)
+
+        self.auth.set_token(token, refresher=lambda: self._refresh_token(user_creds))
+
+    async def _login_for_token(self, user_creds):
+        login_data = {
+            "email": user_creds[0],
+            "password": user_creds[1]
+        }
+
+        response = (await self.login_user(login_data)).json()
+        if "accessToken" not in response:
+            raise KeyError("token is missing")
+        return response["accessToken"]
+
+    async def _refresh_token(self, user_creds):
+        TOKEN_CACHE.invalidate(user_creds)
+        token = await self._login_for_token(user_creds)
+        TOKEN_CACHE.put(user_creds, token)
+        return token
@@ -0,0 +1,45 @@
+import asyncio
+
+from api.movies_api import MoviesAPI
+from custom_requester.async_custom_requester import AsyncCustomRequester
+
+
+class AsyncMoviesAPI(MoviesAPI, AsyncCustomRequester):
+    """
+    Асинхронный класс для работы с API фильмов.
+    Методы наследуются от MoviesAPI и возвращают корутины, iter_movies - асинхронный генератор.
+    """
+
+    async def iter_movies(self, params=None, page_size=20, prefetch=False, max_pages=None, trusted=False):
+        """
+        Асинхронный ленивый обход всех страниц /movies с заданными фильтрами.
+        Параметры совпадают с MoviesAPI.iter_movies.
+        :return: Асинхронный генератор объектов MoviesDataResponse.
+        """
+        page_params = dict(params or {})
+        page_params["pageSize"] = page_size
+        page = page_params.pop("page", 1)
+
+        async def _fetch(page_number):
+            return await self.get_movies_model({**page_params, "page": page_number}, trusted)
+
+        data = await _fetch(page)
+        pages_read = 1
+        next_page = None
+        try:
+            while True:
+                has_next = page < data.pageCount and (max_pages is None or pages_read < max_pages)
+                next_page = asyncio.ensure_future(_fetch(page + 1)) if prefetch and has_next else None
+
+                for movie in data.movies:
+                    yield movie
+
+                if not has_next:
+                    return
+                page += 1
+                pages_read += 1
+                data = await next_page if next_page else await _fetch(page)
+                next_page = None
+        finally:
+            if next_page is not None and not next_page.done():
+                next_page.cancel()
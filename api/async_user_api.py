@@ -0,0 +1,9 @@
+from api.user_api import UserAPI
+from custom_requester.async_custom_requester import AsyncCustomRequester
+
+
+class AsyncUserAPI(UserAPI, AsyncCustomRequester):
+    """
+    Асинхронный класс для работы с API пользователей.
+    Все методы наследуются от UserAPI и возвращают корутины.
+    """
@@ -1,5 +1,7 @@
+from api.token_cache import TOKEN_CACHE
 from constants.constants import USER_URL, REGISTER_ENDPOINT, LOGIN_ENDPOINT
 from custom_requester.custom_requester import CustomRequester
+from models.base_models import RegisterUserResponse
 
 
 class AuthAPI(CustomRequester):
@@ -7,9 +9,9 @@ class AuthAPI(CustomRequester):
     Класс для работы с аутентификацией.
     """
 
-    def __init__(self, session):
+    def __init__(self, session, auth=None):
         self.session = session
-        super().__init__(session=session, base_url=USER_URL)
+        super().__init__(session=session, base_url=USER_URL, auth=auth)
 
     def register_user(self, user_data, expected_status=201):
         """
@@ -21,9 +23,18 @@ class AuthAPI(CustomRequester):
             method="POST",
             endpoint=REGISTER_ENDPOINT,
             data=user_data,
-            expected_status=expected_status
+            expected_status=expected_status,
+            authorized=False
         )
 
+    def register_user_model(self, user_data, trusted=False):
+        """
+        Регистрация пользователя с разбором ответа в RegisterUserResponse.
+        :param user_data: Данные пользователя.
+        :param trusted: Создать модель без валидации ответа (model_construct).
+        """
+        return self.parse_model(self.register_user(user_data), RegisterUserResponse, trusted)
+
     def login_user(self, login_data, expected_status=200):
         """
         Авторизация пользователя.
@@ -34,10 +45,26 @@ class AuthAPI(CustomRequester):
             method="POST",
             endpoint=LOGIN_ENDPOINT,
             data=login_data,
-            expected_status=expected_status
+            expected_status=expected_status,
+            authorized=False
         )
 
-    def authenticate(self, user_creds):
+    def authenticate(self, user_creds, use_cache=True):
+        """
+        Авторизация идентичности (self.auth) токеном пользователя.
+        Токен берется из TOKEN_CACHE, логин выполняется только при его отсутствии или скором истечении.
+        При получении 401 на запрос с этим токеном идентичность прозрачно переавторизуется и повторяет запрос.
+        :param user_creds: Кортеж (email, password).
+        :param use_cache: Использовать ли закэшированный токен.
+        """
+        token = TOKEN_CACHE.get(user_creds) if use_cache else None
+        if token is None:
+            token = self._login_for_token(user_creds)
+            TOKEN_CACHE.put(user_creds, token)
+
+        self.auth.set_token(token, refresher=lambda: self._refresh_token(user_creds))
+
+    def _login_for_token(self, user_creds):
         login_data = {
             "email": user_creds[0],
             "password": user_creds[1]
@@ -46,10 +73,16 @@ class AuthAPI(CustomRequester):
         response = self.login_user(login_data).json()
         if "accessToken" not in response:
             raise KeyError("token is missing")
+        return response["accessToken"]
 
-        token = response["accessToken"]
-        self._update_session_headers(**{"authorization": "Bearer " + token})
+    def _refresh_token(self, user_creds):
+        """
+        Получение нового токена после 401: токен из кэша сбрасывается, выполняется логин.
+        """
+        TOKEN_CACHE.invalidate(user_creds)
+        token = self._login_for_token(user_creds)
+        TOKEN_CACHE.put(user_creds, token)
+        return token
 
     def logout(self):
-        if "authorization" in self.session.headers:
-            del self.session.headers["authorization"]
+        self.auth.clear()
@@ -1,5 +1,8 @@
+from concurrent.futures import ThreadPoolExecutor
+
 from constants.constants import MOVIES_URL
 from custom_requester.custom_requester import CustomRequester
+from models.base_models import MoviesDataResponse, MoviesPageResponse
 
 
 class MoviesAPI(CustomRequester):
@@ -7,9 +10,9 @@ class MoviesAPI(CustomRequester):
     Класс для работы с API фильмов.
     """
 
-    def __init__(self, session):
+    def __init__(self, session, auth=None):
         self.session = session
-        super().__init__(session=session, base_url=MOVIES_URL)
+        super().__init__(session=session, base_url=MOVIES_URL, auth=auth)
 
     def get_movies(self, params=None, expected_status=200):
         """
@@ -24,6 +27,52 @@ class MoviesAPI(CustomRequester):
             expected_status=expected_status,
         )
 
+    def get_movies_model(self, params=None, trusted=False):
+        """
+        Получение страницы фильмов в виде MoviesPageResponse.
+        :param params: Query-параметры.
+        :param trusted: Создать модель без валидации ответа (model_construct).
+        """
+        return self.parse_model(self.get_movies(params), MoviesPageResponse, trusted)
+
+    def iter_movies(self, params=None, page_size=20, prefetch=False, max_pages=None, trusted=False):
+        """
+        Ленивый обход всех страниц /movies с заданными фильтрами.
+        Одновременно в памяти находится не более одной (при prefetch - двух) страниц.
+        :param params: Query-параметры фильтрации (page и pageSize подставляются автоматически).
+        :param page_size: Размер страницы.
+        :param prefetch: Загружать следующую страницу в фоне, пока обрабатывается текущая.
+        :param max_pages: Ограничение количества страниц (None - все страницы).
+        :param trusted: Создавать фильмы без валидации (model_construct).
+        :return: Генератор объектов MoviesDataResponse.
+        """
+        page_params = dict(params or {})
+        page_params["pageSize"] = page_size
+        first_page = page_params.pop("page", 1)
+
+        def _fetch(page):
+            return self.get_movies_model({**page_params, "page": page}, trusted)
+
+        executor = ThreadPoolExecutor(max_workers=1) if prefetch else None
+        try:
+            page = first_page
+            data = _fetch(page)
+            pages_read = 1
+            while True:
+                has_next = page < data.pageCount and (max_pages is None or pages_read < max_pages)
+                next_page = executor.submit(_fetch, page + 1) if executor and has_next else None
+
+                yield from data.movies
+
+                if not has_next:
+                    return
+                page += 1
+                pages_read += 1
+                data = next_page.result() if next_page else _fetch(page)
+        finally:
+            if executor:
+                executor.shutdown(wait=True, cancel_futures=True)
+
     def get_movie(self, movie_id, expected_status=200):
         """
         Получение информации о фильме
@@ -36,6 +85,14 @@ class MoviesAPI(CustomRequester):
             expected_status=expected_status
         )
 
+    def get_movie_model(self, movie_id, trusted=False):
+        """
+        Получение фильма в виде MoviesDataResponse.
+        :param movie_id: ID фильма
+        :param trusted: Создать модель без валидации ответа (model_construct).
+        """
+        return self.parse_model(self.get_movie(movie_id), MoviesDataResponse, trusted)
+
     def create_movie(self, movies_data, expected_status=201):
         """
         Создание фильма
@@ -49,6 +106,14 @@ class MoviesAPI(CustomRequester):
             expected_status=expected_status,
         )
 
+    def create_movie_model(self, movies_data, trusted=False):
+        """
+        Создание фильма с разбором ответа в MoviesDataResponse.
+        :param movies_data: Данные для создания фильма
+        :param trusted: Создать модель без валидации ответа (model_construct).
+        """
+        return self.parse_model(self.create_movie(movies_data), MoviesDataResponse, trusted)
+
     def update_movie(self, movie_id, movies_data, expected_status=200):
         """
         Изменение существующего фильма
@@ -64,6 +129,15 @@ class MoviesAPI(CustomRequester):
             expected_status=expected_status
         )
 
+    def update_movie_model(self, movie_id, movies_data, trusted=False):
+        """
+        Обновление фильма с разбором ответа в MoviesDataResponse.
+        :param movie_id: ID фильма
+        :param movies_data: Данные для обновления фильма
+        :param trusted: Создать модель без валидации ответа (model_construct).
+        """
+        return self.parse_model(self.update_movie(movie_id, movies_data), MoviesDataResponse, trusted)
+
     def delete_movie(self, movie_id, expected_status=200):
         """
         Удаление фильма
@@ -0,0 +1,120 @@
+import base64
+import hashlib
+import json
+import os
+import threading
+import time
+
+from filelock import FileLock
+
+from constants.constants import USER_URL
+from tools.tools import Tools
+
+# Время жизни токена, если в нем нет claim "exp"
+DEFAULT_TOKEN_TTL = 10 * 60
+# За сколько секунд до истечения токен считается протухшим
+DEFAULT_REFRESH_MARGIN = int(os.getenv("CINESCOPE_TOKEN_REFRESH_MARGIN", 60))
+
+
+def jwt_expiry(token):
+    """
+    Чтение claim "exp" из JWT без проверки подписи.
+    :param token: accessToken.
+    :return: Unix-время истечения токена или None, если его не удалось прочитать.
+    """
+    try:
+        payload = token.split(".")[1]
+        payload += "=" * (-len(payload) % 4)
+        return int(json.loads(base64.urlsafe_b64decode(payload))["exp"])
+    except (IndexError, KeyError, ValueError, TypeError):
+        return None
+
+
+class TokenCache:
+    """
+    Кэш accessToken, ключом которого являются учетные данные.
+    Общий для всех сессий процесса; при shared=True дополнительно хранится в файле
+    под файловой блокировкой и разделяется между xdist-воркерами.
+    """
+
+    def __init__(self, path=None, shared=False, refresh_margin=DEFAULT_REFRESH_MARGIN):
+        self._path = path
+        self.shared = shared
+        self.refresh_margin = refresh_margin
+        self._tokens = {}
+        self._lock = threading.Lock()
+
+    @property
+    def path(self):
+        if self._path is None:
+            # Файл привязан к прогону: токены не переживают перезапуск стенда/стаба между прогонами
+            run_id = os.getenv("PYTEST_XDIST_TESTRUNUID", "local")
+            self._path = str(Tools.files_dir("auth", f"token_cache_{run_id}.json"))
+        return self._path
+
+    @staticmethod
+    def _key(user_creds):
+        # Токены разных auth-сервисов (например, стабов разных xdist-воркеров) не взаимозаменяемы
+        email, password = user_creds
+        return hashlib.sha256(f"{USER_URL}:{email}:{password}".encode("utf-8")).hexdigest()
+
+    def _is_fresh(self, entry):
+        return entry is not None and entry["expires_at"] - self.refresh_margin > time.time()
+
+    def _read_file(self):
+        if not os.path.exists(self.path):
+            return {}
+        try:
+            with open(self.path, encoding="utf-8") as file:
+                return json.load(file)
+        except (OSError, ValueError):
+            return {}
+
+    def _write_file(self, tokens):
+        with open(self.path, "w", encoding="utf-8") as file:
+            json.dump(tokens, file)
+
+    def get(self, user_creds):
+        """
+        Возвращает закэшированный токен или None, если его нет или он скоро истечет.
+        """
+        key = self._key(user_creds)
+        with self._lock:
+            entry = self._tokens.get(key)
+            if self._is_fresh(entry):
+                return entry["token"]
+        if self.shared:
+            with FileLock(f"{self.path}.lock"):
+                entry = self._read_file().get(key)
+            if self._is_fresh(entry):
+                with self._lock:
+                    self._tokens[key] = entry
+                return entry["token"]
+        return None
+
+    def put(self, user_creds, token):
+        key = self._key(user_creds)
+        entry = {"token": token, "expires_at": jwt_expiry(token) or time.time() + DEFAULT_TOKEN_TTL}
+        with self._lock:
+            self._tokens[key] = entry
+        if self.shared:
+            with FileLock(f"{self.path}.lock"):
+                tokens = self._read_file()
+                tokens[key] = entry
+                self._write_file(tokens)
+
+    def invalidate(self, user_creds):
+        key = self._key(user_creds)
+        with self._lock:
+            self._tokens.pop(key, None)
+        if self.shared:
+            with FileLock(f"{self.path}.lock"):
+                tokens = self._read_file()
+                if tokens.pop(key, None) is not None:
+                    self._write_file(tokens)
+
+
+# Общий кэш процесса. Файл разделяется между xdist-воркерами (или при CINESCOPE_SHARED_TOKEN_CACHE=1)
+TOKEN_CACHE = TokenCache(
+    shared=bool(os.getenv("PYTEST_XDIST_WORKER")) or os.getenv("CINESCOPE_SHARED_TOKEN_CACHE") == "1"
+)
@@ -1,5 +1,6 @@
 from custom_requester.custom_requester import CustomRequester
 from constants.constants import USER_URL
+from models.base_models import RegisterUserResponse
 
 
 class UserAPI(CustomRequester):
@@ -7,9 +8,9 @@ class UserAPI(CustomRequester):
     Класс для работы с API пользователей.
     """
 
-    def __init__(self, session):
+    def __init__(self, session, auth=None):
         self.session = session
-        super().__init__(session=session, base_url=USER_URL)
+        super().__init__(session=session, base_url=USER_URL, auth=auth)
 
     def get_user(self, user_locator, expected_status=200):
         """
@@ -24,6 +25,14 @@ class UserAPI(CustomRequester):
             expected_status=expected_status,
         )
 
+    def get_user_model(self, user_locator, trusted=False):
+        """
+        Получение пользователя в виде RegisterUserResponse.
+        :param user_locator: ID или email пользователя.
+        :param trusted: Создать модель без валидации ответа (model_construct).
+        """
+        return self.parse_model(self.get_user(user_locator), RegisterUserResponse, trusted)
+
     def create_user(self, user_data, expected_status=201):
         """
         Создание пользователя
@@ -38,6 +47,14 @@ class UserAPI(CustomRequester):
             expected_status=expected_status
         )
 
+    def create_user_model(self, user_data, trusted=False):
+        """
+        Создание пользователя с разбором ответа в RegisterUserResponse.
+        :param user_data: данные для создания пользователя.
+        :param trusted: Создать модель без валидации ответа (model_construct).
+        """
+        return self.parse_model(self.create_user(user_data), RegisterUserResponse, trusted)
+
     def delete_user(self, user_id, expected_status=200):
         """
         Удаление пользователя.
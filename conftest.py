@@ -1,40 +1,201 @@
 import os
 
 import pytest
-import requests
 from dotenv import load_dotenv
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
 from api.api_manager import ApiManager
-from constants.constants import PG_URL
+from constants.constants import CINESCOPE_TARGET, STUB_HOST, STUB_PORT
 from custom_requester.custom_requester import CustomRequester
+from custom_requester.http_logging import FAILURE_BUFFER, HTTP_LOG_MODE
+from custom_requester.metrics import METRICS
+from custom_requester.session_factory import SessionFactory
+from db_requester.async_db_verifier import AsyncDBVerifier
+from db_requester.db_engine import DB_ENGINE
+from db_requester.db_helper import DBHelper
+from db_requester.db_snapshot import CLEANUP_ENV, SNAPSHOT_ENV, DBSnapshot
 from entities.user import User
 from enums.models import Roles
-from models.base_models import UserData, MoviesData, MoviesDataResponse
+from models.base_models import UserData, MoviesData
+from provisioning.db_seeder import DBSeeder
+from provisioning.movie_provisioner import MovieProvisioner
+from provisioning.storage_state_cache import StorageStateCache
+from provisioning.user_pool import UserPool
 from resources.user_creds import SuperAdminCreds
+from stub_server.server import CinescopeStubServer
+from tools.browser_pool import BrowserPool
 from tools.tools import Tools
+from tools.workers import WorkerNamespace
 from utils.data_generator import DataGenerator
+from utils.data_replay import DATA_REPLAY, SEED_ENV
 
 
 
-# Создаем движок (engine) для подключения к базе данных
-engine = create_engine(PG_URL)
-# Создаем фабрику сессий
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+#### LOCAL STUB / XDIST ####
 
 
-@pytest.fixture(scope="module")
-def db_session():
+def _runs_tests(config):
     """
-    Фикстура, которая создает и возвращает сессию для работы с базой данных.
-    После завершения теста сессия автоматически закрывается.
+    Процесс выполняет тесты: xdist-воркер или запуск без xdist (контроллер xdist тесты не выполняет).
+    """
+    return hasattr(config, "workerinput") or not getattr(config.option, "numprocesses", None)
+
+
+def pytest_configure(config):
+    """
+    Включает группировку тестов по xdist_group при запуске с -n.
+    При CINESCOPE_TARGET=local поднимает локальный стаб Cinescope в процессе, выполняющем тесты
+    (каждый xdist-воркер поднимает свой стаб на собственном порту, контроллер - не поднимает).
+    Если стаб уже запущен отдельно (python -m stub_server), задайте CINESCOPE_STUB_EXTERNAL=1.
+    """
+    # Без явного --dist xdist распределяет тесты по load; loadgroup дополнительно учитывает xdist_group
+    explicit_dist = any(arg.startswith("--dist") for arg in config.invocation_params.args)
+    if getattr(config.option, "dist", "no") == "load" and not explicit_dist:
+        config.option.dist = "loadgroup"
+
+    if CINESCOPE_TARGET == "local" and os.getenv("CINESCOPE_STUB_EXTERNAL") != "1" and _runs_tests(config):
+        config.cinescope_stub = CinescopeStubServer(
+            STUB_HOST, STUB_PORT, SuperAdminCreds.USERNAME, SuperAdminCreds.PASSWORD
+        ).start()
+
+    # Идентификатор прогона контроллера передается воркерам, чтобы префиксы данных воркеров
+    # совпадали с тем, что контроллер считает данными этого прогона (очистка по снимку базы)
+    workerinput = getattr(config, "workerinput", None)
+    if workerinput is None and hasattr(config.option, "testrunuid"):
+        if config.option.testrunuid is None:
+            config.option.testrunuid = WorkerNamespace.run_uid()
+        os.environ["PYTEST_XDIST_TESTRUNUID"] = config.option.testrunuid
+
+    # Зерно тестовых данных выбирает контроллер, xdist-воркеры получают его через workerinput
+    if workerinput is not None:
+        DATA_REPLAY.configure_from_env(workerinput["cinescope_seed"], writer=False)
+    else:
+        DATA_REPLAY.configure_from_env()
+
+
+def pytest_collection_modifyitems(config, items):
+    """
+    Группировка тестов по дорогим фикстурам (db_session, браузер) через маркер xdist_group.
+    Тесты с явно заданным xdist_group не изменяются.
+    """
+    for item in items:
+        if item.get_closest_marker("xdist_group"):
+            continue
+        group = WorkerNamespace.xdist_group(getattr(item, "fixturenames", ()), item.module.__name__)
+        if group:
+            item.add_marker(pytest.mark.xdist_group(group))
+
+
+def pytest_unconfigure(config):
+    stub = getattr(config, "cinescope_stub", None)
+    if stub is not None and _runs_tests(config):
+        stub.stop()
+    DATA_REPLAY.close()
+
+
+#### TEST DATA SEED ####
+
+
+def pytest_configure_node(node):
+    node.workerinput["cinescope_seed"] = DATA_REPLAY.run_seed
+
+
+def pytest_report_header(config):
+    header = f"cinescope data seed: {DATA_REPLAY.run_seed} (воспроизведение: {SEED_ENV}={DATA_REPLAY.run_seed})"
+    if DATA_REPLAY.replay_path:
+        header += f", replay: {DATA_REPLAY.replay_path}"
+    if DATA_REPLAY.record_path:
+        header += f", record: {DATA_REPLAY.record_path}"
+    return header
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_fixture_setup(fixturedef, request):
+    """
+    Фикстуры шире function генерируют данные под своим ключом "<session>:<фикстура>:<воркер>",
+    а не под id теста, который первым их запросил.
+    """
+    if fixturedef.scope == "function":
+        yield
+        return
+    with DataGenerator.scope(f"<session>:{fixturedef.argname}:{WorkerNamespace.worker_id()}"):
+        yield
+
+
+@pytest.fixture(autouse=True)
+def data_seed(request):
+    """
+    Детерминированное зерно DataGenerator для каждого теста, производное от зерна прогона и id теста.
+    Не зависит от распределения тестов по xdist-воркерам.
+    """
+    seed = DATA_REPLAY.start(request.node.nodeid)
+    DataGenerator.seed(seed)
+    return seed
+
+
+def _skip_without_db():
+    if CINESCOPE_TARGET == "local":
+        pytest.skip("База данных недоступна при CINESCOPE_TARGET=local")
+    if not DB_ENGINE.is_configured:
+        pytest.skip("Параметры базы данных не заданы в .env")
+
+
+@pytest.fixture(scope="session")
+def db_engine():
+    """
+    Движок базы данных процесса. Создается (с прогревом пула) только при первом DB-тесте.
+    У локального стаба базы данных нет.
+    """
+    _skip_without_db()
+    yield DB_ENGINE.engine
+    DB_ENGINE.dispose()
+
+
+@pytest.fixture
+def db_session(db_engine):
     """
-    # Создаем новую сессию
-    db_session = SessionLocal()
+    Фикстура, которая создает и возвращает сессию для работы с базой данных.
+    Тест выполняется внутри внешней транзакции: его commit() фиксирует только точку сохранения,
+    а после теста транзакция откатывается - изменения в базе не переживают тест
+    и не видны параллельным воркерам.
+    Данные, созданные сервисом через API, в эту транзакцию не входят и удаляются через API.
+    """
+    connection = db_engine.connect()
+    transaction = connection.begin()
+    db_session = DB_ENGINE.isolated_session(connection)
     # Возвращаем сессию в тест
     yield db_session
-    # Закрываем сессию после завершения теста
+    # Закрываем сессию и откатываем все изменения теста
     db_session.close()
+    transaction.rollback()
+    connection.close()
+
+
+@pytest.fixture
+def db_helper(db_session):
+    """
+    Запросы для проверок в базе по первичному ключу и индексированным колонкам поверх db_session.
+    """
+    return DBHelper(db_session)
+
+
+@pytest.fixture(scope="session")
+def db_seeder(db_engine):
+    """
+    Массовое создание фильмов и пользователей напрямую в базе для тестов, которые только читают данные.
+    По окончании сессии все строки с тегом воркера удаляются одним DELETE на таблицу.
+    """
+    seeder = DBSeeder(db_engine)
+    yield seeder
+    seeder.cleanup()
+
+
+@pytest.fixture
+def async_db_verifier():
+    """
+    Фабрика AsyncDBVerifier для асинхронных проверок базы данных.
+    Верификатор создается внутри event loop теста: async with async_db_verifier() as db: ...
+    """
+    _skip_without_db()
+    return AsyncDBVerifier.create
 
 
 # @pytest.fixture(scope="module")
@@ -69,12 +230,124 @@ def db_session():
 #     session.close() #завершем сессию (отключаемся от базы данных)
 
 
+#### HTTP METRICS ####
+
+
+def pytest_testnodedown(node, error):
+    """
+    Сбор гистограмм задержек с xdist-воркеров на контроллере.
+    """
+    worker_metrics = getattr(node, "workeroutput", {}).get("http_metrics")
+    if worker_metrics:
+        METRICS.merge_dict(worker_metrics)
+
+
+def pytest_sessionfinish(session):
+    """
+    Выгрузка гистограмм задержек HTTP-запросов в files/metrics/http_metrics_<timestamp>.json.
+    На xdist-воркерах данные передаются контроллеру через workeroutput.
+    При CINESCOPE_DB_SNAPSHOT=1 снимок базы сравнивается с текущим состоянием, отчет об утечках
+    пишется в files/db_snapshot/db_leaks_<timestamp>.json (CINESCOPE_DB_SNAPSHOT_CLEANUP=1 - утечки удаляются).
+    """
+    workeroutput = getattr(session.config, "workeroutput", None)
+    if workeroutput is not None:
+        workeroutput["http_metrics"] = METRICS.to_dict()
+    elif METRICS:
+        METRICS.dump_json(Tools.files_dir("metrics", f"http_metrics_{Tools.get_timestamp()}.json"))
+
+    if DB_SNAPSHOT is not None:
+        diffs = DB_SNAPSHOT.diff()
+        deleted = DB_SNAPSHOT.cleanup(diffs) if os.getenv(CLEANUP_ENV) == "1" else None
+        DBSnapshot.dump_json(diffs, Tools.files_dir("db_snapshot", f"db_leaks_{Tools.get_timestamp()}.json"))
+        session.config.cinescope_db_leaks = DBSnapshot.format_summary(diffs, deleted)
+        DB_ENGINE.dispose()
+
+
+def pytest_terminal_summary(terminalreporter):
+    """
+    Сводка задержек HTTP-запросов по шаблонам эндпоинтов, зерно тестовых данных
+    и оставшиеся в базе строки (CINESCOPE_DB_SNAPSHOT=1) в конце прогона.
+    """
+    if METRICS:
+        terminalreporter.section("HTTP latency")
+        terminalreporter.write_line(METRICS.format_summary())
+    terminalreporter.write_line(f"cinescope data seed: {DATA_REPLAY.run_seed}")
+    db_leaks = getattr(terminalreporter.config, "cinescope_db_leaks", None)
+    if db_leaks is not None:
+        terminalreporter.section("DB leaks")
+        terminalreporter.write_line(db_leaks)
+
+
+#### DB SNAPSHOT ####
+
+# Снимок users и movies до прогона (CINESCOPE_DB_SNAPSHOT=1); ведется только контроллером или единственным процессом
+DB_SNAPSHOT = None
+
+
+def pytest_sessionstart(session):
+    """
+    При CINESCOPE_DB_SNAPSHOT=1 таблицы снимаются до запуска тестов, чтобы в конце прогона
+    найти оставшиеся строки и тесты, которые их создали.
+    """
+    global DB_SNAPSHOT
+    if os.getenv(SNAPSHOT_ENV) != "1" or hasattr(session.config, "workerinput"):
+        return
+    if CINESCOPE_TARGET == "local" or not DB_ENGINE.is_configured:
+        return
+    DB_SNAPSHOT = DBSnapshot(
+        DB_ENGINE.engine, str(Tools.files_dir("db_snapshot", WorkerNamespace.prefix())), run_id=WorkerNamespace.run_id()
+    )
+    DB_SNAPSHOT.capture()
+
+
+def pytest_runtest_logreport(report):
+    """
+    Окна выполнения тестов для привязки оставшихся строк к тестам (отчеты xdist-воркеров приходят на контроллер).
+    """
+    if DB_SNAPSHOT is not None:
+        DB_SNAPSHOT.record(report.nodeid, report.start, report.stop)
+
+
+#### HTTP LOGGING ####
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_runtest_setup(item):
+    """
+    Очистка буфера HTTP-логов перед каждым тестом (режим CINESCOPE_HTTP_LOG_MODE=on_failure).
+    """
+    FAILURE_BUFFER.clear()
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_makereport(item, call):
+    """
+    В режиме on_failure curl-логи запросов рендерятся и прикладываются к отчету только для упавших тестов.
+    """
+    outcome = yield
+    report = outcome.get_result()
+    # Результат фазы теста доступен фикстурам (например, для сохранения трассы Playwright только при падении)
+    setattr(item, f"rep_{report.when}", report)
+    if HTTP_LOG_MODE == "on_failure" and report.failed:
+        report.sections.append((f"Captured HTTP log {report.when}", FAILURE_BUFFER.drain()))
+
+
 @pytest.fixture(scope="session")
-def session():
+def session_factory():
+    """
+    Фабрика HTTP-сессий с общим пулом keep-alive соединений на всю сессию тестов.
+    """
+    factory = SessionFactory()
+    yield factory
+    factory.close()
+
+
+@pytest.fixture(scope="session")
+def session(session_factory):
     """
     Фикстура для создания HTTP-сессии.
     """
-    http_session = requests.Session()
+    http_session = session_factory.create_session()
     yield http_session
     http_session.close()
 
@@ -96,22 +369,23 @@ def requester(session):
 
 
 @pytest.fixture(scope="function")
-def user_session():
+def user_session(session_factory):
     """
     Фикстура для создания пользовательской сессии.
+    Каждый ApiManager получает собственную идентичность (AuthContext) и свою HTTP-сессию (cookies не
+    переходят между пользователями) поверх общего пула соединений фабрики.
     """
-    user_pool = []
+    sessions = []
 
     def _create_user_session():
-        session = requests.Session()
-        user_session = ApiManager(session)
-        user_pool.append(user_session)
-        return user_session
+        http_session = session_factory.create_session()
+        sessions.append(http_session)
+        return ApiManager(http_session)
 
     yield _create_user_session
 
-    for user in user_pool:
-        user.close_session()
+    for http_session in sessions:
+        http_session.close()
 
 
 @pytest.fixture(scope="function")
@@ -132,42 +406,56 @@ def super_admin(user_session):
     return super_admin
 
 
-@pytest.fixture(scope="function")
-def common_user(user_session, super_admin, creation_user_data):
+@pytest.fixture(scope="session")
+def user_pool():
     """
-    Фикстура для создания сессии пользователя.
+    Пул заранее созданных пользователей по ролям на всю сессию.
+    Размер пула на роль задается переменной окружения CINESCOPE_USER_POOL_SIZE (по умолчанию 2).
     """
-    new_session = user_session()
-
-    common_user = User(
-        email=creation_user_data.email,
-        password=creation_user_data.password,
-        roles=[Roles.USER.value],
-        api=new_session
+    pool = UserPool(
+        (SuperAdminCreds.USERNAME, SuperAdminCreds.PASSWORD),
+        size=int(os.getenv("CINESCOPE_USER_POOL_SIZE", 2))
     )
-
-    super_admin.api.user_api.create_user(creation_user_data)
-    common_user.api.auth_api.authenticate(common_user.creds)
-    return common_user
+    yield pool
+    pool.shutdown()
 
 
 @pytest.fixture(scope="function")
-def common_admin(user_session, super_admin, creation_user_data):
+def common_user(user_session, user_pool, request):
     """
-    Фикстура для создания сессии админа.
+    Фикстура для создания сессии пользователя из пула.
+    Тесты, изменяющие пользователя, помечаются маркером mutates_user - после них пользователь пересоздается.
     """
-    new_session = user_session()
+    dirty = request.node.get_closest_marker("mutates_user") is not None
+    with user_pool.lease(Roles.USER, dirty=dirty) as pooled_user:
+        common_user = User(
+            email=pooled_user.email,
+            password=pooled_user.password,
+            roles=[Roles.USER.value],
+            api=user_session()
+        )
+
+        common_user.api.auth_api.authenticate(common_user.creds)
+        yield common_user
 
-    common_admin = User(
-        email=creation_user_data.email,
-        password=creation_user_data.password,
-        roles=list(Roles.ADMIN.value),
-        api=new_session
-    )
 
-    super_admin.api.user_api.create_user(creation_user_data)
-    common_admin.api.auth_api.authenticate(common_admin.creds)
-    return common_admin
+@pytest.fixture(scope="function")
+def common_admin(user_session, user_pool, request):
+    """
+    Фикстура для создания сессии админа из пула.
+    Тесты, изменяющие пользователя, помечаются маркером mutates_user - после них пользователь пересоздается.
+    """
+    dirty = request.node.get_closest_marker("mutates_user") is not None
+    with user_pool.lease(Roles.ADMIN, dirty=dirty) as pooled_user:
+        common_admin = User(
+            email=pooled_user.email,
+            password=pooled_user.password,
+            roles=[Roles.ADMIN.value],
+            api=user_session()
+        )
+
+        common_admin.api.auth_api.authenticate(common_admin.creds)
+        yield common_admin
 
 
 @pytest.fixture(scope="function")
@@ -199,25 +487,52 @@ def test_user() -> UserData:
 
 #### UI ####
 
+# on - трасса Playwright сохраняется для каждого теста, on_failure - только для упавших, off - трассировка выключена
+UI_TRACE_MODE = os.getenv("CINESCOPE_UI_TRACE", "on_failure")
+
+
+def _ui_profile(request):
+    marker = request.node.get_closest_marker("ui_profile")
+    return marker.args[0] if marker else None
+
+def _start_tracing(context):
+    if UI_TRACE_MODE != "off":
+        context.tracing.start(screenshots=True, snapshots=True, sources=True)  # Трассировка для отладки
 
-DEFAULT_UI_TIMEOUT = 30000
+def _stop_tracing(context, request):
+    if UI_TRACE_MODE == "off":
+        return
+    failed = any(getattr(getattr(request.node, f"rep_{when}", None), "failed", False) for when in ("setup", "call"))
+    if UI_TRACE_MODE == "on" or failed:
+        log_name = f"trace_{Tools.get_timestamp()}.zip"
+        context.tracing.stop(path=Tools.files_dir('playwright_trace', log_name))
+    else:
+        context.tracing.stop()
 
-@pytest.fixture(scope="session")  # Браузер запускается один раз для всей сессии
-def browser(playwright):
-    browser = playwright.chromium.launch(headless=False)  # headless=True для CI/CD, headless=False для локальной разработки
-    yield browser  # yield возвращает значение фикстуры, выполнение теста продолжится после yield
-    browser.close()  # Браузер закрывается после завершения всех тестов
+@pytest.fixture(scope="session")  # Пул браузеров запускается один раз на xdist-воркер
+def browser_pool(playwright):
+    """
+    Пул headless-браузеров воркера с теплыми контекстами (настройки - переменные CINESCOPE_* в tools/browser_pool.py).
+    """
+    pool = BrowserPool(playwright)
+    yield pool
+    pool.close()  # Контексты и браузеры закрываются после завершения всех тестов
 
-@pytest.fixture(scope="function")  # Контекст создается для каждого теста
-def context(browser):
-    context = browser.new_context()
-    context.tracing.start(screenshots=True, snapshots=True, sources=True)  # Трассировка для отладки
-    context.set_default_timeout(DEFAULT_UI_TIMEOUT)  # Установка таймаута по умолчанию
+@pytest.fixture(scope="session")
+def browser(browser_pool):
+    return browser_pool.browser()
+
+@pytest.fixture(scope="function")  # Контекст выдается из пула на каждый тест
+def context(browser_pool, request):
+    """
+    Контекст из теплого пула с блокировкой ресурсов профиля (маркер ui_profile, по умолчанию CINESCOPE_UI_PROFILE).
+    После теста контекст очищается и возвращается в пул.
+    """
+    context = browser_pool.acquire(_ui_profile(request))
+    _start_tracing(context)
     yield context  # yield возвращает значение фикстуры, выполнение теста продолжится после yield
-    log_name = f"trace_{Tools.get_timestamp()}.zip"
-    trace_path = Tools.files_dir('playwright_trace', log_name)
-    context.tracing.stop(path=trace_path)
-    context.close()  # Контекст закрывается после завершения теста
+    _stop_tracing(context, request)
+    browser_pool.release(context)
 
 @pytest.fixture(scope="function")  # Страница создается для каждого теста
 def page(context):
@@ -225,6 +540,48 @@ def page(context):
     yield page  # yield возвращает значение фикстуры, выполнение теста продолжится после yield
     page.close()  # Страница закрывается после завершения теста
 
+@pytest.fixture(scope="session")
+def storage_state_cache():
+    """
+    Кэш авторизованного состояния браузера пользователей (files/storage_state).
+    Устаревшие файлы прошлых прогонов удаляются при старте, файлы этой сессии - в ее конце.
+    """
+    cache = StorageStateCache()
+    cache.prune()
+    yield cache
+    cache.clear()
+
+@pytest.fixture(scope="function")
+def authenticated_context(browser_pool, storage_state_cache, request):
+    """
+    Фабрика уже авторизованных контекстов: пользователь входит один раз за время жизни состояния,
+    дальше контексты создаются из сохраненных cookies и localStorage без прохождения страницы логина.
+    Такие контексты не переиспользуются - состояние задается при создании.
+    """
+    contexts = []
+
+    def _authenticated_context(user):
+        storage_state = storage_state_cache.get(browser_pool.browser(), user.email, user.password)
+        context = browser_pool.new_context(_ui_profile(request), storage_state=storage_state)
+        _start_tracing(context)
+        contexts.append(context)
+        return context
+
+    yield _authenticated_context
+
+    for context in contexts:
+        _stop_tracing(context, request)
+        context.close()
+
+@pytest.fixture(scope="function")
+def user_page(common_user, authenticated_context):
+    """
+    Страница, открытая под авторизованным пользователем из пула.
+    """
+    page = authenticated_context(common_user).new_page()
+    yield page
+    page.close()
+
 #### MOVIES ####
 
 @pytest.fixture(scope="function")
@@ -235,7 +592,7 @@ def test_movie_data():
     data = DataGenerator.generate_random_movie()
 
     return MoviesData(
-        name = data["name"],
+        name = WorkerNamespace.name(data["name"]),
         imageUrl = "https://encrypted-tbn0.gstatic.com/images?q=tbn:ANd9G",
         price = data["price"],
         description = data["description"],
@@ -253,7 +610,7 @@ def test_movie_for_update_data():
     data = DataGenerator.generate_random_movie()
 
     return MoviesData(
-        name = data["name"],
+        name = WorkerNamespace.name(data["name"]),
         imageUrl = "https://encrypted-tbn0.gstatic.com/images?q=tbn:ANd9G",
         price = data["price"],
         description = data["description"],
@@ -272,7 +629,7 @@ def test_movie_min_data_item():
     data = DataGenerator.generate_random_movie()
 
     return MoviesData(
-        name = data["name"],
+        name = WorkerNamespace.name(data["name"]),
         price = data["price"],
         description = data["description"],
         location = data["location"],
@@ -293,8 +650,37 @@ def test_movie_negative_data():
     }
 
 
+@pytest.fixture(scope="session")
+def movie_provisioner():
+    """
+    Сервис подготовки фильмов на всю сессию.
+    По окончании сессии удаляет все фильмы из реестра, которые не были удалены фикстурами.
+    """
+    provisioner = MovieProvisioner((SuperAdminCreds.USERNAME, SuperAdminCreds.PASSWORD))
+    yield provisioner
+    provisioner.cleanup()
+
+
+@pytest.fixture(scope="function")
+def provision_movies(movie_provisioner):
+    """
+    Фабрика для конкурентного создания N фильмов в тесте.
+    Все созданные фильмы удаляются одним батчем после теста, даже если тест упал.
+    """
+    created_ids = []
+
+    def _provision_movies(count=1, template=None, **overrides):
+        movies = movie_provisioner.create(count, template=template, **overrides)
+        created_ids.extend(movie.id for movie in movies)
+        return movies
+
+    yield _provision_movies
+
+    movie_provisioner.cleanup(created_ids)
+
+
 @pytest.fixture(scope="function")
-def create_movie_for_tests(api_manager, test_movie_data, super_admin):
+def create_movie_for_tests(api_manager, test_movie_data, super_admin, movie_provisioner):
     """
     Создание фильма для последующих тестов с авторизацией суперюзера.
     """
@@ -302,19 +688,23 @@ def create_movie_for_tests(api_manager, test_movie_data, super_admin):
     response = super_admin.api.movies_api.create_movie(test_movie_data)
 
     movie = response.json()
+    movie_provisioner.register(movie["id"])
     yield movie
 
     # Удаляем фильм после тестов
-    super_admin.api.movies_api.delete_movie(movie["id"])
+    movie_provisioner.cleanup([movie["id"]])
 
 
 @pytest.fixture(scope="function")
-def create_movie_for_delete_test(api_manager, test_movie_data, super_admin):
+def create_movie_for_delete_test(api_manager, test_movie_data, super_admin, movie_provisioner):
     """
     Создание фильма для DELETE тестов с авторизацией суперюзера.
+    Если тест упал до удаления фильма, он удаляется после теста.
     """
     # Создаем фильм с использованием авторизованной сессии
-    response = super_admin.api.movies_api.create_movie(test_movie_data)
-    movie = MoviesDataResponse(**response.json())
+    movie = super_admin.api.movies_api.create_movie_model(test_movie_data)
+    movie_provisioner.register(movie.id)
+
+    yield movie
 
-    yield movie
\ No newline at end of file
+    movie_provisioner.cleanup([movie.id])
@@ -2,8 +2,27 @@ import os
 
 from dotenv import load_dotenv
 
-USER_URL = "https://auth.dev-cinescope.coconutqa.ru"
-MOVIES_URL = "https://api.dev-cinescope.coconutqa.ru"
+load_dotenv()
+
+# remote - удаленный dev-стенд, local - локальный стаб stub_server (см. stub_server/server.py)
+CINESCOPE_TARGET = os.getenv("CINESCOPE_TARGET", "remote")
+STUB_HOST = "127.0.0.1"
+# Каждый xdist-воркер поднимает свой стаб на порту STUB_BASE_PORT + номер воркера + 1
+STUB_BASE_PORT = int(os.getenv("CINESCOPE_STUB_PORT", 8899))
+STUB_PORT = STUB_BASE_PORT + (
+    int(os.environ["PYTEST_XDIST_WORKER"][2:]) + 1 if os.getenv("PYTEST_XDIST_WORKER") else 0
+)
+STUB_URL = f"http://{STUB_HOST}:{STUB_PORT}"
+STUB_SUPER_ADMIN_EMAIL = "super_admin@cinescope.local"
+STUB_SUPER_ADMIN_PASSWORD = "SuperAdmin123"
+
+if CINESCOPE_TARGET == "local":
+    USER_URL = STUB_URL
+    MOVIES_URL = STUB_URL
+else:
+    USER_URL = "https://auth.dev-cinescope.coconutqa.ru"
+    MOVIES_URL = "https://api.dev-cinescope.coconutqa.ru"
+
 UI_MOVIES_URL = "https://dev-cinescope.coconutqa.ru"
 UI_HOME_PAGE_URL = "https://dev-cinescope.coconutqa.ru/"
 HEADERS = {"Content-Type": "application/json", "Accept": "application/json"}
@@ -12,6 +31,7 @@ HEADERS = {"Content-Type": "application/json", "Accept": "application/json"}
 LOGIN_ENDPOINT = "/login"
 REGISTER_ENDPOINT = "/register"
 ALL_MOVIES_ENDPOINT = "/movies"
+PROFILE_ENDPOINT = "/profile"
 
 
 INVALID_MOVIE_ID = 99999
@@ -21,10 +41,13 @@ RED = '\033[31m'
 RESET = '\033[0m'
 
 
-load_dotenv()
 DB_USERNAME = os.getenv("USERNAME")
 DB_PASSWORD = os.getenv("PASSWORD")
 DB_HOST = os.getenv("HOST")
 DB_PORT = os.getenv("PORT")
 DATABASE_NAME = os.getenv("DATABASE_NAME")
-PG_URL = f"postgresql+psycopg2://{DB_USERNAME}:{DB_PASSWORD}@{DB_HOST}:{DB_PORT}/{DATABASE_NAME}"
\ No newline at end of file
+# None, если параметры базы не заданы (нет .env) - тогда DB-тесты пропускаются, а не ломают сбор тестов
+PG_URL = (
+    f"postgresql+psycopg2://{DB_USERNAME}:{DB_PASSWORD}@{DB_HOST}:{DB_PORT}/{DATABASE_NAME}"
+    if DB_HOST and DB_PORT and DATABASE_NAME else None
+)
@@ -0,0 +1,240 @@
+import asyncio
+import datetime
+import json
+import time
+
+import aiohttp
+
+from custom_requester.custom_requester import CustomRequester
+from custom_requester.json_body import encode_json
+from custom_requester.metrics import METRICS
+from custom_requester.resilience import CircuitOpenError
+
+
+def _timing_trace_config():
+    """
+    TraceConfig aiohttp, сохраняющий длительности DNS-резолва и установки соединения
+    в словарь, переданный через trace_request_ctx.
+    """
+    trace_config = aiohttp.TraceConfig()
+
+    def _mark(name):
+        async def _handler(session, context, params):
+            if isinstance(context.trace_request_ctx, dict):
+                context.trace_request_ctx[name] = time.perf_counter()
+        return _handler
+
+    trace_config.on_dns_resolvehost_start.append(_mark("dns_start"))
+    trace_config.on_dns_resolvehost_end.append(_mark("dns_end"))
+    trace_config.on_connection_create_start.append(_mark("connect_start"))
+    trace_config.on_connection_create_end.append(_mark("connect_end"))
+    return trace_config
+
+
+def _phase(timings, start, end):
+    if start in timings and end in timings:
+        return timings[end] - timings[start]
+    return None
+
+
+class AsyncRequestInfo:
+    """
+    Описание отправленного запроса в форме requests.PreparedRequest (method, url, headers, body).
+    """
+
+    def __init__(self, method, url, headers, body):
+        self.method = method
+        self.url = url
+        self.headers = headers
+        self.body = body
+
+
+class AsyncResponse:
+    """
+    Прочитанный ответ aiohttp с интерфейсом, совместимым с requests.Response
+    (status_code, ok, text, content, json(), request, elapsed).
+    """
+
+    def __init__(self, request, status, headers, content, elapsed):
+        self.request = request
+        self.status_code = status
+        self.headers = headers
+        self.content = content
+        self.elapsed = datetime.timedelta(seconds=elapsed)
+
+    @property
+    def ok(self):
+        return self.status_code < 400
+
+    @property
+    def text(self):
+        return self.content.decode("utf-8", errors="replace")
+
+    def json(self):
+        return json.loads(self.content)
+
+
+class AsyncCustomRequester(CustomRequester):
+    """
+    Асинхронный двойник CustomRequester поверх aiohttp.ClientSession.
+    Семантика expected_status и pydantic-тел запросов совпадает с синхронной версией.
+    """
+
+    @staticmethod
+    def create_session(limit=100, limit_per_host=0):
+        """
+        Создание aiohttp-сессии с ограниченным пулом соединений.
+        Должна вызываться внутри работающего event loop.
+        :param limit: Максимальное число одновременно открытых соединений.
+        :param limit_per_host: Ограничение соединений на один хост (0 - без ограничения).
+        """
+        connector = aiohttp.TCPConnector(limit=limit, limit_per_host=limit_per_host)
+        return aiohttp.ClientSession(connector=connector, trace_configs=[_timing_trace_config()])
+
+    async def send_request(self, method, endpoint, data=None, params=None, expected_status=200, need_logging=True,
+                           policy=None, authorized=True):
+        """
+        Универсальный асинхронный метод для отправки запросов.
+        :param method: HTTP метод (GET, POST, PUT, DELETE и т.д.).
+        :param endpoint: Эндпоинт (например, "/login").
+        :param data: Тело запроса: pydantic-модель, JSON-данные, JsonBody или готовые JSON-байты.
+        :param params: Query-параметры.
+        :param expected_status: Ожидаемые статус-код или коллекция допустимых статус-кодов (по умолчанию 200).
+        :param need_logging: Флаг для логирования (по умолчанию True).
+        :param policy: ResiliencePolicy для этого запроса (по умолчанию self.resilience_policy).
+        :param authorized: Подставлять ли токен self.auth (False - анонимный запрос, например логин).
+        :return: Объект ответа AsyncResponse.
+        """
+
+        url = f"{self.base_url}{endpoint}"
+        data = encode_json(data)
+        policy = policy or self.resilience_policy
+        token = self.auth.token if authorized else None
+        response = await self._send_with_policy(method, endpoint, url, data, params, token, expected_status,
+                                                need_logging, policy)
+        if self._needs_reauth(response, token, expected_status) and await self.auth.refresh_async(token):
+            if need_logging:
+                self.log_request_and_response(response)
+            response = await self._send_with_policy(method, endpoint, url, data, params, self.auth.token,
+                                                    expected_status, need_logging, policy)
+
+        if need_logging:
+            self.log_request_and_response(response)
+        if not self.is_expected_status(response.status_code, expected_status):
+            raise ValueError(f"Unexpected status code: {response.status_code}. Expected: {expected_status}")
+        return response
+
+    async def _send_with_policy(self, method, endpoint, url, data, params, token, expected_status, need_logging,
+                                policy):
+        """
+        Отправка запроса с повторами и circuit breaker политики устойчивости.
+        """
+        headers = {**self.headers, **self.auth.authorization(token)}
+        breaker = policy.breaker(url)
+        started = time.monotonic()
+        attempt = 0
+        while True:
+            attempt += 1
+            if breaker is not None and not breaker.allow():
+                raise CircuitOpenError(f"Circuit breaker is open for {url}")
+            try:
+                response = await self._send_once(method, endpoint, url, data, params, headers)
+            except (aiohttp.ClientConnectionError, asyncio.TimeoutError):
+                if breaker is not None:
+                    breaker.record_failure()
+                delay = policy.next_delay(method, attempt, started)
+                if delay is None:
+                    raise
+            except asyncio.CancelledError:
+                if breaker is not None:
+                    breaker.release_probe()
+                raise
+            except Exception:
+                # Прочие ошибки отправки без повтора, но тоже отказ: иначе пробный запрос half-open
+                # оставит breaker разомкнутым навсегда
+                if breaker is not None:
+                    breaker.record_failure()
+                raise
+            else:
+                failed = policy.is_failure_status(response.status_code, expected_status)
+                if breaker is not None and failed:
+                    breaker.record_failure()
+                elif breaker is not None:
+                    breaker.record_success()
+                delay = policy.next_delay(method, attempt, started) if failed else None
+                if delay is None:
+                    return response
+                if need_logging:
+                    self.log_request_and_response(response)
+            METRICS.record_retry(method, endpoint)
+            await asyncio.sleep(delay)
+
+    async def _send_once(self, method, endpoint, url, data, params, headers):
+        """
+        Одна попытка отправки запроса с записью замеров в METRICS.
+        """
+        timings = {}
+        started = time.perf_counter()
+        try:
+            async with self.session.request(
+                method=method,
+                url=url,
+                data=data,
+                params=params,
+                headers=headers,
+                trace_request_ctx=timings
+            ) as raw_response:
+                ttfb = time.perf_counter() - started
+                content = await raw_response.read()
+        except Exception:
+            METRICS.record(method, endpoint, "exception", total=time.perf_counter() - started)
+            raise
+        METRICS.record(
+            method,
+            endpoint,
+            raw_response.status,
+            dns=_phase(timings, "dns_start", "dns_end"),
+            connect=_phase(timings, "connect_start", "connect_end"),
+            ttfb=ttfb,
+            total=time.perf_counter() - started
+        )
+
+        return AsyncResponse(
+            request=AsyncRequestInfo(
+                method=method,
+                url=str(raw_response.url),
+                headers=dict(raw_response.request_info.headers),
+                body=data
+            ),
+            status=raw_response.status,
+            headers=raw_response.headers,
+            content=content,
+            elapsed=ttfb
+        )
+
+    @staticmethod
+    async def parse_model(response, model, trusted=False):
+        """
+        Асинхронный вариант CustomRequester.parse_model: response - корутина send_request,
+        поэтому унаследованные *_model методы API-классов тоже возвращают корутины.
+        """
+        return CustomRequester.parse_model(await response, model, trusted)
+
+    @staticmethod
+    async def gather(*coroutines, concurrency=None, return_exceptions=False):
+        """
+        Конкурентный запуск запросов с необязательным ограничением параллелизма.
+        :param coroutines: Корутины запросов.
+        :param concurrency: Максимум одновременно выполняемых корутин (None - без ограничения).
+        :param return_exceptions: Возвращать исключения вместо их проброса.
+        """
+        if concurrency is None:
+            return await asyncio.gather(*coroutines, return_exceptions=return_exceptions)
+
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def _limited(coroutine):
+            async with semaphore:
+                return await coroutine
+
+        return await asyncio.gather(*(_limited(c) for c in coroutines), return_exceptions=return_exceptions)
@@ -0,0 +1,77 @@
+import asyncio
+import threading
+
+
+class AuthContext:
+    """
+    Идентичность, от имени которой отправляются запросы.
+    Токен подставляется в заголовок Authorization каждого запроса, а не в общую сессию,
+    поэтому несколько идентичностей (super_admin, common_user, common_admin, виртуальные пользователи
+    нагрузочного прогона) могут работать поверх одной сессии и одного пула соединений.
+    """
+
+    def __init__(self, token=None, refresher=None):
+        """
+        :param token: accessToken (None - анонимные запросы).
+        :param refresher: Функция (или корутина для асинхронных реквестеров) без аргументов,
+                          возвращающая новый токен после ответа 401.
+        """
+        self.token = token
+        self._refresher = refresher
+        self._lock = threading.Lock()
+        self._pending = None
+
+    def set_token(self, token, refresher=None):
+        self.token = token
+        self._refresher = refresher
+
+    def clear(self):
+        self.token = None
+        self._refresher = None
+
+    @staticmethod
+    def authorization(token):
+        """
+        Заголовки авторизации запроса с токеном token (пустой словарь для анонимного запроса).
+        """
+        return {"Authorization": f"Bearer {token}"} if token else {}
+
+    def can_refresh(self, used_token):
+        """
+        Можно ли переавторизоваться после 401 на запрос, отправленный с used_token.
+        """
+        return used_token is not None and self._refresher is not None
+
+    def refresh(self, used_token):
+        """
+        Получение нового токена после 401 на запрос с used_token.
+        Если токен уже обновлен другим потоком, повторный логин не выполняется.
+        :return: True, если запрос можно повторить с текущим токеном.
+        """
+        with self._lock:
+            if used_token != self.token:
+                return self.token is not None
+            try:
+                self.token = self._refresher()
+            except (KeyError, ValueError):
+                return False
+            return True
+
+    async def refresh_async(self, used_token):
+        """
+        Асинхронный вариант refresh: конкурентные корутины, получившие 401, ожидают один общий логин.
+        """
+        if used_token != self.token:
+            return self.token is not None
+        if self._pending is None:
+            self._pending = asyncio.ensure_future(self._refresher())
+        pending = self._pending
+        try:
+            token = await pending
+        except (KeyError, ValueError):
+            return False
+        finally:
+            if self._pending is pending:
+                self._pending = None
+        self.token = token
+        return True
@@ -1,10 +1,15 @@
-import json
 import logging
-import os
+import time
+from contextlib import contextmanager
 
-from pydantic import BaseModel
+import requests
 
-from constants.constants import GREEN, RESET, RED
+from custom_requester.auth_context import AuthContext
+from custom_requester.http_logging import CurlMessage, configure_http_logger, current_test_name
+from custom_requester.json_body import encode_json
+from custom_requester.metrics import METRICS
+from custom_requester.resilience import DEFAULT_POLICY, CircuitOpenError
+from models.parsing import parse_json
 
 
 class CustomRequester:
@@ -15,84 +20,176 @@ class CustomRequester:
         "Content-Type": "application/json",
         "Accept": "application/json"
     }
+    # Политика повторов и circuit breaker; переопределяется в API-классе, экземпляре или через using_policy
+    resilience_policy = DEFAULT_POLICY
 
-    def __init__(self, session, base_url):
+    def __init__(self, session, base_url, auth=None):
+        """
+        :param session: HTTP-сессия (транспорт), может быть общей для нескольких идентичностей.
+        :param base_url: Базовый URL сервиса.
+        :param auth: AuthContext идентичности, от имени которой отправляются запросы.
+        """
         self.base_url = base_url
         self.session = session
+        self.auth = auth if auth is not None else AuthContext()
         self.headers = self.base_headers.copy()
-        self.logger = logging.getLogger(__name__)
-        self.logger.setLevel(logging.INFO)
+        self.logger = configure_http_logger(logging.getLogger(__name__))
 
-    def send_request(self, method, endpoint, data=None, params=None, expected_status=200, need_logging=True):
+    def send_request(self, method, endpoint, data=None, params=None, expected_status=200, need_logging=True,
+                     policy=None, authorized=True):
         """
         Универсальный метод для отправки запросов.
         :param method: HTTP метод (GET, POST, PUT, DELETE и т.д.).
         :param endpoint: Эндпоинт (например, "/login").
-        :param data: Тело запроса (JSON-данные).
+        :param data: Тело запроса: pydantic-модель, JSON-данные, JsonBody или готовые JSON-байты.
         :param params: Query-параметры.
-        :param expected_status: Ожидаемые статус-код (по умолчанию 200).
+        :param expected_status: Ожидаемые статус-код или коллекция допустимых статус-кодов (по умолчанию 200).
         :param need_logging: Флаг для логирования (по умолчанию True).
+        :param policy: ResiliencePolicy для этого запроса (по умолчанию self.resilience_policy).
+        :param authorized: Подставлять ли токен self.auth (False - анонимный запрос, например логин).
         :return: Объект ответа requests.Response.
         """
 
         url = f"{self.base_url}{endpoint}"
-        if isinstance(data, BaseModel):
-            data = json.loads(data.model_dump_json(exclude_unset=True))
-        response = self.session.request(
-            method=method,
-            url=url,
-            json=data,
-            params=params,
-            headers=self.headers
-        )
+        data = encode_json(data)
+        policy = policy or self.resilience_policy
+        token = self.auth.token if authorized else None
+        response = self._send_with_policy(method, endpoint, url, data, params, token, expected_status,
+                                          need_logging, policy)
+        if self._needs_reauth(response, token, expected_status) and self.auth.refresh(token):
+            if need_logging:
+                self.log_request_and_response(response)
+            response = self._send_with_policy(method, endpoint, url, data, params, self.auth.token,
+                                              expected_status, need_logging, policy)
 
         if need_logging:
             self.log_request_and_response(response)
-        if response.status_code != expected_status:
+        if not self.is_expected_status(response.status_code, expected_status):
             raise ValueError(f"Unexpected status code: {response.status_code}. Expected: {expected_status}")
         return response
 
-    def _update_session_headers(self, **kwargs):
+    def _send_with_policy(self, method, endpoint, url, data, params, token, expected_status, need_logging, policy):
         """
-        Обновление заголовков сессии.
-        :param kwargs: Дополнительные заголовки.
+        Отправка запроса с повторами и circuit breaker политики устойчивости.
         """
-        self.headers.update(kwargs)
-        self.session.headers.update(self.headers)
+        headers = {**self.headers, **self.auth.authorization(token)}
+        breaker = policy.breaker(url)
+        started = time.monotonic()
+        attempt = 0
+        while True:
+            attempt += 1
+            if breaker is not None and not breaker.allow():
+                raise CircuitOpenError(f"Circuit breaker is open for {url}")
+            try:
+                response = self._send_once(method, endpoint, url, data, params, headers)
+            except (requests.ConnectionError, requests.Timeout):
+                if breaker is not None:
+                    breaker.record_failure()
+                delay = policy.next_delay(method, attempt, started)
+                if delay is None:
+                    raise
+            except Exception:
+                # Прочие ошибки отправки (ChunkedEncodingError, ошибки декодирования) без повтора,
+                # но тоже отказ: иначе пробный запрос half-open оставит breaker разомкнутым навсегда
+                if breaker is not None:
+                    breaker.record_failure()
+                raise
+            else:
+                failed = policy.is_failure_status(response.status_code, expected_status)
+                if breaker is not None and failed:
+                    breaker.record_failure()
+                elif breaker is not None:
+                    breaker.record_success()
+                delay = policy.next_delay(method, attempt, started) if failed else None
+                if delay is None:
+                    return response
+                if need_logging:
+                    self.log_request_and_response(response)
+            METRICS.record_retry(method, endpoint)
+            time.sleep(delay)
 
-    def log_request_and_response(self, response):
+    def _needs_reauth(self, response, token, expected_status):
         """
-        Логгирование запросов и ответов. Настройки логгирования описаны в pytest.ini
-        Преобразует вывод в curl-like (-H хэдэеры), (-d тело)
+        Ответ 401 на запрос с токеном идентичности, если тест не ожидает 401, требует переавторизации.
+        """
+        return (
+            response.status_code == 401
+            and not self.is_expected_status(401, expected_status)
+            and self.auth.can_refresh(token)
+        )
 
-        :param response: Объект response получаемый из метода "send_request"
+    def _send_once(self, method, endpoint, url, data, params, headers):
+        """
+        Одна попытка отправки запроса с записью замеров в METRICS.
         """
+        started = time.perf_counter()
         try:
-            request = response.request
-            headers = " \\\n".join([f"-H '{header}: {value}'" for header, value in request.headers.items()])
-            full_test_name = f"pytest {os.environ.get('PYTEST_CURRENT_TEST', '').replace(' (call)', '')}"
-
-            body = ""
-            if hasattr(request, 'body') and request.body is not None:
-                if isinstance(request.body, bytes):
-                    body = request.body.decode('utf-8')
-                elif isinstance(request.body, str):
-                    body = request.body
-                body = f"-d '{body}' \n" if body != '{}' else ''
-
-            self.logger.info(
-                f"{GREEN}{full_test_name}{RESET}\n"
-                f"curl -X {request.method} '{request.url}' \\\n"
-                f"{headers} \\\n"
-                f"{body}"
+            response = self.session.request(
+                method=method,
+                url=url,
+                data=data,
+                params=params,
+                headers=headers
             )
+        except Exception:
+            METRICS.record(method, endpoint, "exception", total=time.perf_counter() - started)
+            raise
+        METRICS.record(
+            method,
+            endpoint,
+            response.status_code,
+            ttfb=response.elapsed.total_seconds(),
+            total=time.perf_counter() - started
+        )
+        return response
+
+    @staticmethod
+    def parse_model(response, model, trusted=False):
+        """
+        Разбор тела ответа напрямую из байтов в модель через закэшированный TypeAdapter.
+        :param response: Ответ send_request.
+        :param model: Класс pydantic-модели или тип (например, list[MoviesDataResponse]).
+        :param trusted: Создать модель без валидации (model_construct).
+        """
+        return parse_json(response.content, model, trusted)
 
-            response_status = response.status_code
-            is_success = response.ok
-            response_data = response.text
-            if not is_success:
-                self.logger.info(f"\tRESPONSE:"
-                                 f"\nSTATUS_CODE: {RED}{response_status}{RESET}"
-                                 f"\nDATA: {RED}{response_data}{RESET}")
-        except Exception as e:
-            self.logger.info(f"\nLogging went wrong: {type(e)} - {e}")
+    @contextmanager
+    def using_policy(self, policy):
+        """
+        Временная замена политики устойчивости для запросов внутри блока with.
+        :param policy: Объект ResiliencePolicy (например, NO_RETRY_POLICY).
+        """
+        previous = self.resilience_policy
+        self.resilience_policy = policy
+        try:
+            yield self
+        finally:
+            self.resilience_policy = previous
+
+    @staticmethod
+    def is_expected_status(status_code, expected_status):
+        """
+        Проверка статус-кода ответа.
+        :param expected_status: Ожидаемый статус-код или коллекция допустимых статус-кодов.
+        """
+        if isinstance(expected_status, int):
+            return status_code == expected_status
+        return status_code in expected_status
+
+    def log_request_and_response(self, response):
+        """
+        Логгирование запросов и ответов. Настройки логгирования описаны в pytest.ini
+        и в переменных окружения CINESCOPE_HTTP_LOG_* (см. custom_requester/http_logging.py).
+        Преобразует вывод в curl-like (-H хэдэеры), (-d тело). Строка собирается лениво,
+        только если запись действительно выводится хэндлером.
+
+        :param response: Объект response получаемый из метода "send_request"
+        """
+        if not self.logger.isEnabledFor(logging.INFO):
+            return
+        test_name = current_test_name()
+        self.logger.info(
+            "%s",
+            CurlMessage(response, test_name),
+            extra={"http_response": response, "http_test": test_name}
+        )
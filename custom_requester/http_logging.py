@@ -0,0 +1,155 @@
+import json
+import logging
+import os
+import threading
+import time
+
+from constants.constants import GREEN, RESET, RED
+
+# live - обычное логирование (по умолчанию), on_failure - буфер, выводимый только для упавших тестов, off - выключено
+HTTP_LOG_MODE = os.getenv("CINESCOPE_HTTP_LOG_MODE", "live")
+# Максимальное количество байт тела запроса/ответа, попадающее в лог
+HTTP_LOG_BODY_LIMIT = int(os.getenv("CINESCOPE_HTTP_LOG_BODY_LIMIT", 2048))
+# Путь к файлу JSON-lines со структурированным логом запросов (по умолчанию выключен)
+HTTP_LOG_JSONL = os.getenv("CINESCOPE_HTTP_LOG_JSONL")
+
+
+def truncate(content, limit=HTTP_LOG_BODY_LIMIT):
+    """
+    Декодирование тела не более чем из limit байт с пометкой об обрезке.
+    :param content: bytes или str.
+    :param limit: Максимальное количество байт (0 - без ограничения).
+    """
+    if content is None:
+        return ""
+    if isinstance(content, str):
+        content = content.encode("utf-8")
+    if limit and len(content) > limit:
+        return content[:limit].decode("utf-8", errors="replace") + f"... [truncated {len(content) - limit} bytes]"
+    return content.decode("utf-8", errors="replace")
+
+
+def current_test_name():
+    return f"pytest {os.environ.get('PYTEST_CURRENT_TEST', '').replace(' (call)', '')}"
+
+
+class CurlMessage:
+    """
+    Ленивое curl-like представление запроса и ответа.
+    Строка собирается только в момент форматирования записи лога хэндлером.
+    """
+
+    def __init__(self, response, test_name=None, body_limit=HTTP_LOG_BODY_LIMIT):
+        self.response = response
+        self.test_name = test_name or current_test_name()
+        self.body_limit = body_limit
+
+    def __str__(self):
+        request = self.response.request
+        headers = " \\\n".join([f"-H '{header}: {value}'" for header, value in request.headers.items()])
+
+        body = ""
+        if getattr(request, "body", None) is not None:
+            body = truncate(request.body, self.body_limit)
+            body = f"-d '{body}' \n" if body != '{}' else ''
+
+        message = (
+            f"{GREEN}{self.test_name}{RESET}\n"
+            f"curl -X {request.method} '{request.url}' \\\n"
+            f"{headers} \\\n"
+            f"{body}"
+        )
+        if not self.response.ok:
+            message += (f"\tRESPONSE:"
+                        f"\nSTATUS_CODE: {RED}{self.response.status_code}{RESET}"
+                        f"\nDATA: {RED}{truncate(self.response.content, self.body_limit)}{RESET}")
+        return message
+
+
+class JsonLinesHandler(logging.Handler):
+    """
+    Структурированный sink: каждая запись с атрибутом http_response пишется в файл одной JSON-строкой.
+    """
+
+    def __init__(self, path, body_limit=HTTP_LOG_BODY_LIMIT):
+        super().__init__()
+        self.path = path
+        self.body_limit = body_limit
+        self._file = open(path, "a", encoding="utf-8")
+
+    def emit(self, record):
+        response = getattr(record, "http_response", None)
+        if response is None:
+            return
+        try:
+            request = response.request
+            entry = {
+                "ts": time.strftime("%Y-%m-%dT%H:%M:%S", time.localtime(record.created)),
+                "test": getattr(record, "http_test", None),
+                "method": request.method,
+                "url": request.url,
+                "status": response.status_code,
+                "elapsed_ms": response.elapsed.total_seconds() * 1000,
+                "request_body": truncate(getattr(request, "body", None), self.body_limit),
+            }
+            if not response.ok:
+                entry["response_body"] = truncate(response.content, self.body_limit)
+            with self.lock:
+                self._file.write(json.dumps(entry, ensure_ascii=False) + "\n")
+                self._file.flush()
+        except Exception:
+            self.handleError(record)
+
+    def close(self):
+        self._file.close()
+        super().close()
+
+
+class FailureBufferHandler(logging.Handler):
+    """
+    Буфер записей текущего теста. Сообщения форматируются только при drain(),
+    который вызывается для упавших тестов; для прошедших буфер просто очищается.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self._records = []
+        self._buffer_lock = threading.Lock()
+
+    def emit(self, record):
+        with self._buffer_lock:
+            self._records.append(record)
+
+    def clear(self):
+        with self._buffer_lock:
+            self._records = []
+
+    def drain(self):
+        with self._buffer_lock:
+            records, self._records = self._records, []
+        return "\n".join(record.getMessage() for record in records)
+
+
+FAILURE_BUFFER = FailureBufferHandler()
+_configured = set()
+
+
+def configure_http_logger(logger):
+    """
+    Однократная настройка логгера реквестера согласно HTTP_LOG_MODE и HTTP_LOG_JSONL.
+    """
+    if logger.name in _configured:
+        return logger
+    _configured.add(logger.name)
+
+    if HTTP_LOG_MODE == "off":
+        logger.setLevel(logging.CRITICAL + 1)
+        return logger
+
+    logger.setLevel(logging.INFO)
+    if HTTP_LOG_MODE == "on_failure":
+        logger.propagate = False
+        logger.addHandler(FAILURE_BUFFER)
+    if HTTP_LOG_JSONL:
+        logger.addHandler(JsonLinesHandler(HTTP_LOG_JSONL))
+    return logger
@@ -0,0 +1,39 @@
+from pydantic import BaseModel
+from pydantic_core import to_json
+
+
+def encode_json(data):
+    """
+    Сериализация тела запроса в JSON-байты за один проход.
+    Pydantic-модели сериализуются через model_dump_json(exclude_unset=True), остальные данные
+    (dict, list, enum, datetime) - через pydantic_core.to_json.
+    :param data: Тело запроса: JsonBody, pydantic-модель, bytes или JSON-совместимые данные.
+    :return: bytes или None, если тела нет.
+    """
+    if data is None:
+        return None
+    if isinstance(data, JsonBody):
+        return data.content
+    if isinstance(data, bytes):
+        return data
+    if isinstance(data, BaseModel):
+        return data.model_dump_json(exclude_unset=True).encode("utf-8")
+    return to_json(data)
+
+
+class JsonBody:
+    """
+    Заранее сериализованное тело запроса.
+    Для повторяющихся payload (один и тот же фильм или пользователь в цикле) тело кодируется
+    один раз и затем отправляется как есть.
+    """
+    __slots__ = ("content",)
+
+    def __init__(self, data):
+        """
+        :param data: Pydantic-модель или JSON-совместимые данные.
+        """
+        self.content = encode_json(data)
+
+    def __repr__(self):
+        return f"JsonBody({self.content!r})"
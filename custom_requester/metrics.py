@@ -0,0 +1,182 @@
+import json
+import re
+import threading
+from collections import defaultdict
+
+# Сегменты пути, которые считаются идентификаторами: числа, UUID, email и сгенерированные test_id_*
+_ID_SEGMENT = re.compile(
+    r"^(\d+|[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}|[^/]+@[^/]+|test_id_\w+)$"
+)
+
+PHASES = ("dns", "connect", "ttfb", "total")
+
+
+def endpoint_template(endpoint):
+    """
+    Преобразует конкретный эндпоинт в шаблон: "/movies/123" -> "/movies/{id}".
+    :param endpoint: Эндпоинт запроса без base_url и query-параметров.
+    """
+    path = endpoint.split("?", 1)[0]
+    return "/".join("{id}" if _ID_SEGMENT.match(segment) else segment for segment in path.split("/"))
+
+
+class LatencyHistogram:
+    """
+    Гистограмма задержек в стиле HDR: значения в микросекундах хранятся в лог-линейных бакетах
+    (128 точных бакетов, далее по 64 бакета на каждую степень двойки, относительная погрешность < 1.6%).
+    """
+    SUB_BUCKET_BITS = 7
+
+    def __init__(self):
+        self.counts = defaultdict(int)
+        self.count = 0
+        self.total = 0
+        self.min = None
+        self.max = 0
+
+    @classmethod
+    def _bucket(cls, value):
+        shift = max(value.bit_length() - cls.SUB_BUCKET_BITS, 0)
+        return (value >> shift) << shift
+
+    def record(self, seconds):
+        value = max(int(seconds * 1_000_000), 0)
+        self.counts[self._bucket(value)] += 1
+        self.count += 1
+        self.total += value
+        self.min = value if self.min is None else min(self.min, value)
+        self.max = max(self.max, value)
+
+    def percentile(self, percent):
+        """
+        Значение перцентиля в микросекундах (нижняя граница бакета).
+        """
+        if not self.count:
+            return 0
+        threshold = percent / 100 * self.count
+        seen = 0
+        for bucket in sorted(self.counts):
+            seen += self.counts[bucket]
+            if seen >= threshold:
+                return bucket
+        return self.max
+
+    def merge(self, other):
+        for bucket, count in other.counts.items():
+            self.counts[bucket] += count
+        self.count += other.count
+        self.total += other.total
+        if other.min is not None:
+            self.min = other.min if self.min is None else min(self.min, other.min)
+        self.max = max(self.max, other.max)
+
+    def to_dict(self):
+        return {
+            "count": self.count,
+            "min_us": self.min or 0,
+            "max_us": self.max,
+            "mean_us": self.total / self.count if self.count else 0,
+            "p50_us": self.percentile(50),
+            "p95_us": self.percentile(95),
+            "p99_us": self.percentile(99),
+            "buckets": {str(bucket): count for bucket, count in sorted(self.counts.items())},
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        histogram = cls()
+        for bucket, count in data["buckets"].items():
+            histogram.counts[int(bucket)] = count
+        histogram.count = data["count"]
+        histogram.total = int(data["mean_us"] * data["count"])
+        histogram.min = data["min_us"] if data["count"] else None
+        histogram.max = data["max_us"]
+        return histogram
+
+
+class RequestMetrics:
+    """
+    Потокобезопасный реестр гистограмм задержек, сгруппированных по (метод, шаблон эндпоинта, статус) и фазе запроса.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._histograms = defaultdict(dict)
+        self._retries = defaultdict(int)
+
+    def record(self, method, endpoint, status, **phases):
+        """
+        Запись замеров одного запроса.
+        :param method: HTTP метод.
+        :param endpoint: Эндпоинт (будет приведен к шаблону).
+        :param status: Статус-код ответа или "exception".
+        :param phases: Длительности фаз в секундах (dns, connect, ttfb, total); None пропускается.
+        """
+        key = (method.upper(), endpoint_template(endpoint), str(status))
+        with self._lock:
+            histograms = self._histograms[key]
+            for phase, seconds in phases.items():
+                if seconds is None:
+                    continue
+                histograms.setdefault(phase, LatencyHistogram()).record(seconds)
+
+    def record_retry(self, method, endpoint):
+        """
+        Учет повторной отправки запроса политикой устойчивости.
+        """
+        with self._lock:
+            self._retries[(method.upper(), endpoint_template(endpoint))] += 1
+
+    def reset(self):
+        with self._lock:
+            self._histograms.clear()
+            self._retries.clear()
+
+    def __bool__(self):
+        return bool(self._histograms)
+
+    def to_dict(self):
+        with self._lock:
+            return {
+                "requests": {
+                    " ".join(key): {phase: histogram.to_dict() for phase, histogram in histograms.items()}
+                    for key, histograms in sorted(self._histograms.items())
+                },
+                "retries": {" ".join(key): count for key, count in sorted(self._retries.items())},
+            }
+
+    def merge_dict(self, data):
+        """
+        Слияние выгрузки to_dict() другого процесса (например, xdist-воркера).
+        """
+        with self._lock:
+            for key, phases in data["requests"].items():
+                histograms = self._histograms[tuple(key.split(" ", 2))]
+                for phase, histogram in phases.items():
+                    histograms.setdefault(phase, LatencyHistogram()).merge(LatencyHistogram.from_dict(histogram))
+            for key, count in data["retries"].items():
+                self._retries[tuple(key.split(" ", 1))] += count
+
+    def dump_json(self, path):
+        with open(path, "w", encoding="utf-8") as file:
+            json.dump(self.to_dict(), file, indent=2, ensure_ascii=False)
+
+    def format_summary(self):
+        lines = [f"{'request':<40}{'status':>8}{'count':>7}{'p50 ms':>9}{'p95 ms':>9}{'p99 ms':>9}{'max ms':>9}"]
+        with self._lock:
+            for (method, template, status), histograms in sorted(self._histograms.items()):
+                total = histograms.get("total")
+                if total is None:
+                    continue
+                lines.append(
+                    f"{method + ' ' + template:<40}{status:>8}{total.count:>7}"
+                    f"{total.percentile(50) / 1000:>9.1f}{total.percentile(95) / 1000:>9.1f}"
+                    f"{total.percentile(99) / 1000:>9.1f}{total.max / 1000:>9.1f}"
+                )
+            for (method, template), count in sorted(self._retries.items()):
+                lines.append(f"retries: {method} {template} - {count}")
+        return "\n".join(lines)
+
+
+# Общий реестр процесса, в который пишут CustomRequester и AsyncCustomRequester
+METRICS = RequestMetrics()
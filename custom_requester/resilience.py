@@ -0,0 +1,152 @@
+import random
+import threading
+import time
+from urllib.parse import urlparse
+
+import requests
+
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+RETRY_STATUSES = frozenset({502, 503, 504})
+
+
+class CircuitOpenError(requests.ConnectionError):
+    """
+    Запрос не отправлен: circuit breaker хоста разомкнут после серии отказов.
+    """
+
+
+class CircuitBreaker:
+    """
+    Circuit breaker одного хоста.
+    После failure_threshold отказов подряд размыкается на reset_timeout секунд, затем пропускает
+    один пробный запрос (half-open): успех замыкает его, отказ снова размыкает.
+    """
+
+    def __init__(self, failure_threshold=10, reset_timeout=30.0):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.failures = 0
+        self.opened_at = None
+        self._probe_in_flight = False
+        self._lock = threading.Lock()
+
+    @property
+    def state(self):
+        if self.opened_at is None:
+            return "closed"
+        if time.monotonic() - self.opened_at >= self.reset_timeout:
+            return "half-open"
+        return "open"
+
+    def allow(self):
+        with self._lock:
+            state = self.state
+            if state == "closed":
+                return True
+            if state == "half-open" and not self._probe_in_flight:
+                self._probe_in_flight = True
+                return True
+            return False
+
+    def record_success(self):
+        with self._lock:
+            self.failures = 0
+            self.opened_at = None
+            self._probe_in_flight = False
+
+    def record_failure(self):
+        with self._lock:
+            self.failures += 1
+            if self._probe_in_flight or self.failures >= self.failure_threshold:
+                self.opened_at = time.monotonic()
+            self._probe_in_flight = False
+
+    def release_probe(self):
+        """
+        Пробный запрос прерван без результата (например, отменен): следующий запрос станет новой пробой.
+        """
+        with self._lock:
+            if self.opened_at is not None:
+                self._probe_in_flight = False
+
+
+class ResiliencePolicy:
+    """
+    Политика устойчивости запросов: повторы с экспоненциальной задержкой и full jitter,
+    circuit breaker на хост и общий дедлайн на все попытки.
+    """
+
+    def __init__(self, attempts=3, backoff_base=0.2, backoff_max=5.0, deadline=30.0,
+                 retry_statuses=RETRY_STATUSES, retry_non_idempotent=False,
+                 failure_threshold=10, reset_timeout=30.0, circuit_breaker=True):
+        """
+        :param attempts: Максимальное количество попыток (1 - без повторов).
+        :param backoff_base: Базовая задержка перед повтором, сек.
+        :param backoff_max: Максимальная задержка перед повтором, сек.
+        :param deadline: Общий бюджет времени на все попытки, сек (None - без ограничения).
+        :param retry_statuses: Статус-коды, после которых запрос повторяется (если они не ожидаются тестом).
+        :param retry_non_idempotent: Повторять ли POST/PATCH.
+        :param failure_threshold: Количество отказов подряд, размыкающее circuit breaker.
+        :param reset_timeout: Время в разомкнутом состоянии до пробного запроса, сек.
+        :param circuit_breaker: Использовать ли circuit breaker.
+        """
+        self.attempts = attempts
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.deadline = deadline
+        self.retry_statuses = frozenset(retry_statuses)
+        self.retry_non_idempotent = retry_non_idempotent
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.circuit_breaker = circuit_breaker
+        self._breakers = {}
+        self._lock = threading.Lock()
+
+    def breaker(self, url):
+        """
+        Circuit breaker хоста, к которому относится url (None, если breaker выключен).
+        """
+        if not self.circuit_breaker:
+            return None
+        host = urlparse(url).netloc
+        with self._lock:
+            if host not in self._breakers:
+                self._breakers[host] = CircuitBreaker(self.failure_threshold, self.reset_timeout)
+            return self._breakers[host]
+
+    def is_retryable_method(self, method):
+        return self.retry_non_idempotent or method.upper() in IDEMPOTENT_METHODS
+
+    def is_failure_status(self, status_code, expected_status):
+        """
+        Ответ считается отказом сервера (для повтора и circuit breaker), если он из retry_statuses
+        и не является ожидаемым статусом теста.
+        """
+        if isinstance(expected_status, int):
+            expected_status = (expected_status,)
+        return status_code in self.retry_statuses and status_code not in expected_status
+
+    def backoff(self, attempt):
+        """
+        Задержка перед повтором номер attempt (начиная с 1), full jitter.
+        """
+        return random.uniform(0, min(self.backoff_max, self.backoff_base * 2 ** (attempt - 1)))
+
+    def next_delay(self, method, attempt, started):
+        """
+        Задержка перед следующей попыткой или None, если повторять больше нельзя.
+        :param attempt: Номер завершившейся попытки (начиная с 1).
+        :param started: time.monotonic() начала первой попытки.
+        """
+        if attempt >= self.attempts or not self.is_retryable_method(method):
+            return None
+        delay = self.backoff(attempt)
+        if self.deadline is not None and time.monotonic() - started + delay >= self.deadline:
+            return None
+        return delay
+
+
+# Политика по умолчанию для всех API-классов
+DEFAULT_POLICY = ResiliencePolicy()
+# Политика без повторов и circuit breaker
+NO_RETRY_POLICY = ResiliencePolicy(attempts=1, circuit_breaker=False)
@@ -0,0 +1,84 @@
+import os
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from constants.constants import USER_URL, MOVIES_URL
+
+DEFAULT_POOL_SIZES = {
+    USER_URL: int(os.getenv("CINESCOPE_AUTH_POOL_SIZE", 10)),
+    MOVIES_URL: int(os.getenv("CINESCOPE_API_POOL_SIZE", 20)),
+}
+DEFAULT_TIMEOUT = (
+    float(os.getenv("CINESCOPE_CONNECT_TIMEOUT", 5)),
+    float(os.getenv("CINESCOPE_READ_TIMEOUT", 30)),
+)
+
+
+class SharedHTTPAdapter(HTTPAdapter):
+    """
+    HTTPAdapter с таймаутом по умолчанию, который можно смонтировать в несколько сессий.
+    session.close() его не закрывает - пул соединений закрывает только SessionFactory.close().
+    """
+
+    def __init__(self, timeout=DEFAULT_TIMEOUT, **kwargs):
+        self.timeout = timeout
+        super().__init__(**kwargs)
+
+    def send(self, request, **kwargs):
+        if kwargs.get("timeout") is None:
+            kwargs["timeout"] = self.timeout
+        return super().send(request, **kwargs)
+
+    def close(self):
+        pass
+
+    def close_pool(self):
+        super().close()
+
+
+class SessionFactory:
+    """
+    Фабрика requests.Session с общим пулом keep-alive соединений.
+    Каждая созданная сессия имеет свои заголовки и cookies, но соединения (и TLS-рукопожатия)
+    к хостам Cinescope переиспользуются всеми сессиями фабрики.
+    """
+
+    def __init__(self, pool_sizes=None, default_pool_size=10, timeout=DEFAULT_TIMEOUT, pool_block=False):
+        """
+        :param pool_sizes: Размер пула на base_url, например {USER_URL: 10, MOVIES_URL: 20}.
+        :param default_pool_size: Размер пула для остальных хостов.
+        :param timeout: Таймаут по умолчанию (connect, read) в секундах.
+        :param pool_block: Ждать свободное соединение вместо открытия сверх размера пула.
+        """
+        pool_sizes = DEFAULT_POOL_SIZES if pool_sizes is None else pool_sizes
+        self.adapters = {
+            url: self._adapter(size, timeout, pool_block) for url, size in pool_sizes.items()
+        }
+        self.default_adapter = self._adapter(default_pool_size, timeout, pool_block)
+
+    @staticmethod
+    def _adapter(pool_size, timeout, pool_block):
+        # Повторы выполняет ResiliencePolicy в CustomRequester, поэтому у адаптера они выключены
+        return SharedHTTPAdapter(
+            timeout=timeout,
+            pool_connections=1,
+            pool_maxsize=pool_size,
+            pool_block=pool_block,
+            max_retries=0
+        )
+
+    def create_session(self):
+        """
+        Создание новой сессии с собственными заголовками поверх общего пула соединений.
+        """
+        session = requests.Session()
+        session.mount("http://", self.default_adapter)
+        session.mount("https://", self.default_adapter)
+        for url, adapter in self.adapters.items():
+            session.mount(url, adapter)
+        return session
+
+    def close(self):
+        for adapter in (*self.adapters.values(), self.default_adapter):
+            adapter.close_pool()
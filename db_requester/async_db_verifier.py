@@ -0,0 +1,122 @@
+import asyncio
+import time
+
+from sqlalchemy import select
+from sqlalchemy.engine import make_url
+
+from constants.constants import PG_URL
+from db_requester.db_engine import DB_MAX_OVERFLOW, DB_POOL_RECYCLE, DB_POOL_SIZE, DB_PRE_PING
+from models.base_models import MovieDBModel, UserDBModel
+from tools.workers import WorkerNamespace
+
+# Максимум значений в одном IN (...): большие батчи разбиваются на несколько запросов
+IN_CHUNK_SIZE = 1000
+DEFAULT_WAIT_TIMEOUT = 10
+DEFAULT_POLL_INTERVAL = 0.1
+MAX_POLL_INTERVAL = 1
+
+
+class AsyncDBVerifier:
+    """
+    Асинхронная проверка состояния базы данных (SQLAlchemy asyncio + asyncpg).
+    Проверки выполняются в том же event loop, что и AsyncApiManager, поэтому могут идти
+    конкурентно с API-запросами, а проверка N созданных объектов - одним запросом с IN.
+    """
+
+    def __init__(self, engine):
+        """
+        :param engine: AsyncEngine SQLAlchemy.
+        """
+        from sqlalchemy.ext.asyncio import async_sessionmaker
+
+        self.engine = engine
+        self.sessionmaker = async_sessionmaker(engine, expire_on_commit=False, autoflush=False)
+
+    @classmethod
+    def create(cls, url=PG_URL, pool_size=DB_POOL_SIZE, max_overflow=DB_MAX_OVERFLOW):
+        """
+        Создание верификатора с собственным пулом соединений asyncpg.
+        Должен вызываться внутри работающего event loop.
+        :param url: URL базы данных (драйвер заменяется на asyncpg).
+        :param pool_size: Постоянный размер пула соединений.
+        :param max_overflow: Сколько соединений можно открыть сверх pool_size.
+        """
+        from sqlalchemy.ext.asyncio import create_async_engine
+
+        engine = create_async_engine(
+            make_url(url).set(drivername="postgresql+asyncpg"),
+            pool_size=pool_size,
+            max_overflow=max_overflow,
+            pool_recycle=DB_POOL_RECYCLE,
+            pool_pre_ping=DB_PRE_PING,
+            connect_args={"server_settings": {"application_name": f"cinescope-tests-{WorkerNamespace.prefix()}"}},
+        )
+        return cls(engine)
+
+    async def close(self):
+        await self.engine.dispose()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+
+    async def fetch(self, model, column, values):
+        """
+        Строки модели, у которых column принимает одно из values, одним запросом с IN на каждые IN_CHUNK_SIZE значений.
+        :param model: ORM-модель (MovieDBModel, UserDBModel).
+        :param column: Колонка модели, например MovieDBModel.name.
+        :param values: Искомые значения колонки.
+        :return: Словарь {значение колонки: строка}.
+        """
+        values = list(dict.fromkeys(values))
+        rows = {}
+        async with self.sessionmaker() as session:
+            for start in range(0, len(values), IN_CHUNK_SIZE):
+                chunk = values[start:start + IN_CHUNK_SIZE]
+                result = await session.scalars(select(model).where(column.in_(chunk)))
+                for row in result:
+                    rows[getattr(row, column.key)] = row
+        return rows
+
+    async def wait_for(self, model, column, values, exists=True, check=None,
+                       timeout=DEFAULT_WAIT_TIMEOUT, interval=DEFAULT_POLL_INTERVAL):
+        """
+        Ожидание состояния строк: опрос одним IN-запросом с растущим интервалом до таймаута.
+        :param model: ORM-модель.
+        :param column: Колонка, по которой ищутся строки.
+        :param values: Значения колонки.
+        :param exists: True - ждать появления всех строк, False - исчезновения всех строк.
+        :param check: Условие для каждой найденной строки (например, lambda movie: movie.price == 100).
+        :param timeout: Таймаут ожидания в секундах.
+        :param interval: Начальный интервал опроса в секундах.
+        :return: Словарь {значение колонки: строка} на момент выполнения условия.
+        """
+        values = list(dict.fromkeys(values))
+        deadline = time.monotonic() + timeout
+        while True:
+            rows = await self.fetch(model, column, values)
+            if exists:
+                pending = [value for value in values if value not in rows or (check and not check(rows[value]))]
+            else:
+                pending = list(rows)
+            if not pending:
+                return rows
+            if time.monotonic() >= deadline:
+                state = "не появились или не прошли проверку" if exists else "не удалены"
+                raise AssertionError(f"Строки {model.__tablename__} ({column.key}) {state} за {timeout} с: {pending}")
+            await asyncio.sleep(min(interval, max(deadline - time.monotonic(), 0)))
+            interval = min(interval * 2, MAX_POLL_INTERVAL)
+
+    async def movies_by_ids(self, ids):
+        return await self.fetch(MovieDBModel, MovieDBModel.id, ids)
+
+    async def movies_by_names(self, names):
+        return await self.fetch(MovieDBModel, MovieDBModel.name, names)
+
+    async def users_by_ids(self, ids):
+        return await self.fetch(UserDBModel, UserDBModel.id, ids)
+
+    async def users_by_emails(self, emails):
+        return await self.fetch(UserDBModel, UserDBModel.email, emails)
@@ -0,0 +1,122 @@
+import os
+import threading
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session, sessionmaker
+
+from constants.constants import PG_URL
+from tools.workers import WorkerNamespace
+
+DB_POOL_SIZE = int(os.getenv("CINESCOPE_DB_POOL_SIZE", 2))
+DB_MAX_OVERFLOW = int(os.getenv("CINESCOPE_DB_MAX_OVERFLOW", 2))
+# Секунды ожидания свободного соединения из пула
+DB_POOL_TIMEOUT = float(os.getenv("CINESCOPE_DB_POOL_TIMEOUT", 10))
+# Соединения старше этого числа секунд пересоздаются (стенд рвет простаивающие соединения)
+DB_POOL_RECYCLE = int(os.getenv("CINESCOPE_DB_POOL_RECYCLE", 1800))
+DB_PRE_PING = os.getenv("CINESCOPE_DB_PRE_PING", "1") == "1"
+# Сколько соединений открыть сразу при создании движка
+DB_WARMUP = int(os.getenv("CINESCOPE_DB_WARMUP", 1))
+
+
+class DBEngine:
+    """
+    Ленивый движок SQLAlchemy, общий для процесса.
+    Движок и пул соединений создаются при первом обращении к базе, поэтому прогоны без DB-тестов
+    (API, UI) не подключаются к Postgres, а отсутствие .env не ломает сбор тестов.
+    Каждый xdist-воркер получает свой небольшой пул, помеченный id воркера.
+    """
+
+    def __init__(self, url=PG_URL, pool_size=DB_POOL_SIZE, max_overflow=DB_MAX_OVERFLOW,
+                 pool_timeout=DB_POOL_TIMEOUT, pool_recycle=DB_POOL_RECYCLE, pre_ping=DB_PRE_PING,
+                 warmup=DB_WARMUP):
+        """
+        :param url: URL базы данных (по умолчанию PG_URL из .env).
+        :param pool_size: Постоянный размер пула соединений.
+        :param max_overflow: Сколько соединений можно открыть сверх pool_size.
+        :param pool_timeout: Ожидание свободного соединения в секундах.
+        :param pool_recycle: Время жизни соединения в секундах.
+        :param pre_ping: Проверять соединение перед выдачей из пула.
+        :param warmup: Сколько соединений открыть при создании движка.
+        """
+        self.url = url
+        self.pool_size = pool_size
+        self.max_overflow = max_overflow
+        self.pool_timeout = pool_timeout
+        self.pool_recycle = pool_recycle
+        self.pre_ping = pre_ping
+        self.warmup = warmup
+        self._engine = None
+        self._pid = None
+        self._lock = threading.Lock()
+
+    @property
+    def is_configured(self):
+        return self.url is not None
+
+    @property
+    def engine(self):
+        """
+        Движок SQLAlchemy; создается и прогревается при первом обращении.
+        """
+        if self._engine is None or self._pid != os.getpid():
+            with self._lock:
+                if self._engine is None or self._pid != os.getpid():
+                    self._create()
+        return self._engine
+
+    def _create(self):
+        if not self.is_configured:
+            raise RuntimeError("Параметры базы данных не заданы (USERNAME, PASSWORD, HOST, PORT, DATABASE_NAME в .env)")
+        if self._engine is not None:
+            # Движок унаследован от родительского процесса: его соединения не закрываем, а только забываем
+            self._engine.dispose(close=False)
+        engine = create_engine(
+            self.url,
+            pool_size=self.pool_size,
+            max_overflow=self.max_overflow,
+            pool_timeout=self.pool_timeout,
+            pool_recycle=self.pool_recycle,
+            pool_pre_ping=self.pre_ping,
+            connect_args={"application_name": f"cinescope-tests-{WorkerNamespace.prefix()}"},
+        )
+        self._warm_up(engine)
+        self._engine = engine
+        self._pid = os.getpid()
+
+    def _warm_up(self, engine):
+        """
+        Открытие warmup соединений заранее, чтобы первые тесты не платили за подключение.
+        """
+        connections = []
+        try:
+            for _ in range(min(self.warmup, self.pool_size)):
+                connection = engine.connect()
+                connections.append(connection)
+                connection.exec_driver_sql("SELECT 1")
+        finally:
+            for connection in connections:
+                connection.close()
+
+    def session(self):
+        """
+        Обычная сессия ORM (изменения сохраняются при commit).
+        """
+        return sessionmaker(bind=self.engine, autoflush=False)()
+
+    @staticmethod
+    def isolated_session(connection):
+        """
+        Сессия ORM поверх соединения с открытой внешней транзакцией.
+        commit() и rollback() внутри теста работают с точками сохранения (SAVEPOINT),
+        поэтому откат внешней транзакции убирает все изменения теста.
+        :param connection: Соединение с начатой транзакцией (connection.begin()).
+        """
+        return Session(bind=connection, autoflush=False, join_transaction_mode="create_savepoint")
+
+    def dispose(self):
+        if self._engine is not None:
+            self._engine.dispose()
+            self._engine = None
+
+
+DB_ENGINE = DBEngine()
@@ -0,0 +1,61 @@
+from sqlalchemy import select
+
+from models.base_models import GenreDBModel, MovieDBModel, UserDBModel
+
+# Максимум значений в одном IN (...)
+IN_CHUNK_SIZE = 1000
+
+
+class DBHelper:
+    """
+    Запросы для проверок в базе данных по первичному ключу и индексированным колонкам.
+    Поиск многих строк выполняется одним запросом с IN на каждые IN_CHUNK_SIZE значений.
+    """
+
+    def __init__(self, db_session):
+        """
+        :param db_session: Сессия SQLAlchemy (например, фикстура db_session).
+        """
+        self.db_session = db_session
+
+    def _get_many(self, model, column, values):
+        """
+        Строки модели по значениям колонки.
+        :return: Словарь {значение колонки: объект модели}; ненайденных значений в нем нет.
+        """
+        values = list(dict.fromkeys(values))
+        rows = {}
+        for start in range(0, len(values), IN_CHUNK_SIZE):
+            chunk = values[start:start + IN_CHUNK_SIZE]
+            for row in self.db_session.scalars(select(model).where(column.in_(chunk))):
+                rows[getattr(row, column.key)] = row
+        return rows
+
+    def get_movie_by_id(self, movie_id):
+        return self.db_session.get(MovieDBModel, movie_id)
+
+    def get_movies_by_ids(self, movie_ids):
+        return self._get_many(MovieDBModel, MovieDBModel.id, movie_ids)
+
+    def get_movies_by_name(self, name):
+        return self.db_session.scalars(select(MovieDBModel).where(MovieDBModel.name == name)).all()
+
+    def get_movies_by_genre(self, genre_id, limit=100):
+        return self.db_session.scalars(
+            select(MovieDBModel).where(MovieDBModel.genre_id == genre_id).order_by(MovieDBModel.id).limit(limit)
+        ).all()
+
+    def movie_exists(self, movie_id):
+        return self.db_session.scalar(select(MovieDBModel.id).where(MovieDBModel.id == movie_id)) is not None
+
+    def get_genre_by_id(self, genre_id):
+        return self.db_session.get(GenreDBModel, genre_id)
+
+    def get_user_by_id(self, user_id):
+        return self.db_session.get(UserDBModel, user_id)
+
+    def get_users_by_ids(self, user_ids):
+        return self._get_many(UserDBModel, UserDBModel.id, user_ids)
+
+    def get_user_by_email(self, email):
+        return self.db_session.scalar(select(UserDBModel).where(UserDBModel.email == email))
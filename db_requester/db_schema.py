@@ -0,0 +1,87 @@
+from sqlalchemy import ARRAY, Boolean, DateTime, Enum, Float, Integer, Numeric, String, inspect
+
+from models.base_models import GenreDBModel, MovieDBModel, UserDBModel
+
+SCHEMA_MODELS = (UserDBModel, GenreDBModel, MovieDBModel)
+
+# Группы совместимых типов: модель и база должны попадать в одну группу (Integer ~ BIGINT, String ~ TEXT и т.д.)
+_TYPE_GROUPS = (
+    ("integer", Integer),
+    ("number", (Float, Numeric)),
+    ("string", String),
+    ("boolean", Boolean),
+    ("datetime", DateTime),
+    ("array", ARRAY),
+)
+
+
+def _type_group(column_type):
+    for name, type_class in _TYPE_GROUPS:
+        if isinstance(column_type, type_class):
+            return name
+    return type(column_type).__name__
+
+
+class SchemaValidator:
+    """
+    Сверка ORM-моделей со схемой базы через интроспекцию (sqlalchemy.inspect).
+    Находит отсутствующие таблицы и колонки, несовпадающие типы и nullable,
+    а также объявленные в модели индексы, которых нет в базе (поиск по такой колонке - полное сканирование).
+    """
+
+    @staticmethod
+    def _compatible(model_column, db_type):
+        model_group = _type_group(model_column.type)
+        db_group = _type_group(db_type)
+        if model_group == db_group:
+            return True
+        # Массив enum (users.roles) psycopg2 отдает строкой "{USER}", поэтому в модели он объявлен как String
+        return model_group == "string" and db_group == "array" and isinstance(db_type.item_type, Enum)
+
+    @staticmethod
+    def _indexed_columns(inspector, table):
+        """
+        Колонки, по которым в базе есть индекс: первичный ключ, уникальные ограничения и первые колонки индексов.
+        """
+        indexed = set(inspector.get_pk_constraint(table)["constrained_columns"][:1])
+        for constraint in inspector.get_unique_constraints(table):
+            indexed.update(constraint["column_names"][:1])
+        for index in inspector.get_indexes(table):
+            indexed.update(index["column_names"][:1])
+        return indexed
+
+    @staticmethod
+    def validate(engine, models=SCHEMA_MODELS):
+        """
+        Проверка схемы.
+        :param engine: Движок SQLAlchemy.
+        :param models: ORM-модели для проверки.
+        :return: Список описаний расхождений (пустой - схема соответствует моделям).
+        """
+        inspector = inspect(engine)
+        tables = set(inspector.get_table_names())
+        problems = []
+        for model in models:
+            table = model.__table__
+            if table.name not in tables:
+                problems.append(f"{table.name}: таблица отсутствует в базе")
+                continue
+
+            db_columns = {column["name"]: column for column in inspector.get_columns(table.name)}
+            for column in table.columns:
+                db_column = db_columns.get(column.name)
+                if db_column is None:
+                    problems.append(f"{table.name}.{column.name}: колонка отсутствует в базе")
+                    continue
+                if not SchemaValidator._compatible(column, db_column["type"]):
+                    problems.append(
+                        f"{table.name}.{column.name}: в модели {column.type}, в базе {db_column['type']}"
+                    )
+                if not column.nullable and not column.primary_key and db_column["nullable"]:
+                    problems.append(f"{table.name}.{column.name}: в модели NOT NULL, в базе допускается NULL")
+
+            indexed = SchemaValidator._indexed_columns(inspector, table.name)
+            expected = {column.name for column in table.columns if column.index or column.unique}
+            for name in sorted(expected - indexed):
+                problems.append(f"{table.name}.{name}: нет индекса, поиск по колонке выполняет полное сканирование")
+        return problems
@@ -0,0 +1,280 @@
+import json
+import os
+from bisect import bisect_right
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import delete, func, literal_column, or_, select
+from sqlalchemy.exc import SQLAlchemyError
+
+from models.base_models import MovieDBModel, UserDBModel
+
+# 1 - снимок таблиц до прогона и поиск оставшихся после него строк
+SNAPSHOT_ENV = "CINESCOPE_DB_SNAPSHOT"
+# 1 - удалить найденные утечки в конце прогона
+CLEANUP_ENV = "CINESCOPE_DB_SNAPSHOT_CLEANUP"
+SNAPSHOT_TABLES = (UserDBModel, MovieDBModel)
+# Строк на одну выборку серверного курсора
+STREAM_BATCH_SIZE = 5000
+# Максимум значений в одном IN (...) при дочитывании и удалении утечек
+IN_CHUNK_SIZE = 1000
+# Допустимое расхождение часов стенда и машины с тестами при привязке строк к тестам
+CLOCK_SKEW = timedelta(seconds=2)
+# Колонки с тегом прогона (префиксы WorkerNamespace.name и DBSeeder): {таблица: (колонка, шаблоны префиксов, тег обязателен)}.
+# Строки с тегом текущего прогона удаляются при очистке. В таблицах без обязательного тега (пользователи
+# API-тестов создаются без префикса) удаляются и строки, созданные во время тестов прогона
+RUN_TAGS = {
+    "movies": ("name", ("[{run_id}-", "[seed-{run_id}-"), True),
+    "users": ("email", ("seed-{run_id}-",), False),
+}
+
+
+def _utc(timestamp):
+    """
+    Время time.time() в виде naive UTC datetime, как created_at в базе.
+    """
+    return datetime.fromtimestamp(timestamp, timezone.utc).replace(tzinfo=None)
+
+
+def _chunks(values, size=IN_CHUNK_SIZE):
+    for start in range(0, len(values), size):
+        yield values[start:start + size]
+
+
+class TableDiff:
+    """
+    Разница таблицы между снимком и текущим состоянием.
+    """
+
+    def __init__(self, model):
+        self.model = model
+        self.added = []
+        self.changed = []
+        self.removed = []
+        # Тесты, во время которых создана каждая добавленная строка: {pk: [nodeid, ...]}
+        self.owners = {}
+        # Добавленные строки этого прогона, которые можно удалить; остальные только попадают в отчет
+        self.deletable = []
+
+    @property
+    def table(self):
+        return self.model.__tablename__
+
+    def leaks_by_test(self):
+        """
+        Добавленные строки, сгруппированные по тестам: {nodeid: [pk, ...]}.
+        Строки, созданные вне окон тестов, попадают в группу "<вне тестов>".
+        """
+        leaks = {}
+        for pk in self.added:
+            for nodeid in self.owners.get(pk) or ["<вне тестов>"]:
+                leaks.setdefault(nodeid, []).append(pk)
+        return leaks
+
+    def kept(self):
+        """
+        Добавленные строки, которые очистка не трогает: созданные вне тестов или без тега прогона
+        (например, другими пользователями и пайплайнами общего стенда).
+        """
+        deletable = set(self.deletable)
+        return [pk for pk in self.added if pk not in deletable]
+
+
+class DBSnapshot:
+    """
+    Снимок таблиц users и movies: первичный ключ и md5 содержимого каждой строки.
+    Строки читаются серверным курсором порциями, хэш считает Postgres, снимок пишется на диск
+    построчно (pk<TAB>md5) - память процесса не зависит от размера таблиц до сравнения.
+    Сравнение с текущим состоянием - один потоковый проход по таблице против словаря снимка, O(n).
+    """
+
+    def __init__(self, engine, directory, tables=SNAPSHOT_TABLES, run_id=None):
+        """
+        :param engine: Движок SQLAlchemy.
+        :param directory: Директория для файлов снимка.
+        :param tables: ORM-модели таблиц.
+        :param run_id: Идентификатор прогона (WorkerNamespace.run_id()) для поиска строк с тегом прогона.
+        """
+        self.engine = engine
+        self.directory = directory
+        self.tables = tables
+        self.run_id = run_id
+        self.windows = []
+
+    @staticmethod
+    def _pk(model):
+        return model.__mapper__.primary_key[0]
+
+    def _path(self, model):
+        return os.path.join(self.directory, f"{model.__tablename__}.idx")
+
+    def _stream(self, model):
+        """
+        Потоковое чтение (pk, md5 строки) серверным курсором.
+        """
+        row_hash = func.md5(literal_column(f"CAST({model.__tablename__} AS text)"))
+        query = select(self._pk(model), row_hash)
+        with self.engine.connect() as connection:
+            result = connection.execution_options(stream_results=True, yield_per=STREAM_BATCH_SIZE).execute(query)
+            for pk, digest in result:
+                yield pk, digest
+
+    def capture(self):
+        """
+        Снимок всех таблиц на диск.
+        :return: Количество строк по таблицам.
+        """
+        os.makedirs(self.directory, exist_ok=True)
+        counts = {}
+        for model in self.tables:
+            count = 0
+            with open(self._path(model), "w", encoding="utf-8") as file:
+                for pk, digest in self._stream(model):
+                    file.write(f"{pk}\t{digest}\n")
+                    count += 1
+            counts[model.__tablename__] = count
+        return counts
+
+    def _load(self, model):
+        index = {}
+        with open(self._path(model), encoding="utf-8") as file:
+            for line in file:
+                pk, digest = line.rstrip("\n").split("\t")
+                index[pk] = bytes.fromhex(digest)
+        return index
+
+    def record(self, nodeid, start, stop):
+        """
+        Окно выполнения теста (setup, call, teardown), для привязки созданных строк к тестам.
+        :param start: Начало в секундах time.time().
+        :param stop: Конец в секундах time.time().
+        """
+        self.windows.append((_utc(start) - CLOCK_SKEW, _utc(stop) + CLOCK_SKEW, nodeid))
+
+    def _run_tag(self, model):
+        """
+        Условие "строка с тегом текущего прогона" и обязательность тега для таблицы.
+        :return: (условие или None, тег обязателен).
+        """
+        column_name, patterns, required = RUN_TAGS.get(model.__tablename__, (None, (), False))
+        if column_name is None or self.run_id is None:
+            return None, required
+        column = getattr(model, column_name)
+        return or_(*(
+            column.startswith(pattern.format(run_id=self.run_id), autoescape=True) for pattern in patterns
+        )), required
+
+    def _attribute(self, diff):
+        """
+        Привязка добавленных строк к тестам по created_at (одним IN-запросом на IN_CHUNK_SIZE строк)
+        и отбор строк прогона для очистки: с тегом прогона или, если тег для таблицы не обязателен,
+        созданных во время тестов прогона.
+        При параллельном запуске окна тестов пересекаются - строка привязывается ко всем подходящим тестам.
+        """
+        model = diff.model
+        if not diff.added:
+            return
+        windows = sorted(self.windows)
+        starts = [window[0] for window in windows]
+        pk = self._pk(model)
+        created_at_column = getattr(model, "created_at", None)
+        tag, tag_required = self._run_tag(model)
+        columns = [
+            pk,
+            created_at_column if created_at_column is not None else literal_column("NULL"),
+            tag if tag is not None else literal_column("FALSE"),
+        ]
+        with self.engine.connect() as connection:
+            for chunk in _chunks(diff.added):
+                for row_pk, created_at, tagged in connection.execute(select(*columns).where(pk.in_(chunk))):
+                    owners = []
+                    if created_at is not None:
+                        owners = [
+                            nodeid for start, stop, nodeid in windows[:bisect_right(starts, created_at)]
+                            if stop >= created_at
+                        ]
+                        diff.owners[row_pk] = owners
+                    if tagged or (owners and not tag_required):
+                        diff.deletable.append(row_pk)
+
+    def diff(self):
+        """
+        Сравнение снимка с текущим состоянием таблиц.
+        :return: Список TableDiff по таблицам.
+        """
+        diffs = []
+        for model in self.tables:
+            table_diff = TableDiff(model)
+            before = self._load(model)
+            for pk, digest in self._stream(model):
+                previous = before.pop(str(pk), None)
+                if previous is None:
+                    table_diff.added.append(pk)
+                elif previous != bytes.fromhex(digest):
+                    table_diff.changed.append(pk)
+            table_diff.removed = list(before)
+            self._attribute(table_diff)
+            diffs.append(table_diff)
+        return diffs
+
+    def cleanup(self, diffs):
+        """
+        Удаление добавленных строк этого прогона (TableDiff.deletable) пачками по IN_CHUNK_SIZE,
+        каждая таблица - в своей транзакции. Остальные добавленные строки только попадают в отчет.
+        Таблица, строки которой удалить не удалось (например, на них ссылаются другие таблицы), пропускается.
+        :return: Количество удаленных строк по таблицам (None - удаление не удалось).
+        """
+        deleted = {}
+        for table_diff in diffs:
+            pk = self._pk(table_diff.model)
+            try:
+                with self.engine.begin() as connection:
+                    count = 0
+                    for chunk in _chunks(table_diff.deletable):
+                        count += connection.execute(delete(table_diff.model).where(pk.in_(chunk))).rowcount
+                deleted[table_diff.table] = count
+            except SQLAlchemyError:
+                deleted[table_diff.table] = None
+        return deleted
+
+    @staticmethod
+    def format_summary(diffs, deleted=None, limit=20):
+        """
+        Текстовая сводка утечек: количество строк по таблицам, тесты, оставившие больше всего строк,
+        и строки, которые очистка не удаляла (не принадлежат прогону).
+        :param limit: Сколько тестов и оставленных строк показывать для каждой таблицы.
+        """
+        lines = []
+        for table_diff in diffs:
+            line = (f"{table_diff.table}: added {len(table_diff.added)}, "
+                    f"changed {len(table_diff.changed)}, removed {len(table_diff.removed)}")
+            if deleted is not None:
+                count = deleted.get(table_diff.table)
+                line += ", cleanup failed" if count is None else f", deleted {count}"
+            lines.append(line)
+            leaks = sorted(table_diff.leaks_by_test().items(), key=lambda item: -len(item[1]))
+            for nodeid, pks in leaks[:limit]:
+                lines.append(f"    {len(pks):>6}  {nodeid}")
+            kept = table_diff.kept()
+            if deleted is not None and kept:
+                shown = ", ".join(str(pk) for pk in kept[:limit])
+                more = f" (+{len(kept) - limit})" if len(kept) > limit else ""
+                lines.append(f"    kept {len(kept)} rows not owned by this run: {shown}{more}")
+        return "\n".join(lines)
+
+    @staticmethod
+    def dump_json(diffs, path):
+        """
+        Полный отчет об утечках: первичные ключи по тестам для каждой таблицы.
+        """
+        report = {
+            table_diff.table: {
+                "added": len(table_diff.added),
+                "changed": [str(pk) for pk in table_diff.changed],
+                "removed": table_diff.removed,
+                "leaks": {nodeid: [str(pk) for pk in pks] for nodeid, pks in table_diff.leaks_by_test().items()},
+                "kept": [str(pk) for pk in table_diff.kept()],
+            }
+            for table_diff in diffs
+        }
+        with open(path, "w", encoding="utf-8") as file:
+            json.dump(report, file, ensure_ascii=False, indent=2)
@@ -0,0 +1,3 @@
+from load.report import LoadReport
+from load.runner import LoadConfig, run_load
+from load.scenarios import DEFAULT_MIX, SCENARIOS, parse_mix
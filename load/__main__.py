@@ -0,0 +1,43 @@
+import argparse
+
+from load.runner import LoadConfig, run_load
+from load.scenarios import DEFAULT_MIX, SCENARIOS, parse_mix
+from tools.tools import Tools
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="python -m load",
+        description="Нагрузочный прогон Cinescope на существующих клиентах MoviesAPI/AuthAPI."
+    )
+    parser.add_argument(
+        "--mix",
+        default=",".join(f"{name}={weight}" for name, weight in DEFAULT_MIX.items()),
+        help=f"Веса сценариев через запятую. Доступные сценарии: {', '.join(SCENARIOS)}"
+    )
+    parser.add_argument("--duration", type=float, default=30.0, help="Длительность прогона в секундах")
+    parser.add_argument("--workers", type=int, default=1, help="Количество процессов")
+    parser.add_argument("--concurrency", type=int, default=4, help="Виртуальных пользователей на процесс")
+    parser.add_argument("--rps", type=float, default=None, help="Целевой суммарный RPS (по умолчанию без ограничения)")
+    parser.add_argument("--seed", type=int, default=None, help="Зерно прогона (по умолчанию случайное, печатается в отчете)")
+    parser.add_argument("--json", action="store_true", help="Сохранить отчет в files/load/report_<timestamp>.json")
+    args = parser.parse_args(argv)
+
+    report = run_load(LoadConfig(
+        mix=parse_mix(args.mix),
+        duration=args.duration,
+        workers=args.workers,
+        concurrency=args.concurrency,
+        rps=args.rps,
+        seed=args.seed
+    ))
+    print(report.format_table())
+
+    if args.json:
+        report_path = Tools.files_dir("load", f"report_{Tools.get_timestamp()}.json")
+        report_path.write_text(report.to_json(), encoding="utf-8")
+        print(f"report: {report_path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+import json
+import math
+from collections import defaultdict
+
+
+def percentile(sorted_values, percent):
+    """
+    Перцентиль по методу ближайшего ранга.
+    :param sorted_values: Отсортированный список значений.
+    :param percent: Перцентиль от 0 до 100.
+    """
+    if not sorted_values:
+        return 0.0
+    rank = max(math.ceil(percent / 100 * len(sorted_values)) - 1, 0)
+    return sorted_values[min(rank, len(sorted_values) - 1)]
+
+
+class LoadReport:
+    """
+    Агрегированные результаты нагрузочного прогона.
+    """
+
+    def __init__(self, elapsed, seed=None):
+        self.elapsed = elapsed
+        self.seed = seed
+        self.latencies = defaultdict(list)
+        self.errors = defaultdict(lambda: defaultdict(int))
+        self.expected_statuses = {}
+        self.retries = defaultdict(int)
+        # Фильмы, оставшиеся после очистки: {id: ошибка удаления}
+        self.leaked_movies = {}
+
+    def add(self, name, expected_status, latency, error=None):
+        if expected_status is not None:
+            self.expected_statuses[name] = expected_status
+        if error is None:
+            self.latencies[name].append(latency)
+        else:
+            self.errors[name][error] += 1
+
+    @property
+    def total_requests(self):
+        return sum(len(values) for values in self.latencies.values()) + sum(
+            sum(errors.values()) for errors in self.errors.values()
+        )
+
+    @property
+    def throughput(self):
+        return self.total_requests / self.elapsed if self.elapsed else 0.0
+
+    def summary(self):
+        """
+        Сводка по каждому сценарию: количество, доля ошибок относительно ожидаемого статуса,
+        перцентили задержки в миллисекундах.
+        """
+        scenarios = {}
+        for name in sorted(set(self.latencies) | set(self.errors)):
+            values = sorted(self.latencies[name])
+            error_count = sum(self.errors[name].values())
+            count = len(values) + error_count
+            scenarios[name] = {
+                "expected_status": self.expected_statuses.get(name),
+                "count": count,
+                "error_rate": error_count / count if count else 0.0,
+                "errors": dict(self.errors[name]),
+                "p50_ms": percentile(values, 50) * 1000,
+                "p95_ms": percentile(values, 95) * 1000,
+                "p99_ms": percentile(values, 99) * 1000,
+                "max_ms": (values[-1] if values else 0.0) * 1000,
+            }
+        return {
+            "seed": self.seed,
+            "elapsed_s": self.elapsed,
+            "total_requests": self.total_requests,
+            "throughput_rps": self.throughput,
+            "scenarios": scenarios,
+            "retries": dict(self.retries),
+            "leaked_movies": dict(self.leaked_movies),
+        }
+
+    def to_json(self):
+        return json.dumps(self.summary(), indent=2, ensure_ascii=False)
+
+    def format_table(self):
+        summary = self.summary()
+        lines = [
+            f"{'scenario':<14}{'expected':>9}{'count':>8}{'errors':>8}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}",
+        ]
+        for name, row in summary["scenarios"].items():
+            lines.append(
+                f"{name:<14}{str(row['expected_status']):>9}{row['count']:>8}{row['error_rate']:>8.1%}"
+                f"{row['p50_ms']:>10.1f}{row['p95_ms']:>10.1f}{row['p99_ms']:>10.1f}"
+            )
+            for error, count in row["errors"].items():
+                lines.append(f"    {count} x {error}")
+        for request, count in summary["retries"].items():
+            lines.append(f"retries: {request} - {count}")
+        if summary["leaked_movies"]:
+            lines.append(f"leaked movies (cleanup failed): {len(summary['leaked_movies'])}")
+            for movie_id, error in summary["leaked_movies"].items():
+                lines.append(f"    {movie_id}: {error}")
+        lines.append(
+            f"total: {summary['total_requests']} requests in {summary['elapsed_s']:.1f}s, "
+            f"throughput {summary['throughput_rps']:.1f} rps"
+        )
+        lines.append(f"seed: {summary['seed']}")
+        return "\n".join(lines)
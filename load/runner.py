@@ -0,0 +1,188 @@
+import logging
+import multiprocessing
+import random
+import threading
+import time
+from dataclasses import dataclass, field, replace
+
+import requests
+
+from api.api_manager import ApiManager
+from constants.constants import USER_URL, MOVIES_URL
+from custom_requester.metrics import METRICS
+from custom_requester.session_factory import SessionFactory
+from load.report import LoadReport
+from load.scenarios import DEFAULT_MIX, SCENARIOS, LoadContext, cleanup
+from utils.data_generator import DataGenerator
+from utils.data_replay import DATA_REPLAY
+
+
+@dataclass
+class LoadConfig:
+    """
+    Параметры нагрузочного прогона.
+    :param mix: Веса сценариев, например {"get_movies": 70, "get_movie": 20, "create_movie": 10}.
+    :param duration: Длительность прогона в секундах.
+    :param workers: Количество процессов.
+    :param concurrency: Количество виртуальных пользователей (потоков) в каждом процессе.
+    :param rps: Целевая суммарная интенсивность запросов (None - без ограничения, максимум при заданном concurrency).
+    :param seed: Зерно прогона: выбор сценариев и тестовые данные (None - случайное, печатается в отчете).
+    """
+    mix: dict = field(default_factory=lambda: dict(DEFAULT_MIX))
+    duration: float = 30.0
+    workers: int = 1
+    concurrency: int = 4
+    rps: float = None
+    seed: int = None
+
+
+class _Pacer:
+    """
+    Равномерное распределение запусков сценариев во времени для достижения целевого RPS.
+    Общий для всех потоков процесса.
+    """
+
+    def __init__(self, rps):
+        self.interval = 1.0 / rps if rps else 0.0
+        self.next_slot = time.perf_counter()
+        self.lock = threading.Lock()
+
+    def wait(self, deadline):
+        if not self.interval:
+            return time.perf_counter() < deadline
+        with self.lock:
+            slot = max(self.next_slot, time.perf_counter())
+            self.next_slot = slot + self.interval
+        if slot >= deadline:
+            return False
+        delay = slot - time.perf_counter()
+        if delay > 0:
+            time.sleep(delay)
+        return True
+
+
+def _virtual_user(config, worker_index, user_index, session, pacer, deadline, samples, windows, cleanup_failures):
+    rng = random.Random(hash((config.seed, worker_index, user_index)))
+    names = list(config.mix)
+    weights = [config.mix[name] for name in names]
+    # Начало первого и конец последнего запроса пользователя по time.time() - сравнимо между процессами
+    window = [None, None]
+
+    def record(name, expected_status, request):
+        if window[0] is None:
+            window[0] = time.time()
+        started = time.perf_counter()
+        try:
+            response = request()
+            error = None
+        except ValueError as e:
+            response, error = None, str(e)
+        except requests.RequestException as e:
+            response, error = None, type(e).__name__
+        samples.append((name, expected_status, time.perf_counter() - started, error))
+        window[1] = time.time()
+        return response
+
+    context = LoadContext(ApiManager(session), record, rng)
+    logging.getLogger("custom_requester.custom_requester").setLevel(logging.WARNING)
+    try:
+        while pacer.wait(deadline):
+            scenario = SCENARIOS[rng.choices(names, weights)[0]]
+            try:
+                scenario(context)
+            except Exception as e:
+                samples.append((scenario.__name__, None, 0.0, f"{type(e).__name__}: {e}"))
+    finally:
+        cleanup(context)
+        cleanup_failures.extend(context.cleanup_failures)
+        if window[0] is not None:
+            windows.append(tuple(window))
+
+
+def _union(windows):
+    """
+    Общее окно (начало первого, конец последнего запроса) по окнам пользователей или воркеров.
+    :return: Кортеж (start, stop) или None, если запросов не было.
+    """
+    windows = [window for window in windows if window is not None]
+    if not windows:
+        return None
+    return min(start for start, _ in windows), max(stop for _, stop in windows)
+
+
+def _run_worker(config, worker_index):
+    """
+    Точка входа процесса-воркера: запускает concurrency виртуальных пользователей и
+    возвращает сырые замеры (сценарий, ожидаемый статус, длительность, ошибка),
+    количество повторов запросов политикой устойчивости, окно нагрузки воркера
+    (начало первого и конец последнего запроса, None - запросов не было)
+    и фильмы, которые не удалось удалить при очистке ([(id, ошибка), ...]).
+    """
+    retries_before = METRICS.to_dict()["retries"]
+    DATA_REPLAY.configure_from_env(config.seed, writer=False)
+    DataGenerator.seed(DATA_REPLAY.start(f"load-worker-{worker_index}"))
+    per_worker_rps = config.rps / config.workers if config.rps else None
+    pacer = _Pacer(per_worker_rps)
+    deadline = time.perf_counter() + config.duration
+    samples = []
+    windows = []
+    cleanup_failures = []
+    # Виртуальные пользователи процесса - отдельные идентичности поверх одной сессии
+    # и одного пула соединений размером с concurrency
+    session_factory = SessionFactory(
+        pool_sizes={url: config.concurrency for url in (USER_URL, MOVIES_URL)},
+        default_pool_size=config.concurrency
+    )
+    session = session_factory.create_session()
+    threads = [
+        threading.Thread(
+            target=_virtual_user,
+            args=(config, worker_index, user_index, session, pacer, deadline, samples, windows, cleanup_failures),
+            daemon=True
+        )
+        for user_index in range(config.concurrency)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    session.close()
+    session_factory.close()
+    retries = {
+        request: count - retries_before.get(request, 0)
+        for request, count in METRICS.to_dict()["retries"].items()
+        if count > retries_before.get(request, 0)
+    }
+    return samples, retries, _union(windows), cleanup_failures
+
+
+def run_load(config: LoadConfig) -> LoadReport:
+    """
+    Запуск нагрузочного прогона по заданной конфигурации.
+    :param config: Объект LoadConfig.
+    :return: Объект LoadReport с перцентилями задержек, ошибками и достигнутой пропускной способностью.
+    """
+    unknown = set(config.mix) - set(SCENARIOS)
+    if unknown:
+        raise ValueError(f"Unknown scenarios: {', '.join(sorted(unknown))}")
+
+    config = replace(config, seed=DATA_REPLAY.configure_from_env(config.seed))
+    if config.workers == 1:
+        results = [_run_worker(config, 0)]
+    else:
+        with multiprocessing.get_context("spawn").Pool(config.workers) as pool:
+            results = pool.starmap(_run_worker, [(config, index) for index in range(config.workers)])
+    DATA_REPLAY.close()
+
+    # Длительность - по окнам запросов воркеров, без запуска процессов и импорта модулей
+    window = _union([worker_window for _, _, worker_window, _ in results])
+    elapsed = window[1] - window[0] if window else 0.0
+    report = LoadReport(elapsed, seed=config.seed)
+    for samples, retries, _, cleanup_failures in results:
+        for sample in samples:
+            report.add(*sample)
+        for request, count in retries.items():
+            report.retries[request] += count
+        for movie_id, error in cleanup_failures:
+            report.leaked_movies[str(movie_id)] = error
+    return report
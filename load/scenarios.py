@@ -0,0 +1,129 @@
+import logging
+import random
+
+from custom_requester.json_body import JsonBody
+from models.base_models import MoviesPageResponse
+from resources.user_creds import SuperAdminCreds
+from utils.data_generator import DataGenerator
+
+DEFAULT_MOVIES_FILTERS = [
+    {"minPrice": 1, "maxPrice": 1000},
+    {"minPrice": 100, "maxPrice": 500, "genreId": 3},
+    {"locations": "MSK", "published": "true"},
+    {"page": 2, "pageSize": 20},
+]
+
+# Тело логина одинаково для всех вызовов сценария login - сериализуется один раз
+LOGIN_BODY = JsonBody({"email": SuperAdminCreds.USERNAME, "password": SuperAdminCreds.PASSWORD})
+
+logger = logging.getLogger(__name__)
+
+
+class LoadContext:
+    """
+    Состояние одного виртуального пользователя нагрузочного прогона.
+    Хранит ApiManager, известные id фильмов и функцию записи замеров.
+    """
+
+    def __init__(self, api_manager, recorder, rng=None):
+        self.api = api_manager
+        self.recorder = recorder
+        self.rng = rng or random.Random()
+        self.movie_ids = []
+        self.created_movie_ids = []
+        # Фильмы, которые не удалось удалить при очистке: [(id, ошибка), ...]
+        self.cleanup_failures = []
+        self.authenticated = False
+
+    def call(self, name, expected_status, request, *args, **kwargs):
+        """
+        Выполнение запроса с замером времени.
+        :param name: Имя операции в отчете.
+        :param expected_status: Ожидаемый статус-код, передается в метод API.
+        :param request: Метод API-класса (например, api.movies_api.get_movie).
+        """
+        return self.recorder(name, expected_status, lambda: request(*args, expected_status=expected_status, **kwargs))
+
+    def ensure_super_admin(self):
+        if not self.authenticated:
+            self.api.auth_api.authenticate((SuperAdminCreds.USERNAME, SuperAdminCreds.PASSWORD))
+            self.authenticated = True
+
+
+def get_movies(context):
+    params = context.rng.choice(DEFAULT_MOVIES_FILTERS)
+    response = context.call("get_movies", 200, context.api.movies_api.get_movies, params=params)
+    if response is not None and not context.movie_ids:
+        page = context.api.movies_api.parse_model(response, MoviesPageResponse)
+        context.movie_ids = [movie.id for movie in page.movies]
+
+
+def get_movie(context):
+    if not context.movie_ids:
+        get_movies(context)
+    if not context.movie_ids:
+        return
+    response = context.call("get_movie", 200, context.api.movies_api.get_movie, context.rng.choice(context.movie_ids))
+    if response is None:
+        # Фильм мог быть удален - обновим список id при следующем вызове
+        context.movie_ids = []
+
+
+def create_movie(context):
+    context.ensure_super_admin()
+    data = DataGenerator.generate_random_movie()
+    data["name"] = f"load {DataGenerator.generate_random_str()} {data['name']}"
+    response = context.call("create_movie", 201, context.api.movies_api.create_movie, data)
+    if response is not None:
+        context.created_movie_ids.append(response.json()["id"])
+
+
+def delete_movie(context):
+    if not context.created_movie_ids:
+        create_movie(context)
+    if not context.created_movie_ids:
+        return
+    context.call("delete_movie", 200, context.api.movies_api.delete_movie, context.created_movie_ids.pop())
+
+
+def login(context):
+    context.call("login", 200, context.api.auth_api.login_user, LOGIN_BODY)
+
+
+def cleanup(context):
+    """
+    Удаление фильмов, созданных виртуальным пользователем и не удаленных сценарием.
+    Фильмы, которые удалить не удалось, сохраняются в context.cleanup_failures и попадают в отчет.
+    """
+    while context.created_movie_ids:
+        movie_id = context.created_movie_ids.pop()
+        try:
+            context.api.movies_api.delete_movie(movie_id)
+        except Exception as e:
+            error = f"{type(e).__name__}: {e}"
+            logger.warning("Не удалось удалить фильм %s после нагрузки: %s", movie_id, error)
+            context.cleanup_failures.append((movie_id, error))
+
+
+SCENARIOS = {
+    "get_movies": get_movies,
+    "get_movie": get_movie,
+    "create_movie": create_movie,
+    "delete_movie": delete_movie,
+    "login": login,
+}
+
+DEFAULT_MIX = {"get_movies": 70, "get_movie": 20, "create_movie": 5, "delete_movie": 5}
+
+
+def parse_mix(mix):
+    """
+    Разбор строки вида "get_movies=70,get_movie=20,create_movie=10" в словарь весов.
+    """
+    weights = {}
+    for item in mix.split(","):
+        name, _, weight = item.strip().partition("=")
+        if name not in SCENARIOS:
+            raise ValueError(f"Unknown scenario: {name}. Available: {', '.join(SCENARIOS)}")
+        weights[name] = float(weight or 1)
+    return weights
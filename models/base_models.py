@@ -2,7 +2,7 @@ import datetime
 from typing import Optional
 
 from pydantic import BaseModel, Field, field_validator
-from sqlalchemy import Column, String, Boolean, DateTime, Integer, ForeignKey
+from sqlalchemy import Column, String, Boolean, DateTime, Integer, Float, ForeignKey
 from sqlalchemy.orm import declarative_base
 
 from enums.models import Roles, Location
@@ -92,37 +92,60 @@ class MoviesDataResponse(BaseModel):
     rating: float = Field(..., ge=0, le=5)
 
 
+class MoviesPageResponse(BaseModel):
+    """
+    Pydantic модель страницы списка фильмов
+    """
+    movies: list[MoviesDataResponse]
+    count: int
+    page: int
+    pageSize: int
+    pageCount: int
+
+
 class UserDBModel(Base):
     """
     Модель базы данных для пользователя.
     """
     __tablename__ = 'users'
-    id = Column(String, primary_key=True)
-    email = Column(String)
+    id = Column(String, primary_key=True)  # UUID, генерируется сервисом Auth
+    email = Column(String, nullable=False, unique=True)  # Уникальный индекс - поиск по email без полного сканирования
     full_name = Column(String)
     password = Column(String)
     created_at = Column(DateTime)
     updated_at = Column(DateTime)
     verified = Column(Boolean)
     banned = Column(Boolean)
-    roles = Column(String)
+    roles = Column(String)  # Массив enum в базе; psycopg2 отдает его строкой вида "{USER}"
+
+
+class GenreDBModel(Base):
+    """
+    Модель для таблицы genres.
+    """
+    __tablename__ = 'genres'
+
+    id = Column(Integer, primary_key=True)
+    name = Column(String, nullable=False, unique=True)
 
 
 class MovieDBModel(Base):
     """
     Модель для таблицы movies.
+    Индексы (index=True, unique=True) описывают ожидаемую схему стенда, таблицы тестами не создаются;
+    соответствие схеме проверяет SchemaValidator.
     """
     __tablename__ = 'movies'  # Имя таблицы в базе данных
 
     # Поля таблицы
-    id = Column(String, primary_key=True)  # Уникальный идентификатор фильма
-    name = Column(String, nullable=False)  # Название фильма
+    id = Column(Integer, primary_key=True, autoincrement=True)  # Уникальный идентификатор фильма
+    name = Column(String, nullable=False, index=True)  # Название фильма
     description = Column(String)  # Описание фильма
     price = Column(Integer, nullable=False)  # Цена фильма
-    genre_id = Column(String, ForeignKey('genres.id'), nullable=False)  # Ссылка на жанр
+    genre_id = Column(Integer, ForeignKey('genres.id'), nullable=False, index=True)  # Ссылка на жанр
     image_url = Column(String)  # Ссылка на изображение
     location = Column(String)  # Локация фильма (например, "MSK")
-    rating = Column(Integer)  # Рейтинг фильма
+    rating = Column(Float)  # Рейтинг фильма
     published = Column(Boolean)  # Опубликован ли фильм
     created_at = Column(DateTime)  # Дата создания записи
 
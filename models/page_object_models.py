@@ -3,7 +3,8 @@ import typing
 import allure
 from playwright.async_api import Page
 
-from constants.constants import REGISTER_ENDPOINT, UI_MOVIES_URL, ALL_MOVIES_ENDPOINT, LOGIN_ENDPOINT, UI_HOME_PAGE_URL
+from constants.constants import REGISTER_ENDPOINT, UI_MOVIES_URL, ALL_MOVIES_ENDPOINT, LOGIN_ENDPOINT, UI_HOME_PAGE_URL, \
+    PROFILE_ENDPOINT
 
 
 class PageAction:
@@ -137,4 +138,22 @@ class CinescopLoginPage(BasePage):
         self.wait_redirect_for_url(self.home_url)
 
     def assert_alert_was_pop_us(self):
-        self.check_pop_up_element_with_text("Вы вошли в аккаунт")
\ No newline at end of file
+        self.check_pop_up_element_with_text("Вы вошли в аккаунт")
+
+
+class CinescopProfilePage(BasePage):
+    def __init__(self, page: Page):
+        super().__init__(page)
+        self.url = f"{self.home_url}{PROFILE_ENDPOINT.lstrip('/')}"
+
+    # Тело страницы
+    def open(self):
+        """Переход на страницу профиля (доступна только авторизованному пользователю)"""
+        self.page.goto(self.url)
+
+    @allure.step("Проверка, что страница профиля открыта без перехода на страницу входа")
+    def assert_user_is_authorized(self):
+        # Неавторизованного пользователя фронтенд перенаправляет на /login после загрузки страницы
+        self.page.wait_for_load_state("networkidle")
+        assert LOGIN_ENDPOINT not in self.page.url, f"Пользователь не авторизован: редирект на {self.page.url}"
+        assert self.page.url.startswith(self.url), f"Страница профиля не открыта: {self.page.url}"
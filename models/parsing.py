@@ -0,0 +1,55 @@
+from functools import lru_cache
+from typing import get_args, get_origin
+
+from pydantic import BaseModel, TypeAdapter
+from pydantic_core import from_json
+
+
+@lru_cache(maxsize=None)
+def type_adapter(model):
+    """
+    Закэшированный TypeAdapter для модели или типа (например, list[MoviesDataResponse]).
+    Схема валидации строится один раз на процесс.
+    """
+    return TypeAdapter(model)
+
+
+def _construct_value(annotation, value):
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel) and isinstance(value, dict):
+        return construct(annotation, value)
+    if get_origin(annotation) is list and isinstance(value, list):
+        (item_annotation,) = get_args(annotation)
+        return [_construct_value(item_annotation, item) for item in value]
+    return value
+
+
+def construct(model, data):
+    """
+    Создание модели из доверенных данных через model_construct, без валидации.
+    Вложенные модели и списки моделей создаются так же; enum-поля остаются строками.
+    :param model: Класс pydantic-модели.
+    :param data: Словарь, полученный из ответа API.
+    """
+    values = dict(data)
+    for name, field in model.model_fields.items():
+        if name in values:
+            values[name] = _construct_value(field.annotation, values[name])
+    return model.model_construct(**values)
+
+
+def parse_json(content, model, trusted=False):
+    """
+    Разбор JSON-ответа в модель.
+    По умолчанию байты разбираются и валидируются за один проход в pydantic-core, без промежуточного dict -
+    это самый быстрый путь. trusted=True не ускоряет разбор (model_construct выполняется в Python),
+    а позволяет получить модель из данных, которые не прошли бы валидацию (например, в нагрузочном прогоне).
+    :param content: Тело ответа (bytes или str).
+    :param model: Класс pydantic-модели или тип (например, list[MoviesDataResponse]).
+    :param trusted: Пропустить валидацию (model_construct).
+    """
+    if trusted:
+        data = from_json(content)
+        if get_origin(model) is list:
+            return _construct_value(model, data)
+        return construct(model, data)
+    return type_adapter(model).validate_json(content)
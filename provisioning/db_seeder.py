@@ -0,0 +1,111 @@
+import uuid
+from datetime import datetime, timezone
+
+from sqlalchemy import delete, insert
+
+from enums.models import Roles
+from models.base_models import MovieDBModel, MoviesData, UserDBModel
+from provisioning.movie_provisioner import DEFAULT_IMAGE_URL
+from tools.workers import WorkerNamespace
+from utils.data_generator import DataGenerator
+
+
+class DBSeeder:
+    """
+    Массовое создание фильмов и пользователей напрямую в базе, в обход API.
+    Подходит для тестов, которые только читают данные (фильтры и пагинация /movies, get_movie, get_user):
+    тысячи строк вставляются одной транзакцией пакетными INSERT ... RETURNING вместо тысяч HTTP-запросов.
+    Все строки помечены тегом прогона и воркера и удаляются одним DELETE на таблицу.
+    """
+
+    def __init__(self, engine, run_tag=None):
+        """
+        :param engine: Движок SQLAlchemy.
+        :param run_tag: Тег строк (по умолчанию префикс прогона и воркера WorkerNamespace.prefix()).
+        """
+        self.engine = engine
+        self.run_tag = run_tag or WorkerNamespace.prefix()
+
+    @property
+    def movie_name_prefix(self):
+        return f"[seed-{self.run_tag}]"
+
+    @property
+    def user_email_prefix(self):
+        return f"seed-{self.run_tag}-"
+
+    def _insert(self, model, rows):
+        """
+        Вставка строк одной транзакцией; SQLAlchemy разбивает их на пакетные INSERT ... VALUES (...), ... RETURNING.
+        :return: Созданные строки таблицы (Row с атрибутами-колонками, включая сгенерированный базой id) в порядке rows.
+        """
+        table = model.__table__
+        with self.engine.begin() as connection:
+            return connection.execute(insert(table).returning(*table.c, sort_by_parameter_order=True), rows).all()
+
+    def seed_movies(self, count, **overrides):
+        """
+        Создание count фильмов (данные - DataGenerator.generate_movies, проверенные моделью MoviesData).
+        :param count: Количество фильмов.
+        :param overrides: Поля MoviesData, переопределяющие сгенерированные значения (например, genreId=1).
+        :return: Список созданных строк movies.
+        """
+        created_at = datetime.now(timezone.utc).replace(tzinfo=None)
+        rows = []
+        for data in DataGenerator.to_rows(DataGenerator.generate_movies(count)):
+            movie = MoviesData(**{
+                **data, "name": f"{self.movie_name_prefix} {data['name']}", "imageUrl": DEFAULT_IMAGE_URL, **overrides
+            })
+            rows.append({
+                "name": movie.name,
+                "description": movie.description,
+                "price": movie.price,
+                "genre_id": movie.genreId,
+                "image_url": movie.imageUrl,
+                "location": movie.location.value,
+                "rating": movie.rating,
+                "published": movie.published,
+                "created_at": created_at,
+            })
+        return self._insert(MovieDBModel, rows)
+
+    def seed_users(self, count, role=Roles.USER, verified=True, banned=False):
+        """
+        Создание count пользователей.
+        Пароль пишется в базу как есть, без хэша сервиса Auth - войти под такими пользователями нельзя,
+        они предназначены для проверок чтения (get_user по id или email).
+        :param count: Количество пользователей.
+        :param role: Роль пользователей.
+        :return: Список созданных строк users.
+        """
+        now = datetime.now(timezone.utc).replace(tzinfo=None)
+        users = DataGenerator.to_rows(DataGenerator.generate_users(count))
+        rows = [
+            {
+                "id": str(uuid.uuid4()),
+                "email": f"{self.user_email_prefix}{user['email']}",
+                "full_name": user["fullName"],
+                "password": user["password"],
+                "created_at": now,
+                "updated_at": now,
+                "verified": verified,
+                "banned": banned,
+                "roles": f"{{{role.value}}}",
+            }
+            for user in users
+        ]
+        return self._insert(UserDBModel, rows)
+
+    def cleanup(self):
+        """
+        Удаление всех строк с тегом DBSeeder одним DELETE на таблицу.
+        :return: Количество удаленных строк по таблицам.
+        """
+        with self.engine.begin() as connection:
+            movies = connection.execute(
+                delete(MovieDBModel).where(MovieDBModel.name.startswith(self.movie_name_prefix, autoescape=True))
+            ).rowcount
+            users = connection.execute(
+                delete(UserDBModel).where(UserDBModel.email.startswith(self.user_email_prefix, autoescape=True))
+            ).rowcount
+        return {MovieDBModel.__tablename__: movies, UserDBModel.__tablename__: users}
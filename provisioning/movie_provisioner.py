@@ -0,0 +1,132 @@
+import asyncio
+import threading
+
+from api.async_api_manager import AsyncApiManager
+from models.base_models import MoviesData, MoviesDataResponse
+from models.parsing import parse_json
+from tools.workers import WorkerNamespace
+from utils.data_generator import DataGenerator
+
+DEFAULT_IMAGE_URL = "https://encrypted-tbn0.gstatic.com/images?q=tbn:ANd9G"
+
+
+class MovieProvisioner:
+    """
+    Сервис подготовки тестовых фильмов.
+    Создает фильмы конкурентно через AsyncApiManager, ведет реестр (ledger) всех созданных id
+    и удаляет их одним параллельным батчем по окончании теста или сессии.
+    """
+
+    def __init__(self, admin_creds, concurrency=10):
+        """
+        :param admin_creds: Кортеж (email, password) пользователя с правами на создание и удаление фильмов.
+        :param concurrency: Максимальное количество одновременных запросов.
+        """
+        self.admin_creds = admin_creds
+        self.concurrency = concurrency
+        self.ledger = set()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def movie_data(unique=False, **overrides):
+        """
+        Генерация данных фильма на основе DataGenerator.generate_random_movie.
+        :param unique: Добавить к названию случайный суффикс (для массового создания).
+        :param overrides: Поля, переопределяющие сгенерированные значения.
+        """
+        data = DataGenerator.generate_random_movie()
+        data["name"] = WorkerNamespace.name(data["name"])
+        if unique:
+            data["name"] = f"{data['name']} {DataGenerator.generate_random_str()}"
+        data["imageUrl"] = DEFAULT_IMAGE_URL
+        data.update(overrides)
+        return MoviesData(**data)
+
+    @staticmethod
+    def movies_data(count, **overrides):
+        """
+        Пакетная генерация данных count фильмов с уникальными названиями (DataGenerator.generate_movies).
+        :param count: Количество фильмов.
+        :param overrides: Поля, переопределяющие сгенерированные значения.
+        """
+        return [
+            MoviesData(**{**data, "name": WorkerNamespace.name(data["name"]), "imageUrl": DEFAULT_IMAGE_URL, **overrides})
+            for data in DataGenerator.to_rows(DataGenerator.generate_movies(count))
+        ]
+
+    def register(self, movie_id):
+        """
+        Регистрация id фильма, созданного в обход сервиса, для гарантированного удаления.
+        """
+        with self._lock:
+            self.ledger.add(movie_id)
+
+    def _run(self, coroutine_factory):
+        async def _with_api():
+            async with AsyncApiManager.create(limit=self.concurrency) as async_api:
+                await async_api.auth_api.authenticate(self.admin_creds)
+                return await coroutine_factory(async_api)
+
+        return asyncio.run(_with_api())
+
+    def create(self, count=1, template=None, **overrides):
+        """
+        Конкурентное создание count фильмов.
+        :param count: Количество фильмов.
+        :param template: Объект MoviesData; если передан, все фильмы создаются по нему с уникальным названием.
+        :param overrides: Поля, переопределяющие сгенерированные значения.
+        :return: Список объектов MoviesDataResponse в порядке создания.
+        """
+        if template is not None:
+            movies_data = [
+                template.model_copy(update={"name": f"{template.name} {DataGenerator.generate_random_str()}", **overrides})
+                for _ in range(count)
+            ]
+        elif count > 1:
+            movies_data = self.movies_data(count, **overrides)
+        else:
+            movies_data = [self.movie_data(**overrides)]
+
+        async def _create(async_api):
+            return await async_api.movies_api.gather(
+                *(async_api.movies_api.create_movie(data) for data in movies_data),
+                concurrency=self.concurrency,
+                return_exceptions=True
+            )
+
+        movies, errors = [], []
+        for result in self._run(_create):
+            if isinstance(result, Exception):
+                errors.append(result)
+                continue
+            movie = parse_json(result.content, MoviesDataResponse)
+            self.register(movie.id)
+            movies.append(movie)
+
+        if errors:
+            raise errors[0]
+        return movies
+
+    def cleanup(self, movie_ids=None):
+        """
+        Параллельное удаление фильмов из реестра. Уже удаленные фильмы (404) считаются успешно удаленными.
+        :param movie_ids: Удаляемые id (по умолчанию весь реестр).
+        :return: Список id, которые удалить не удалось.
+        """
+        with self._lock:
+            ids = list(self.ledger if movie_ids is None else self.ledger & set(movie_ids))
+            self.ledger.difference_update(ids)
+        if not ids:
+            return []
+
+        async def _delete(async_api):
+            return await async_api.movies_api.gather(
+                *(async_api.movies_api.delete_movie(movie_id, expected_status=(200, 404)) for movie_id in ids),
+                concurrency=self.concurrency,
+                return_exceptions=True
+            )
+
+        failed = [movie_id for movie_id, result in zip(ids, self._run(_delete)) if isinstance(result, Exception)]
+        with self._lock:
+            self.ledger.update(failed)
+        return failed
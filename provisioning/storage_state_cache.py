@@ -0,0 +1,128 @@
+import glob
+import hashlib
+import os
+import time
+
+from constants.constants import LOGIN_ENDPOINT, UI_HOME_PAGE_URL, USER_URL
+from tools.tools import Tools
+
+# ui - вход через страницу логина, api - через POST /login в APIRequestContext браузерного контекста
+STORAGE_STATE_MODE = os.getenv("CINESCOPE_STORAGE_STATE_MODE", "ui")
+# Время жизни сохраненного состояния в секундах (не больше времени жизни сессии на стенде)
+STORAGE_STATE_TTL = int(os.getenv("CINESCOPE_STORAGE_STATE_TTL", 1800))
+
+
+class StorageStateCache:
+    """
+    Кэш авторизованного состояния браузера (cookies и localStorage) для пользователей.
+    Каждый пользователь входит один раз, состояние сохраняется на диск (files/storage_state)
+    и используется для создания уже авторизованных контекстов: browser.new_context(storage_state=...).
+    Файлы общие для xdist-воркеров: вход выполняется под файловой блокировкой,
+    состояние старше STORAGE_STATE_TTL создается заново.
+    Пользователи пула в каждом прогоне новые, поэтому файлы, созданные за сессию, удаляются в ее конце (clear),
+    а оставшиеся от прерванных прогонов - при старте, когда они устарели (prune).
+    """
+
+    def __init__(self, directory=None, mode=STORAGE_STATE_MODE, ttl=STORAGE_STATE_TTL):
+        """
+        :param directory: Директория файлов состояния (по умолчанию files/storage_state).
+        :param mode: Способ входа: "ui" или "api".
+        :param ttl: Время жизни состояния в секундах.
+        """
+        self.directory = directory or str(Tools.files_dir("storage_state"))
+        self.mode = mode
+        self.ttl = ttl
+        # Файлы состояния, созданные этим кэшем
+        self.written = set()
+
+    def path(self, email):
+        # В имени файла нет email: хэш от стенда и пользователя
+        digest = hashlib.sha256(f"{UI_HOME_PAGE_URL}|{email}".encode("utf-8")).hexdigest()[:16]
+        return os.path.join(self.directory, f"{digest}.json")
+
+    def _is_fresh(self, path):
+        return os.path.exists(path) and time.time() - os.path.getmtime(path) < self.ttl
+
+    def get(self, browser, email, password):
+        """
+        Путь к файлу авторизованного состояния пользователя; при отсутствии или устаревании выполняется вход.
+        :param browser: Браузер Playwright.
+        :param email: Email пользователя.
+        :param password: Пароль пользователя.
+        """
+        path = self.path(email)
+        if self._is_fresh(path):
+            return path
+
+        from filelock import FileLock
+
+        with FileLock(f"{path}.lock"):
+            if not self._is_fresh(path):
+                tmp_path = f"{path}.{os.getpid()}.tmp"
+                if self.mode == "api":
+                    self._login_api(browser, email, password, tmp_path)
+                else:
+                    self._login_ui(browser, email, password, tmp_path)
+                os.replace(tmp_path, path)
+                self.written.add(path)
+        return path
+
+    def invalidate(self, email):
+        """
+        Удаление сохраненного состояния (например, после смены пароля или выхода из аккаунта).
+        """
+        self._remove(self.path(email))
+
+    @staticmethod
+    def _remove(path):
+        for file_path in (path, f"{path}.lock"):
+            if os.path.exists(file_path):
+                os.remove(file_path)
+
+    def clear(self):
+        """
+        Удаление файлов состояния, созданных этим кэшем (в конце сессии).
+        """
+        for path in self.written:
+            self._remove(path)
+        self.written.clear()
+
+    def prune(self):
+        """
+        Удаление устаревших файлов состояния, оставшихся от прошлых прогонов.
+        :return: Количество удаленных файлов.
+        """
+        count = 0
+        for path in glob.glob(os.path.join(self.directory, "*.json")):
+            if not self._is_fresh(path):
+                self._remove(path)
+                count += 1
+        return count
+
+    @staticmethod
+    def _login_ui(browser, email, password, path):
+        from models.page_object_models import CinescopLoginPage
+
+        context = browser.new_context()
+        try:
+            login_page = CinescopLoginPage(context.new_page())
+            login_page.open()
+            login_page.login(email, password)
+            login_page.assert_was_redirect_to_home_page()
+            context.storage_state(path=path)
+        finally:
+            context.close()
+
+    @staticmethod
+    def _login_api(browser, email, password, path):
+        """
+        Вход запросом к сервису Auth из APIRequestContext контекста: cookies, выставленные сервисом,
+        попадают в хранилище контекста. Подходит, если фронтенд авторизуется по этим cookies.
+        """
+        context = browser.new_context()
+        try:
+            response = context.request.post(f"{USER_URL}{LOGIN_ENDPOINT}", data={"email": email, "password": password})
+            assert response.ok, f"Вход {email} через API завершился со статусом {response.status}"
+            context.storage_state(path=path)
+        finally:
+            context.close()
@@ -0,0 +1,204 @@
+import asyncio
+import logging
+import queue
+import threading
+from contextlib import contextmanager
+
+from api.async_api_manager import AsyncApiManager
+from enums.models import Roles
+from models.base_models import UserData, RegisterUserResponse
+from models.parsing import parse_json
+from tools.workers import WorkerNamespace
+from utils.data_generator import DataGenerator
+
+logger = logging.getLogger(__name__)
+
+
+class PooledUser:
+    """
+    Пользователь из пула: учетные данные и id созданного аккаунта.
+    """
+
+    def __init__(self, user_id, email, password, role):
+        self.id = user_id
+        self.email = email
+        self.password = password
+        self.role = role
+
+    @property
+    def creds(self):
+        """Возвращает кортеж (email, password)"""
+        return self.email, self.password
+
+
+class UserPool:
+    """
+    Пул заранее созданных пользователей по ролям.
+    Пользователи роли создаются конкурентно при первой выдаче, выдаются тестам эксклюзивно,
+    пересоздаются, если тест их изменил, и удаляются одним батчем при завершении сессии.
+    Данные пользователей генерируются под ключом пула (data_key), а не теста, который первым запросил роль.
+    """
+
+    def __init__(self, admin_creds, size=2, concurrency=10, data_key=None):
+        """
+        :param admin_creds: Кортеж (email, password) пользователя с правами на создание и удаление пользователей.
+        :param size: Количество пользователей каждой роли.
+        :param concurrency: Максимальное количество одновременных запросов.
+        :param data_key: Ключ генерации данных (по умолчанию "<session>:user_pool:<воркер>").
+        """
+        self.data_key = data_key or f"<session>:user_pool:{WorkerNamespace.worker_id()}"
+        self.admin_creds = admin_creds
+        self.size = size
+        self.concurrency = concurrency
+        self.created = {}
+        self._available = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def users_data(role, count):
+        """
+        Пакетная генерация данных count верифицированных пользователей с заданной ролью.
+        """
+        return [
+            UserData(**user, passwordRepeat=user["password"], roles=[role], verified=True, banned=False)
+            for user in DataGenerator.to_rows(DataGenerator.generate_users(count))
+        ]
+
+    def _run(self, coroutine_factory):
+        async def _with_api():
+            async with AsyncApiManager.create(limit=self.concurrency) as async_api:
+                await async_api.auth_api.authenticate(self.admin_creds)
+                return await coroutine_factory(async_api)
+
+        return asyncio.run(_with_api())
+
+    def _create_users(self, role, count):
+        """
+        Конкурентное создание count пользователей роли и прогрев их токенов в TOKEN_CACHE.
+        Созданные пользователи регистрируются для удаления до проверки ошибок, поэтому при частичном сбое
+        они не теряются: исключение первой неудачной операции пробрасывается после регистрации.
+        """
+        with DataGenerator.scope(self.data_key):
+            users_data = self.users_data(role, count)
+
+        async def _create(async_api):
+            results = await async_api.user_api.gather(
+                *(async_api.user_api.create_user(data) for data in users_data),
+                concurrency=self.concurrency,
+                return_exceptions=True
+            )
+            users, errors = [], []
+            for result, data in zip(results, users_data):
+                if isinstance(result, Exception):
+                    errors.append(result)
+                    continue
+                user = PooledUser(parse_json(result.content, RegisterUserResponse).id, data.email, data.password, role)
+                with self._lock:
+                    self.created[user.id] = user
+                users.append(user)
+
+            if errors:
+                raise errors[0]
+            await asyncio.gather(*(self._warm_token(async_api.session, user) for user in users))
+            return users
+
+        return self._run(_create)
+
+    @staticmethod
+    async def _warm_token(session, user):
+        await AsyncApiManager(session).auth_api.authenticate(user.creds)
+
+    def _queue(self, role):
+        with self._lock:
+            if role in self._available:
+                return self._available[role], False
+            self._available[role] = queue.Queue()
+            return self._available[role], True
+
+    def acquire(self, role=Roles.USER):
+        """
+        Эксклюзивная выдача пользователя роли. При первой выдаче роль наполняется size пользователями;
+        если все пользователи роли заняты, создается дополнительный.
+        """
+        available, is_new = self._queue(role)
+        if is_new:
+            for user in self._create_users(role, self.size):
+                available.put(user)
+        try:
+            return available.get_nowait()
+        except queue.Empty:
+            return self._create_users(role, 1)[0]
+
+    def release(self, user, dirty=False):
+        """
+        Возврат пользователя в пул.
+        Вызывается из finally в lease, поэтому ошибки удаления и пересоздания не пробрасываются
+        (иначе они скрыли бы исключение теста), а пишутся в лог; без замены пул роли уменьшается на одного,
+        недостающий пользователь будет создан при следующей выдаче.
+        :param dirty: Тест изменил пользователя - он удаляется и заменяется новым.
+        :return: Список id, которые удалить не удалось (остаются в created до shutdown).
+        """
+        if not dirty:
+            self._available[user.role].put(user)
+            return []
+
+        failed = self.delete([user.id])
+        if failed:
+            logger.warning("Не удалось удалить пользователя пула %s", user.id)
+        try:
+            replacement = self._create_users(user.role, 1)[0]
+        except Exception as e:
+            logger.warning("Не удалось пересоздать пользователя пула роли %s: %s: %s", user.role, type(e).__name__, e)
+        else:
+            self._available[user.role].put(replacement)
+        return failed
+
+    @contextmanager
+    def lease(self, role=Roles.USER, dirty=False):
+        """
+        Контекстный менеджер выдачи пользователя: acquire при входе и release при выходе.
+        """
+        user = self.acquire(role)
+        try:
+            yield user
+        finally:
+            self.release(user, dirty=dirty)
+
+    def delete(self, user_ids=None):
+        """
+        Параллельное удаление пользователей пула. Уже удаленные (404) считаются успешно удаленными.
+        :param user_ids: Удаляемые id (по умолчанию все созданные пулом пользователи).
+        Пользователи, которых удалить не удалось, остаются в created для повторной попытки или отчета.
+        :return: Список id, которые удалить не удалось.
+        """
+        with self._lock:
+            ids = list(self.created if user_ids is None else set(user_ids) & set(self.created))
+            users = {user_id: self.created.pop(user_id) for user_id in ids}
+        if not ids:
+            return []
+
+        async def _delete(async_api):
+            return await async_api.user_api.gather(
+                *(async_api.user_api.delete_user(user_id, expected_status=(200, 404)) for user_id in ids),
+                concurrency=self.concurrency,
+                return_exceptions=True
+            )
+
+        try:
+            results = self._run(_delete)
+        except Exception as e:
+            # Например, не удалась авторизация администратора: не удален ни один пользователь
+            results = [e] * len(ids)
+        failed = [user_id for user_id, result in zip(ids, results) if isinstance(result, Exception)]
+        with self._lock:
+            for user_id in failed:
+                self.created[user_id] = users[user_id]
+        return failed
+
+    def shutdown(self):
+        """
+        Удаление всех пользователей пула в конце сессии.
+        """
+        with self._lock:
+            self._available.clear()
+        return self.delete()
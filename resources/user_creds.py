@@ -1,9 +1,15 @@
 import os
 from dotenv import load_dotenv
 
+from constants.constants import CINESCOPE_TARGET, STUB_SUPER_ADMIN_EMAIL, STUB_SUPER_ADMIN_PASSWORD
+
 load_dotenv()
 
 
 class SuperAdminCreds:
-    USERNAME = os.getenv("SUPER_ADMIN_USERNAME")
-    PASSWORD = os.getenv("SUPER_ADMIN_PASSWORD")
+    if CINESCOPE_TARGET == "local":
+        USERNAME = os.getenv("SUPER_ADMIN_USERNAME", STUB_SUPER_ADMIN_EMAIL)
+        PASSWORD = os.getenv("SUPER_ADMIN_PASSWORD", STUB_SUPER_ADMIN_PASSWORD)
+    else:
+        USERNAME = os.getenv("SUPER_ADMIN_USERNAME")
+        PASSWORD = os.getenv("SUPER_ADMIN_PASSWORD")
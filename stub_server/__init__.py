@@ -0,0 +1 @@
+from stub_server.server import CinescopeStubServer
@@ -0,0 +1,29 @@
+import argparse
+
+from constants.constants import STUB_HOST, STUB_PORT, STUB_SUPER_ADMIN_EMAIL, STUB_SUPER_ADMIN_PASSWORD
+from stub_server.server import CinescopeStubServer
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="python -m stub_server",
+        description="Локальный стаб auth- и movies-сервисов Cinescope."
+    )
+    parser.add_argument("--host", default=STUB_HOST)
+    parser.add_argument("--port", type=int, default=STUB_PORT)
+    parser.add_argument("--super-admin-email", default=STUB_SUPER_ADMIN_EMAIL)
+    parser.add_argument("--super-admin-password", default=STUB_SUPER_ADMIN_PASSWORD)
+    args = parser.parse_args(argv)
+
+    server = CinescopeStubServer(args.host, args.port, args.super_admin_email, args.super_admin_password)
+    print(f"Cinescope stub is listening on {server.url}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
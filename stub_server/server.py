@@ -0,0 +1,395 @@
+import base64
+import datetime
+import hashlib
+import hmac
+import json
+import re
+import secrets
+import threading
+import time
+import uuid
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+from enums.models import Location, Roles
+
+TOKEN_TTL = 30 * 60
+MAX_PAGE_SIZE = 20
+GENRES = {1: "Драма", 2: "Комедия", 3: "Фантастика", 4: "Ужасы", 5: "Боевик"}
+EMAIL_PATTERN = re.compile(r"^[a-zA-Z0-9_.+-]+@[a-zA-Z0-9-]+\.[a-zA-Z0-9-.]+$")
+MOVIE_REQUIRED_FIELDS = ("name", "price", "description", "location", "published", "genreId")
+
+
+class HttpError(Exception):
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+        self.message = message
+
+
+def _is_int(value):
+    # bool - подкласс int, но в JSON true/false не являются числами
+    return isinstance(value, int) and not isinstance(value, bool)
+
+
+def _is_number(value):
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def _now():
+    return datetime.datetime.now(datetime.timezone.utc).isoformat(timespec="milliseconds").replace("+00:00", "Z")
+
+
+class CinescopeState:
+    """
+    Хранилище стаба: пользователи, фильмы и выданные токены. Все операции потокобезопасны.
+    """
+
+    def __init__(self, super_admin_email, super_admin_password):
+        self.lock = threading.Lock()
+        self.secret = secrets.token_bytes(16)
+        self.users = {}
+        self.movies = {}
+        self.next_movie_id = 1
+        self.add_user(super_admin_email, "Super Admin", super_admin_password, [Roles.SUPER_ADMIN.value], True, False)
+
+    # USERS
+
+    def add_user(self, email, full_name, password, roles, verified, banned):
+        if any(user["email"] == email for user in self.users.values()):
+            raise HttpError(409, "Пользователь с таким email уже зарегистрирован")
+        user = {
+            "id": str(uuid.uuid4()),
+            "email": email,
+            "fullName": full_name,
+            "password": password,
+            "verified": verified,
+            "banned": banned,
+            "roles": roles,
+            "createdAt": _now(),
+        }
+        self.users[user["id"]] = user
+        return user
+
+    def find_user(self, locator):
+        user = self.users.get(locator)
+        if user is None:
+            user = next((user for user in self.users.values() if user["email"] == locator), None)
+        return user
+
+    @staticmethod
+    def public_user(user):
+        return {key: value for key, value in user.items() if key != "password"}
+
+    # TOKENS
+
+    def issue_token(self, user):
+        def _encode(data):
+            return base64.urlsafe_b64encode(json.dumps(data).encode()).decode().rstrip("=")
+
+        header = _encode({"alg": "HS256", "typ": "JWT"})
+        payload = _encode({"id": user["id"], "email": user["email"], "exp": int(time.time()) + TOKEN_TTL})
+        signature = hmac.new(self.secret, f"{header}.{payload}".encode(), hashlib.sha256).hexdigest()
+        return f"{header}.{payload}.{signature}"
+
+    def user_by_token(self, authorization):
+        if not authorization or not authorization.lower().startswith("bearer "):
+            return None
+        token = authorization[7:]
+        try:
+            header, payload, signature = token.split(".")
+        except ValueError:
+            return None
+        expected = hmac.new(self.secret, f"{header}.{payload}".encode(), hashlib.sha256).hexdigest()
+        if not hmac.compare_digest(signature, expected):
+            return None
+        claims = json.loads(base64.urlsafe_b64decode(payload + "=" * (-len(payload) % 4)))
+        if claims["exp"] < time.time():
+            return None
+        return self.users.get(claims["id"])
+
+    # MOVIES
+
+    def add_movie(self, data):
+        movie = {
+            "id": self.next_movie_id,
+            "name": data["name"],
+            "price": data["price"],
+            "description": data["description"],
+            "imageUrl": data.get("imageUrl"),
+            "location": data["location"],
+            "published": data["published"],
+            "genreId": data["genreId"],
+            "genre": {"name": GENRES[data["genreId"]]},
+            "createdAt": _now(),
+            "rating": data.get("rating") or 0,
+        }
+        self.next_movie_id += 1
+        self.movies[movie["id"]] = movie
+        return movie
+
+
+class CinescopeStubHandler(BaseHTTPRequestHandler):
+    """
+    Обработчик запросов стаба. Маршруты повторяют auth- и movies-сервисы Cinescope.
+    """
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+    server_version = "CinescopeStub/1.0"
+
+    ROUTES = [
+        ("POST", re.compile(r"^/register$"), "register"),
+        ("POST", re.compile(r"^/login$"), "login"),
+        ("POST", re.compile(r"^/user$"), "create_user"),
+        ("GET", re.compile(r"^/user/(?P<locator>[^/]+)$"), "get_user"),
+        ("DELETE", re.compile(r"^/user/(?P<locator>[^/]+)$"), "delete_user"),
+        ("GET", re.compile(r"^/movies$"), "get_movies"),
+        ("POST", re.compile(r"^/movies$"), "create_movie"),
+        ("GET", re.compile(r"^/movies/(?P<movie_id>[^/]+)$"), "get_movie"),
+        ("PATCH", re.compile(r"^/movies/(?P<movie_id>[^/]+)$"), "update_movie"),
+        ("DELETE", re.compile(r"^/movies/(?P<movie_id>[^/]+)$"), "delete_movie"),
+    ]
+
+    @property
+    def state(self):
+        return self.server.state
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_GET(self):
+        self._dispatch("GET")
+
+    def do_POST(self):
+        self._dispatch("POST")
+
+    def do_PATCH(self):
+        self._dispatch("PATCH")
+
+    def do_DELETE(self):
+        self._dispatch("DELETE")
+
+    def _dispatch(self, method):
+        url = urlparse(self.path)
+        self.query = parse_qs(url.query)
+        length = int(self.headers.get("Content-Length") or 0)
+        raw_body = self.rfile.read(length) if length else b""
+        try:
+            try:
+                self.body = json.loads(raw_body) if raw_body else {}
+            except ValueError:
+                raise HttpError(400, "Некорректный JSON")
+            if not isinstance(self.body, dict):
+                raise HttpError(400, "Тело запроса должно быть JSON-объектом")
+            for route_method, pattern, handler in self.ROUTES:
+                match = pattern.match(url.path)
+                if match and route_method == method:
+                    with self.state.lock:
+                        status, payload = getattr(self, handler)(**match.groupdict())
+                    break
+            else:
+                raise HttpError(404, "Not Found")
+        except HttpError as e:
+            status, payload = e.status, {"message": e.message, "error": e.__class__.__name__, "statusCode": e.status}
+        except Exception as e:
+            # Ошибка обработчика стаба - ответ 500 вместо разрыва соединения
+            status, payload = 500, {"message": f"{type(e).__name__}: {e}", "error": "Internal Server Error",
+                                    "statusCode": 500}
+        self._send(status, payload)
+
+    def _send(self, status, payload):
+        content = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(content)))
+        self.end_headers()
+        self.wfile.write(content)
+
+    def _require(self, *roles):
+        user = self.state.user_by_token(self.headers.get("Authorization"))
+        if user is None:
+            raise HttpError(401, "Unauthorized")
+        if roles and not set(user["roles"]) & {role.value for role in roles}:
+            raise HttpError(403, "Forbidden resource")
+        return user
+
+    def _validate_user(self, data, require_repeat):
+        email, password = data.get("email"), data.get("password")
+        if not isinstance(email, str) or not EMAIL_PATTERN.match(email):
+            raise HttpError(400, "Некорректный email")
+        if not isinstance(data.get("fullName"), str) or not data["fullName"]:
+            raise HttpError(400, "Поле fullName обязательно")
+        if not isinstance(password, str) or not 8 <= len(password) <= 20:
+            raise HttpError(400, "Пароль должен содержать от 8 до 20 символов")
+        if require_repeat and data.get("passwordRepeat") != password:
+            raise HttpError(400, "Пароли не совпадают")
+
+    # AUTH
+
+    def register(self):
+        self._validate_user(self.body, require_repeat=True)
+        user = self.state.add_user(
+            self.body["email"], self.body["fullName"], self.body["password"], [Roles.USER.value], False, False
+        )
+        return 201, self.state.public_user(user)
+
+    def login(self):
+        user = self.state.find_user(self.body.get("email") or "")
+        if user is None or user["password"] != self.body.get("password") or user["banned"]:
+            raise HttpError(401, "Неверный логин или пароль")
+        return 200, {
+            "user": {key: user[key] for key in ("id", "email", "fullName", "roles")},
+            "accessToken": self.state.issue_token(user),
+            "refreshToken": secrets.token_hex(16),
+            "expiresIn": TOKEN_TTL * 1000,
+        }
+
+    # USERS
+
+    def create_user(self):
+        self._require(Roles.SUPER_ADMIN)
+        self._validate_user(self.body, require_repeat=False)
+        roles = self.body.get("roles") or [Roles.USER.value]
+        if not isinstance(roles, list) or not all(
+                isinstance(role, str) and role in Roles._value2member_map_ for role in roles):
+            raise HttpError(400, "Некорректная роль")
+        user = self.state.add_user(
+            self.body["email"], self.body["fullName"], self.body["password"], roles,
+            bool(self.body.get("verified", False)), bool(self.body.get("banned", False))
+        )
+        return 201, self.state.public_user(user)
+
+    def get_user(self, locator):
+        self._require(Roles.SUPER_ADMIN)
+        user = self.state.find_user(locator)
+        if user is None:
+            raise HttpError(404, "Пользователь не найден")
+        return 200, self.state.public_user(user)
+
+    def delete_user(self, locator):
+        self._require(Roles.SUPER_ADMIN)
+        user = self.state.find_user(locator)
+        if user is None:
+            raise HttpError(404, "Пользователь не найден")
+        del self.state.users[user["id"]]
+        return 200, self.state.public_user(user)
+
+    # MOVIES
+
+    def _find_movie(self, movie_id):
+        movie = self.state.movies.get(int(movie_id)) if movie_id.isdigit() else None
+        if movie is None:
+            raise HttpError(404, "Фильм не найден")
+        return movie
+
+    def _validate_movie(self, data, partial):
+        if not partial:
+            missing = [field for field in MOVIE_REQUIRED_FIELDS if field not in data]
+            if missing:
+                raise HttpError(400, f"Отсутствуют обязательные поля: {', '.join(missing)}")
+        if "name" in data and (not isinstance(data["name"], str) or not data["name"]):
+            raise HttpError(400, "Некорректное поле name")
+        if "price" in data and (not _is_number(data["price"]) or data["price"] < 0):
+            raise HttpError(400, "Некорректное поле price")
+        if "location" in data and (
+                not isinstance(data["location"], str) or data["location"] not in Location._value2member_map_):
+            raise HttpError(400, "Некорректное поле location")
+        if "genreId" in data and (not _is_int(data["genreId"]) or data["genreId"] not in GENRES):
+            raise HttpError(400, "Некорректное поле genreId")
+        if "published" in data and not isinstance(data["published"], bool):
+            raise HttpError(400, "Некорректное поле published")
+        if data.get("rating") is not None and (not _is_number(data["rating"]) or not 0 <= data["rating"] <= 5):
+            raise HttpError(400, "Некорректное поле rating")
+
+    def _query(self, name, cast=str, default=None):
+        values = self.query.get(name)
+        if not values:
+            return default
+        try:
+            return cast(values[0])
+        except ValueError:
+            raise HttpError(400, f"Некорректный параметр {name}")
+
+    def get_movies(self):
+        page_size = self._query("pageSize", int, 10)
+        page = self._query("page", int, 1)
+        if not 1 <= page_size <= MAX_PAGE_SIZE or page < 1:
+            raise HttpError(400, "Некорректные параметры пагинации")
+        min_price = self._query("minPrice", float, 0)
+        max_price = self._query("maxPrice", float, float("inf"))
+        genre_id = self._query("genreId", int)
+        published = self._query("published")
+        locations = [location for value in self.query.get("locations", []) for location in value.split(",")]
+
+        movies = [
+            movie for movie in self.state.movies.values()
+            if min_price <= movie["price"] <= max_price
+            and (genre_id is None or movie["genreId"] == genre_id)
+            and (published is None or movie["published"] == (published == "true"))
+            and (not locations or movie["location"] in locations)
+        ]
+        movies.sort(key=lambda movie: movie["createdAt"], reverse=self._query("createdAt") != "asc")
+        page_count = max((len(movies) + page_size - 1) // page_size, 1)
+        return 200, {
+            "movies": movies[(page - 1) * page_size:page * page_size],
+            "count": len(movies),
+            "page": page,
+            "pageSize": page_size,
+            "pageCount": page_count,
+        }
+
+    def get_movie(self, movie_id):
+        return 200, self._find_movie(movie_id)
+
+    def create_movie(self):
+        self._require(Roles.SUPER_ADMIN)
+        self._validate_movie(self.body, partial=False)
+        if any(movie["name"] == self.body["name"] for movie in self.state.movies.values()):
+            raise HttpError(409, "Фильм с таким названием уже существует")
+        return 201, self.state.add_movie(self.body)
+
+    def update_movie(self, movie_id):
+        self._require(Roles.SUPER_ADMIN)
+        movie = self._find_movie(movie_id)
+        self._validate_movie(self.body, partial=True)
+        movie.update({key: value for key, value in self.body.items() if key in MOVIE_REQUIRED_FIELDS + ("imageUrl", "rating")})
+        movie["genre"] = {"name": GENRES[movie["genreId"]]}
+        return 200, movie
+
+    def delete_movie(self, movie_id):
+        self._require(Roles.SUPER_ADMIN)
+        movie = self._find_movie(movie_id)
+        del self.state.movies[movie["id"]]
+        return 200, movie
+
+
+class CinescopeStubServer(ThreadingHTTPServer):
+    """
+    Локальный стаб auth- и movies-сервисов Cinescope.
+    Оба сервиса обслуживаются одним портом: пути /login, /register, /user не пересекаются с /movies.
+    """
+    daemon_threads = True
+
+    def __init__(self, host, port, super_admin_email, super_admin_password):
+        super().__init__((host, port), CinescopeStubHandler)
+        self.state = CinescopeState(super_admin_email, super_admin_password)
+        self._thread = None
+
+    @property
+    def url(self):
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self):
+        """
+        Запуск сервера в фоновом потоке текущего процесса.
+        """
+        self._thread = threading.Thread(target=self.serve_forever, name="cinescope-stub", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self.shutdown()
+        self.server_close()
+        if self._thread is not None:
+            self._thread.join()
@@ -0,0 +1,87 @@
+import asyncio
+
+import allure
+
+from api.async_api_manager import AsyncApiManager
+from models.base_models import MovieDBModel, MoviesDataResponse
+
+
+@allure.epic("Тестирование работы асинхронного ApiManager")
+class TestAsyncApi:
+    @allure.title("Тест на конкурентное создание и удаление фильмов")
+    @allure.description("""
+    Этот тест проверяет конкурентное создание и удаление фильмов через AsyncApiManager.
+    Шаги:
+    1. Авторизация супер админа в асинхронной сессии.
+    2. Конкурентное создание фильмов.
+    3. Конкурентное удаление фильмов.
+    """)
+    @allure.severity(allure.severity_level.NORMAL)
+    def test_concurrent_create_delete_movies(self, super_admin, test_movie_data):
+        """
+        Тест на конкурентное создание и удаление фильмов
+        """
+        async def scenario():
+            async with AsyncApiManager.create(limit=10) as async_api:
+                with allure.step("Авторизация супер админа в асинхронной сессии"):
+                    await async_api.auth_api.authenticate(super_admin.creds)
+
+                with allure.step("Конкурентное создание фильмов"):
+                    movies_data = [
+                        test_movie_data.model_copy(update={"name": f"{test_movie_data.name} {i}"}) for i in range(5)
+                    ]
+                    responses = await async_api.movies_api.gather(
+                        *(async_api.movies_api.create_movie(data) for data in movies_data)
+                    )
+                    movies = [MoviesDataResponse(**response.json()) for response in responses]
+                    assert {movie.name for movie in movies} == {data.name for data in movies_data}
+
+                with allure.step("Конкурентное удаление фильмов"):
+                    await async_api.movies_api.gather(
+                        *(async_api.movies_api.delete_movie(movie.id) for movie in movies)
+                    )
+
+        asyncio.run(scenario())
+
+    @allure.title("Тест на сверку конкурентно созданных фильмов с базой данных")
+    @allure.description("""
+    Этот тест проверяет, что фильмы, созданные конкурентно через AsyncApiManager, попадают в базу и удаляются из нее.
+    Шаги:
+    1. Авторизация супер админа в асинхронной сессии.
+    2. Конкурентное создание фильмов.
+    3. Проверка всех фильмов в БД одним запросом.
+    4. Конкурентное удаление фильмов с ожиданием их исчезновения из БД.
+    """)
+    @allure.severity(allure.severity_level.NORMAL)
+    def test_concurrent_movies_in_db(self, super_admin, test_movie_data, async_db_verifier):
+        """
+        Тест на сверку результатов API с базой данных
+        """
+        async def scenario():
+            async with AsyncApiManager.create(limit=10) as async_api, async_db_verifier() as db:
+                with allure.step("Авторизация супер админа в асинхронной сессии"):
+                    await async_api.auth_api.authenticate(super_admin.creds)
+
+                with allure.step("Конкурентное создание фильмов"):
+                    movies_data = [
+                        test_movie_data.model_copy(update={"name": f"{test_movie_data.name} {i}"}) for i in range(5)
+                    ]
+                    responses = await async_api.movies_api.gather(
+                        *(async_api.movies_api.create_movie(data) for data in movies_data)
+                    )
+                    movies = [MoviesDataResponse(**response.json()) for response in responses]
+
+                with allure.step("Проверка всех фильмов в БД одним запросом"):
+                    movies_from_db = await db.wait_for(
+                        MovieDBModel, MovieDBModel.id, [movie.id for movie in movies],
+                        check=lambda movie_from_db: movie_from_db.price == test_movie_data.price,
+                    )
+                    assert len(movies_from_db) == len(movies), "Не все фильмы попали в базу данных"
+
+                with allure.step("Конкурентное удаление фильмов с ожиданием их исчезновения из БД"):
+                    await asyncio.gather(
+                        async_api.movies_api.gather(*(async_api.movies_api.delete_movie(movie.id) for movie in movies)),
+                        db.wait_for(MovieDBModel, MovieDBModel.id, [movie.id for movie in movies], exists=False),
+                    )
+
+        asyncio.run(scenario())
@@ -1,6 +1,7 @@
 import pytest
 
-from models.base_models import RegisterUserResponse, UserDBModel
+from custom_requester.json_body import JsonBody
+from models.base_models import RegisterUserResponse
 from resources.user_creds import SuperAdminCreds
 
 
@@ -52,7 +53,19 @@ class TestAuthAPI:
         # Отправляю запрос на авторизацию пользователя
         api_manager.auth_api.login_user(login_data=login_data, expected_status=expected_status)
 
-    def test_register_user_db_session(self, api_manager, test_user, db_session):
+    def test_login_with_prepared_body(self, api_manager):
+        """
+        Тест авторизации с заранее сериализованным телом запроса.
+        """
+        login_body = JsonBody({"email": SuperAdminCreds.USERNAME, "password": SuperAdminCreds.PASSWORD})
+
+        # Одно и то же тело отправляется дважды без повторной сериализации
+        for _ in range(2):
+            response = api_manager.auth_api.login_user(login_body)
+            assert response.request.body == login_body.content
+            assert "accessToken" in response.json(), "Токен доступа отсутствует в ответе"
+
+    def test_register_user_db_session(self, api_manager, super_admin, test_user, db_helper):
         """
         Тест на регистрацию пользователя с проверкой в базе данных.
         """
@@ -60,15 +73,39 @@ class TestAuthAPI:
         response = api_manager.auth_api.register_user(test_user)
         register_user_response = RegisterUserResponse(**response.json())
 
-        # Проверяем добавил ли сервис Auth нового пользователя в базу данных
-        users_from_db = db_session.query(UserDBModel).filter(UserDBModel.id == register_user_response.id)
-
-        # получили обьект из бзы данных и проверили что он действительно существует в единственном экземпляре
-        assert users_from_db.count() == 1, "обьект не попал в базу данных"
-        # Достаем первый и единственный обьект из списка полученных
-        user_from_db = users_from_db.first()
+        # Проверяем добавил ли сервис Auth нового пользователя в базу данных (поиск по первичному ключу)
+        user_from_db = db_helper.get_user_by_id(register_user_response.id)
+        assert user_from_db is not None, "обьект не попал в базу данных"
         # можем осуществить проверку всех полей в базе данных например Email
         assert user_from_db.email == test_user.email, "Email не совпадает"
+        assert db_helper.get_user_by_email(test_user.email).id == user_from_db.id, "Пользователь не найден по email"
+
+        # Пользователь создан сервисом, а не в транзакции db_session - удаляем его через API
+        super_admin.api.user_api.delete_user(user_from_db.id)
+
+    def test_identities_share_transport(self, super_admin, common_user):
+        """
+        Тест на изоляцию идентичностей, работающих поверх общего пула соединений.
+        """
+        # Проверки: пул соединений общий, сессии с cookies и токены у каждой идентичности свои
+        super_admin_session, common_user_session = super_admin.api.session, common_user.api.session
+        assert super_admin_session is not common_user_session
+        assert super_admin_session.cookies is not common_user_session.cookies
+        assert super_admin_session.get_adapter("https://") is common_user_session.get_adapter("https://")
+        assert super_admin.api.auth.token != common_user.api.auth.token
+        assert "Authorization" not in super_admin.api.session.headers
+
+        response = common_user.api.user_api.get_user(common_user.email, expected_status=403)
+        assert response.request.headers["Authorization"] == f"Bearer {common_user.api.auth.token}"
+
+    def test_reauth_on_invalid_token(self, super_admin):
+        """
+        Тест на прозрачную переавторизацию идентичности после ответа 401.
+        """
+        super_admin.api.auth.token = "invalid-token"
+
+        # Запрос с невалидным токеном получает 401, идентичность логинится заново и повторяет запрос
+        response = super_admin.api.user_api.get_user(super_admin.email)
 
-        db_session.delete(user_from_db)
-        db_session.commit()
+        assert response.json()["email"] == super_admin.email
+        assert super_admin.api.auth.token != "invalid-token"
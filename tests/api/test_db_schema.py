@@ -0,0 +1,22 @@
+import allure
+
+from db_requester.db_schema import SchemaValidator
+
+
+@allure.epic("Тестирование схемы базы данных")
+class TestDBSchema:
+    @allure.title("Тест на соответствие ORM-моделей схеме базы данных")
+    @allure.description("""
+    Этот тест проверяет, что таблицы users, genres и movies соответствуют ORM-моделям.
+    Шаги:
+    1. Интроспекция схемы базы данных.
+    2. Проверка таблиц, колонок, типов и индексов.
+    """)
+    @allure.severity(allure.severity_level.NORMAL)
+    def test_models_match_db_schema(self, db_engine):
+        """
+        Тест на соответствие ORM-моделей схеме базы данных
+        """
+        with allure.step("Интроспекция схемы и проверка таблиц, колонок, типов и индексов"):
+            problems = SchemaValidator.validate(db_engine)
+            assert not problems, "Схема базы не соответствует моделям:\n" + "\n".join(problems)
@@ -6,7 +6,7 @@ import pytest
 
 from conftest import test_movie_data, common_admin, super_admin
 from constants.constants import INVALID_MOVIE_ID
-from models.base_models import MovieDBModel, MoviesDataResponse
+from models.base_models import MoviesDataResponse
 
 
 @allure.epic("Тестирование работы MoviesAPI")
@@ -33,7 +33,7 @@ class TestMoviesAPI:
     @allure.description("""
         Этот тест проверяет наличие информации о фильмах в сервисе с фильтром для поиска.
         Шаги:
-        1. Получение списка фильмов c фильтром для поиска.
+        1. Получение всех страниц списка фильмов c фильтром для поиска.
         2. Проверка данных на соответствие фильтру.
         """)
     @allure.severity(allure.severity_level.NORMAL)
@@ -45,13 +45,34 @@ class TestMoviesAPI:
         """
         Тест на получение информации о фильмах с фильтром
         """
-        with allure.step("Получение списка фильмов c фильтром для поиска"):
-            response = api_manager.movies_api.get_movies(params).json()
+        with allure.step("Получение всех страниц списка фильмов c фильтром для поиска"):
+            movies = api_manager.movies_api.iter_movies(params, page_size=20, prefetch=True)
 
         with allure.step("Проверка данных на соответствие фильтру"):
-            for movie in response["movies"]:
-                assert (params["minPrice"] < movie["price"] < params["maxPrice"]), "Ошибка фильтрации по полю price"
-                assert movie["genreId"] == params["genreId"], "Ошибка фильтрации по полю genreId"
+            for movie in movies:
+                assert (params["minPrice"] < movie.price < params["maxPrice"]), "Ошибка фильтрации по полю price"
+                assert movie.genreId == params["genreId"], "Ошибка фильтрации по полю genreId"
+
+    @allure.title("Тест на получение страницы фильмов без валидации ответа")
+    @allure.description("""
+        Этот тест проверяет, что доверенный режим разбора (model_construct) дает те же данные, что и валидация.
+        Шаги:
+        1. Получение страницы фильмов с валидацией и без нее.
+        2. Сравнение данных.
+        """)
+    @allure.severity(allure.severity_level.MINOR)
+    def test_get_movies_trusted_model(self, api_manager):
+        """
+        Тест на получение страницы фильмов без валидации ответа
+        """
+        with allure.step("Получение страницы фильмов с валидацией и без нее"):
+            page = api_manager.movies_api.get_movies_model({"pageSize": 20})
+            trusted_page = api_manager.movies_api.get_movies_model({"pageSize": 20}, trusted=True)
+
+        with allure.step("Сравнение данных"):
+            assert trusted_page.count == page.count, "Количество фильмов не совпадает"
+            assert [movie.id for movie in trusted_page.movies] == [movie.id for movie in page.movies]
+            assert all(isinstance(movie, MoviesDataResponse) for movie in trusted_page.movies)
 
     @allure.title("Тест на создание фильма")
     @allure.description("""
@@ -87,6 +108,53 @@ class TestMoviesAPI:
         with allure.step("Удаление фильма после тестов"):
             super_admin.api.movies_api.delete_movie(movie.id)
 
+    @allure.title("Тест на получение массово созданных фильмов")
+    @allure.description("""
+    Этот тест проверяет получение фильмов, созданных конкурентно через сервис подготовки данных.
+    Шаги:
+    1. Конкурентное создание фильмов.
+    2. Получение каждого фильма по ID.
+    3. Проверка данных.
+    """)
+    @allure.severity(allure.severity_level.NORMAL)
+    def test_get_provisioned_movies(self, api_manager, provision_movies):
+        """
+        Тест на получение массово созданных фильмов
+        """
+        with allure.step("Конкурентное создание фильмов"):
+            movies = provision_movies(5, location="SPB")
+
+        with allure.step("Получение каждого фильма по ID и проверка данных"):
+            for movie in movies:
+                movie_from_api = api_manager.movies_api.get_movie_model(movie.id)
+                assert movie_from_api.name == movie.name, "Название фильмов не совпадает"
+                assert movie_from_api.location == "SPB", "Локация фильма не совпадает"
+
+    @allure.title("Тест на фильтрацию фильмов, созданных напрямую в базе")
+    @allure.description("""
+    Этот тест проверяет, что фильмы, созданные в базе в обход API, отдаются фильтрами /movies и по ID.
+    Шаги:
+    1. Массовое создание фильмов в базе.
+    2. Получение фильмов с фильтром по цене и локации.
+    3. Получение фильма по ID.
+    """)
+    @allure.severity(allure.severity_level.NORMAL)
+    def test_filter_seeded_movies(self, api_manager, db_seeder):
+        """
+        Тест на фильтрацию фильмов, созданных напрямую в базе
+        """
+        with allure.step("Массовое создание фильмов в базе"):
+            movies = db_seeder.seed_movies(50, price=777, location="MSK")
+
+        with allure.step("Получение фильмов с фильтром по цене и локации"):
+            params = {"minPrice": 776, "maxPrice": 778, "locations": "MSK"}
+            movie_ids = {movie.id for movie in api_manager.movies_api.iter_movies(params)}
+            assert {movie.id for movie in movies} <= movie_ids, "Не все созданные в базе фильмы найдены фильтром"
+
+        with allure.step("Получение фильма по ID"):
+            movie_from_api = api_manager.movies_api.get_movie_model(movies[0].id)
+            assert movie_from_api.name == movies[0].name, "Название фильмов не совпадает"
+
     @allure.title("Тест на обновление фильма")
     @allure.description("""
     Этот тест проверяет обновление фильма.
@@ -187,7 +255,7 @@ class TestMoviesAPI:
     7. Проверка, что в конце тестирования фильма с таким названием действительно нет в базе.
     """)
     @allure.severity(allure.severity_level.CRITICAL)
-    def test_create_delete_movie(self, super_admin, db_session, test_movie_data):
+    def test_create_delete_movie(self, super_admin, db_helper, test_movie_data):
         """
         Тест на проверку работы БД при создании и удалении фильма
         """
@@ -196,8 +264,7 @@ class TestMoviesAPI:
             movie = test_movie_data
 
         with allure.step("Проверка, что на данный момент такого фильма нет в БД"):
-            movies_from_db = db_session.query(MovieDBModel).filter(MovieDBModel.name == movie.name)
-            assert movies_from_db.count() == 0, "В базе уже присутствует фильм с таким названием"
+            assert not db_helper.get_movies_by_name(movie.name), "В базе уже присутствует фильм с таким названием"
 
         with allure.step("Создание тестового фильма"):
             response = super_admin.api.movies_api.create_movie(movies_data=movie)
@@ -205,9 +272,10 @@ class TestMoviesAPI:
             created_movie = MoviesDataResponse(**response.json())
 
         with allure.step("Проверка, что запись о фильме появилась в бд"):
-            movies_from_db = db_session.query(MovieDBModel).filter(MovieDBModel.name == created_movie.name)
-            assert movies_from_db.one(), "В базе уже присутствует фильм с таким названием"
-            movie_from_db = movies_from_db.first()
+            movie_from_db = db_helper.get_movie_by_id(created_movie.id)
+            assert movie_from_db is not None, "Фильм не попал в базу данных"
+            assert movie_from_db.name == created_movie.name, "Название фильма в базе не совпадает"
+            assert movie_from_db.rating == created_movie.rating, "Рейтинг фильма в базе не совпадает"
 
         with allure.step("Проверка что сервис заполнил верно created_at с погрешностью в 5 минут"):
             assert movie_from_db.created_at >= (
@@ -217,9 +285,8 @@ class TestMoviesAPI:
         with allure.step("Удаление тестового фильм из базы данных"):
             super_admin.api.movies_api.delete_movie(movie_id=created_movie.id)
 
-        with allure.step("Проверка, что в конце тестирования фильма с таким названием действительно нет в базе"):
-            movies_from_db = db_session.query(MovieDBModel).filter(MovieDBModel.name == created_movie.name)
-            assert movies_from_db.count() == 0, "Фильм не был удален из базы!"
+        with allure.step("Проверка, что в конце тестирования фильма действительно нет в базе"):
+            assert not db_helper.movie_exists(created_movie.id), "Фильм не был удален из базы!"
 
     # INVALID TESTS
     @allure.title("Тест на получение информации о фильме по несуществующему id")
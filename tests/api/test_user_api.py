@@ -57,16 +57,10 @@ class TestUser:
             user = RegisterUserResponse(**response.json())
 
         with allure.step("Получаю пользователя по id созданного ранее пользователя"):
-            response_by_id = super_admin.api.user_api.get_user(user.id)
-
-        with allure.step("Десериализация ответа в объект RegisterUserResponse"):
-            user_by_id = RegisterUserResponse(**response_by_id.json())
+            user_by_id = super_admin.api.user_api.get_user_model(user.id)
 
         with allure.step("Получаю пользователя по email созданного ранее пользователя"):
-            response_by_email = super_admin.api.user_api.get_user(user.email)
-
-        with allure.step("Десериализация ответа в объект RegisterUserResponse"):
-            user_by_email = RegisterUserResponse(**response_by_email.json())
+            user_by_email = super_admin.api.user_api.get_user_model(user.email)
 
         with allure.step("Проверка данных"):
             assert user == user_by_id == user_by_email, "Содержание ответов должно быть идентичным"
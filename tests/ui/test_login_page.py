@@ -1,7 +1,7 @@
 import allure
 import pytest
 
-from models.page_object_models import CinescopLoginPage
+from models.page_object_models import CinescopLoginPage, CinescopProfilePage
 
 
 @allure.epic("Тестирование UI")
@@ -19,3 +19,14 @@ class TestLoginUser:
         login_page.assert_was_redirect_to_home_page()
         login_page.make_screenshot_and_attach_to_allure()
         login_page.assert_alert_was_pop_us()
+
+    @allure.title("Открытие сайта под сохраненной авторизацией")
+    def test_open_with_storage_state(self, user_page):
+        profile_page = CinescopProfilePage(user_page)
+
+        # Вход не выполняется: контекст создан из сохраненного состояния пользователя,
+        # поэтому защищенная страница открывается без редиректа на /login
+        profile_page.open()
+
+        profile_page.assert_user_is_authorized()
+        profile_page.make_screenshot_and_attach_to_allure()
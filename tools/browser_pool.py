@@ -0,0 +1,162 @@
+import itertools
+import os
+import re
+from collections import defaultdict, deque
+
+from constants.constants import UI_HOME_PAGE_URL
+
+# 1 - браузеры без окна (CI, машины без дисплея), 0 - с окном для локальной отладки
+HEADLESS = os.getenv("CINESCOPE_HEADLESS", "1") == "1"
+UI_BROWSER = os.getenv("CINESCOPE_UI_BROWSER", "chromium")
+# Браузерных процессов на xdist-воркер; контексты распределяются по ним по очереди
+BROWSERS_PER_WORKER = int(os.getenv("CINESCOPE_BROWSERS_PER_WORKER", 1))
+# Сколько тестов обслуживает один контекст, прежде чем он закрывается (1 - новый контекст на каждый тест)
+CONTEXT_MAX_USES = int(os.getenv("CINESCOPE_CONTEXT_MAX_USES", 20))
+# Сколько контекстов профиля по умолчанию создается заранее
+WARM_CONTEXTS = int(os.getenv("CINESCOPE_WARM_CONTEXTS", 1))
+# Профиль блокировки ресурсов по умолчанию (см. UI_PROFILES); отдельный тест задает свой маркером ui_profile
+DEFAULT_UI_PROFILE = os.getenv("CINESCOPE_UI_PROFILE", "fast")
+DEFAULT_UI_TIMEOUT = 30000
+
+_ANALYTICS = re.compile(
+    r"^https?://([^/]*\.)?(google-analytics\.com|googletagmanager\.com|doubleclick\.net"
+    r"|mc\.yandex\.ru|mc\.yandex\.com|connect\.facebook\.net)/"
+)
+_IMAGES = re.compile(r"\.(png|jpe?g|gif|webp|avif|svg|ico)(\?.*)?$", re.IGNORECASE)
+_FONTS = re.compile(r"\.(woff2?|ttf|otf|eot)(\?.*)?$", re.IGNORECASE)
+_MEDIA = re.compile(r"\.(mp4|webm|ogg|mp3|wav)(\?.*)?$", re.IGNORECASE)
+
+# Блокируемые запросы профиля. Шаблоны сопоставляет сам Playwright, поэтому остальные запросы
+# не проходят через Python-обработчик и не замедляются
+UI_PROFILES = {
+    "full": (),
+    "no_analytics": (_ANALYTICS,),
+    "fast": (_ANALYTICS, _IMAGES, _FONTS, _MEDIA),
+}
+
+
+def _abort(route):
+    route.abort()
+
+
+class BrowserPool:
+    """
+    Пул браузеров xdist-воркера.
+    Запускает до BROWSERS_PER_WORKER браузерных процессов (по требованию) и выдает тестам контексты
+    из теплого пула: после теста контекст очищается и возвращается в пул, после CONTEXT_MAX_USES тестов - закрывается.
+    В каждом контексте блокируются ресурсы профиля (изображения, шрифты, аналитика).
+    """
+
+    def __init__(self, playwright, size=BROWSERS_PER_WORKER, browser_name=UI_BROWSER, headless=HEADLESS,
+                 max_uses=CONTEXT_MAX_USES, warm=WARM_CONTEXTS, profile=DEFAULT_UI_PROFILE,
+                 timeout=DEFAULT_UI_TIMEOUT):
+        """
+        :param playwright: Объект Playwright (фикстура playwright).
+        :param size: Количество браузерных процессов.
+        :param browser_name: chromium, firefox или webkit.
+        :param headless: Запуск без окна.
+        :param max_uses: Сколько раз контекст выдается до закрытия.
+        :param warm: Сколько контекстов профиля profile создать сразу.
+        :param profile: Профиль блокировки ресурсов по умолчанию.
+        :param timeout: Таймаут действий в контекстах, мс.
+        """
+        self.playwright = playwright
+        self.size = size
+        self.browser_name = browser_name
+        self.headless = headless
+        self.max_uses = max_uses
+        self.profile = profile
+        self.timeout = timeout
+        self.browsers = []
+        self._next_browser = itertools.count()
+        self._idle = defaultdict(deque)
+        # Выданные контексты: контекст -> профиль
+        self._leased = {}
+        # Количество выдач каждого открытого контекста
+        self._uses = {}
+
+        for _ in range(warm):
+            context = self.new_context(profile)
+            self._uses[context] = 0
+            self._idle[profile].append(context)
+
+    def browser(self):
+        """
+        Следующий браузер пула по очереди; браузерные процессы запускаются по мере необходимости.
+        """
+        index = next(self._next_browser) % self.size
+        if index >= len(self.browsers):
+            args = ["--disable-dev-shm-usage"] if self.browser_name == "chromium" else []
+            browser_type = getattr(self.playwright, self.browser_name)
+            self.browsers.append(browser_type.launch(headless=self.headless, args=args))
+        return self.browsers[index]
+
+    def new_context(self, profile=None, **kwargs):
+        """
+        Новый контекст с блокировкой ресурсов профиля; закрывается вызывающим.
+        :param profile: Профиль из UI_PROFILES (по умолчанию профиль пула).
+        :param kwargs: Параметры browser.new_context (например, storage_state).
+        """
+        profile = profile or self.profile
+        if profile not in UI_PROFILES:
+            raise ValueError(f"Неизвестный профиль UI: {profile}. Доступны: {', '.join(UI_PROFILES)}")
+        context = self.browser().new_context(**kwargs)
+        context.set_default_timeout(self.timeout)
+        for pattern in UI_PROFILES[profile]:
+            context.route(pattern, _abort)
+        return context
+
+    def acquire(self, profile=None):
+        """
+        Контекст из теплого пула профиля (или новый, если свободных нет).
+        """
+        profile = profile or self.profile
+        idle = self._idle[profile]
+        context = idle.popleft() if idle else self.new_context(profile)
+        self._uses[context] = self._uses.get(context, 0) + 1
+        self._leased[context] = profile
+        return context
+
+    def release(self, context):
+        """
+        Возврат контекста: после max_uses выдач или при ошибке очистки контекст закрывается,
+        иначе очищается (страницы, cookies, разрешения, localStorage стенда) и возвращается в пул.
+        """
+        profile = self._leased.pop(context)
+        if self._uses[context] >= self.max_uses:
+            self._close(context)
+            return
+        try:
+            self._reset(context)
+        except Exception:
+            self._close(context)
+            return
+        self._idle[profile].append(context)
+
+    @staticmethod
+    def _reset(context):
+        for page in context.pages:
+            page.close()
+        context.clear_cookies()
+        context.clear_permissions()
+        # localStorage и sessionStorage стенда очищаются на пустой странице его origin, без запроса к стенду
+        page = context.new_page()
+        page.route(UI_HOME_PAGE_URL, lambda route: route.fulfill(status=200, content_type="text/html", body=""))
+        page.goto(UI_HOME_PAGE_URL)
+        page.evaluate("() => { localStorage.clear(); sessionStorage.clear(); }")
+        page.close()
+
+    def _close(self, context):
+        self._uses.pop(context, None)
+        context.close()
+
+    def close(self):
+        for idle in self._idle.values():
+            while idle:
+                self._close(idle.popleft())
+        for context in list(self._leased):
+            self._close(context)
+        self._leased.clear()
+        for browser in self.browsers:
+            browser.close()
+        self.browsers.clear()
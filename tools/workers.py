@@ -0,0 +1,87 @@
+import os
+import uuid
+
+# Идентификатор прогона: у xdist-воркеров общий (PYTEST_XDIST_TESTRUNUID), без xdist - свой для процесса.
+# Контроллер выставляет тот же идентификатор себе и воркерам (см. pytest_configure в conftest.py)
+_RUN_UID = uuid.uuid4().hex
+
+# Фикстуры, ради которых тесты группируются на одном воркере, и имена их групп
+EXPENSIVE_FIXTURES = {
+    "db_engine": "db",
+    "db_session": "db",
+    "async_db_verifier": "db",
+    "db_seeder": "db",
+    "browser_pool": "ui",
+    "browser": "ui",
+    "context": "ui",
+    "page": "ui",
+    "authenticated_context": "ui",
+    "user_page": "ui",
+}
+
+
+class WorkerNamespace:
+    """
+    Пространство имен текущего xdist-воркера: префиксы тестовых данных, чтобы параллельные
+    воркеры (и разные прогоны) не пересекались на общих данных стенда.
+    """
+
+    @staticmethod
+    def worker_id():
+        """
+        Возвращает id воркера ("gw0", "gw1", ...) или "master" при запуске без xdist.
+        """
+        return os.getenv("PYTEST_XDIST_WORKER", "master")
+
+    @staticmethod
+    def worker_index():
+        """
+        Возвращает номер воркера (0 для master).
+        """
+        worker = WorkerNamespace.worker_id()
+        return int(worker[2:]) if worker.startswith("gw") else 0
+
+    @staticmethod
+    def worker_count():
+        return int(os.getenv("PYTEST_XDIST_WORKER_COUNT", 1))
+
+    @staticmethod
+    def run_uid():
+        """
+        Полный идентификатор прогона (значение --testrunuid для xdist).
+        """
+        return os.getenv("PYTEST_XDIST_TESTRUNUID") or _RUN_UID
+
+    @staticmethod
+    def run_id():
+        """
+        Короткий идентификатор прогона, общий для контроллера и всех воркеров.
+        """
+        return WorkerNamespace.run_uid()[:6]
+
+    @staticmethod
+    def prefix():
+        """
+        Префикс вида "a1b2c3-gw3": идентификатор прогона и воркера.
+        """
+        return f"{WorkerNamespace.run_id()}-{WorkerNamespace.worker_id()}"
+
+    @staticmethod
+    def name(value):
+        """
+        Добавляет к имени префикс пространства имен воркера.
+        """
+        return f"[{WorkerNamespace.prefix()}] {value}"
+
+    @staticmethod
+    def xdist_group(fixturenames, module_name):
+        """
+        Группа xdist для теста по требующимся ему дорогим фикстурам.
+        Тесты одного модуля с общей дорогой фикстурой попадают на один воркер,
+        чтобы фикстура (соединение с БД, браузер) поднималась на как можно меньшем числе воркеров.
+        :return: Имя группы или None, если дорогих фикстур нет.
+        """
+        groups = sorted({EXPENSIVE_FIXTURES[name] for name in fixturenames if name in EXPENSIVE_FIXTURES})
+        if not groups:
+            return None
+        return f"{'+'.join(groups)}:{module_name}"
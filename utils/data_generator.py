@@ -1,46 +1,129 @@
+import os
 import random
 import string
+import threading
+from contextlib import contextmanager
 
-from faker import Faker
+from utils.data_replay import DATA_REPLAY, replayable
+from utils.faker_corpus import CORPUS_FACTORIES, FakerCorpus, live_faker
 
-faker = Faker('ru_RU')
+try:
+    import numpy as np
+except ImportError:  # numpy не обязателен: без него батчи генерируются на random
+    np = None
+
+# corpus (по умолчанию) - значения Faker выбираются из заранее собранного корпуса,
+# live - Faker вызывается на каждое значение (полное разнообразие, но медленный импорт и генерация)
+FAKER_MODE = os.getenv("CINESCOPE_FAKER", "corpus")
+CORPUS = FakerCorpus("ru_RU")
+
+# Генератор модуля: все методы DataGenerator используют его, а не глобальный random
+_rng = random.Random()
+
+TOKEN_ALPHABET = string.ascii_lowercase + string.digits
+PASSWORD_SPECIAL_CHARS = "?@#$%^&*|:"
+MOVIE_LOCATIONS = ("MSK", "SPB")
+# Размер пула фраз Faker, из которого собираются названия и описания в батчах
+BATCH_PHRASE_POOL = 256
 
 
 class DataGenerator:
+    # Токены, уже выданные в этом процессе батчами - для уникальности email и названий в пределах прогона
+    _issued_tokens = set()
+    _issued_lock = threading.Lock()
+    # Состояния генератора фиксированных ключей scope()
+    _scope_states = {}
+
+    @staticmethod
+    def seed(value):
+        """
+        Установка зерна генератора модуля (и Faker в режиме live) для воспроизводимых данных.
+        :param value: Зерно (int или str).
+        """
+        _rng.seed(value)
+        if FAKER_MODE == "live":
+            live_faker().seed_instance(value)
+
+    @staticmethod
+    def _get_state():
+        return _rng.getstate(), live_faker().random.getstate() if FAKER_MODE == "live" else None
+
+    @staticmethod
+    def _set_state(state):
+        rng_state, faker_state = state
+        _rng.setstate(rng_state)
+        if faker_state is not None:
+            live_faker().random.setstate(faker_state)
+
+    @staticmethod
+    @contextmanager
+    def scope(key):
+        """
+        Генерация данных под фиксированным ключом DATA_REPLAY.scope со своим генератором:
+        данные ключа не зависят от порядка тестов, генератор текущего теста после выхода продолжает с того же места.
+        :param key: Ключ, например "<session>:user_pool:gw0".
+        """
+        outer = DataGenerator._get_state()
+        with DATA_REPLAY.scope(key) as seed:
+            if key in DataGenerator._scope_states:
+                DataGenerator._set_state(DataGenerator._scope_states[key])
+            else:
+                DataGenerator.seed(seed)
+            try:
+                yield
+            finally:
+                DataGenerator._scope_states[key] = DataGenerator._get_state()
+                DataGenerator._set_state(outer)
 
     @staticmethod
+    def _faker_value(name):
+        """
+        Значение Faker из корпуса или, в режиме live, от самого Faker.
+        :param name: Одно из CORPUS_FACTORIES (first_name, last_name, catch_phrase, description).
+        """
+        if FAKER_MODE == "live":
+            return CORPUS_FACTORIES[name](live_faker())
+        return CORPUS.column(name).sample(_rng)
+
+    @staticmethod
+    @replayable("int")
     def generate_random_int(n: int) -> int:
         return int("".join(
-            random.choices(string.digits, k=n)
+            _rng.choices(string.digits, k=n)
         ))
 
 
     @staticmethod
+    @replayable("str")
     def generate_random_str():
         random_string = "".join(
-            random.choices(string.ascii_lowercase + string.digits, k=8)
+            _rng.choices(string.ascii_lowercase + string.digits, k=8)
         )
         return random_string
 
     @staticmethod
+    @replayable("email")
     def generate_random_email():
         random_string = "".join(
-            random.choices(string.ascii_lowercase + string.digits, k=8)
+            _rng.choices(string.ascii_lowercase + string.digits, k=8)
         )
         return f"kek{random_string}@gmail.com"
 
     @staticmethod
+    @replayable("id")
     def generate_random_id():
         random_string = "".join(
-            random.choices(string.ascii_lowercase + string.digits, k=8)
+            _rng.choices(string.ascii_lowercase + string.digits, k=8)
         )
         return f"test_id_{random_string}"
 
     @staticmethod
+    @replayable("name")
     def generate_random_name():
-        return f"{faker.first_name()} {faker.last_name()}"
+        return f"{DataGenerator._faker_value('first_name')} {DataGenerator._faker_value('last_name')}"
 
     @staticmethod
+    @replayable("password")
     def generate_random_password():
         """
         Генерация пароля, соответствующего требованиям:
@@ -50,30 +133,150 @@ class DataGenerator:
         - Длина от 8 до 20 символов.
         """
         # Гарантируем наличие хотя бы одной буквы и одной цифры
-        letters = random.choice(string.ascii_letters)
-        digits = random.choice(string.digits)
+        letters = _rng.choice(string.ascii_letters)
+        digits = _rng.choice(string.digits)
 
-        special_chars = "?@#$%^&*|:"
-        all_chars = string.ascii_letters + string.digits + special_chars
-        remaining_length = random.randint(6, 18)
-        remaining_chars = "".join(random.choices(all_chars, k=remaining_length))
+        all_chars = string.ascii_letters + string.digits + PASSWORD_SPECIAL_CHARS
+        remaining_length = _rng.randint(6, 18)
+        remaining_chars = "".join(_rng.choices(all_chars, k=remaining_length))
 
         password = list(letters + digits + remaining_chars)
-        random.shuffle(password)
+        _rng.shuffle(password)
 
         return "".join(password)
 
     @staticmethod
+    @replayable("movie")
     def generate_random_movie():
         """
         Генерация случайного фильма для тестов.
         """
         return {
-            "name": faker.catch_phrase(),
-            "price": random.randint(100, 1000),
-            "description": faker.text(max_nb_chars=200),
-            "location": random.choice(["MSK", "SPB"]),
+            "name": DataGenerator._faker_value("catch_phrase"),
+            "price": _rng.randint(100, 1000),
+            "description": DataGenerator._faker_value("description"),
+            "location": _rng.choice(MOVIE_LOCATIONS),
             "published": True,
-            "rating": random.randint(1, 5),
+            "rating": _rng.randint(1, 5),
             "genreId": 3,
         }
+
+    #### BATCH ####
+
+    @staticmethod
+    def _batch_rng(seed):
+        """
+        Генератор батча: от переданного зерна или от генератора модуля (тогда батч воспроизводим через seed()).
+        """
+        return random.Random(_rng.getrandbits(64) if seed is None else seed)
+
+    @staticmethod
+    def _tokens(rng, n, length=10):
+        """
+        n уникальных токенов из [a-z0-9], не выдававшихся ранее в этом процессе.
+        """
+        tokens = []
+        with DataGenerator._issued_lock:
+            issued = DataGenerator._issued_tokens
+            while len(tokens) < n:
+                missing = n - len(tokens)
+                if np is not None:
+                    alphabet = np.array(list(TOKEN_ALPHABET))
+                    codes = np.random.default_rng(rng.getrandbits(64)).integers(0, len(alphabet), (missing, length))
+                    candidates = ["".join(row) for row in alphabet[codes].tolist()]
+                else:
+                    candidates = ["".join(rng.choices(TOKEN_ALPHABET, k=length)) for _ in range(missing)]
+                for token in candidates:
+                    if token not in issued:
+                        issued.add(token)
+                        tokens.append(token)
+        return tokens
+
+    @staticmethod
+    def _integers(rng, low, high, n):
+        """
+        n случайных целых из [low, high]: numpy-массив, если numpy установлен, иначе список.
+        """
+        if np is not None:
+            return np.random.default_rng(rng.getrandbits(64)).integers(low, high + 1, n)
+        return [rng.randint(low, high) for _ in range(n)]
+
+    @staticmethod
+    def _sample(rng, values, n):
+        return [values[i] for i in DataGenerator._integers(rng, 0, len(values) - 1, n)]
+
+    @staticmethod
+    def _faker_column(rng, name, n):
+        """
+        n значений Faker для батча: выборка из корпуса или, в режиме live,
+        из пула не более чем BATCH_PHRASE_POOL значений Faker.
+        """
+        if FAKER_MODE == "live":
+            faker = live_faker()
+            faker.seed_instance(rng.getrandbits(64))
+            values = [CORPUS_FACTORIES[name](faker) for _ in range(min(n, BATCH_PHRASE_POOL))]
+        else:
+            values = CORPUS.column(name)
+        return DataGenerator._sample(rng, values, n)
+
+    @staticmethod
+    @replayable("users")
+    def generate_users(n, seed=None):
+        """
+        Пакетная генерация данных n пользователей в колоночном виде.
+        Email уникальны в пределах батча и всего прогона (процесса).
+        :param n: Количество пользователей.
+        :param seed: Зерно батча (по умолчанию - от генератора модуля, см. DataGenerator.seed).
+        :return: Словарь колонок {"email": [...], "fullName": [...], "password": [...]}.
+        """
+        rng = DataGenerator._batch_rng(seed)
+        first_names = DataGenerator._faker_column(rng, "first_name", n)
+        last_names = DataGenerator._faker_column(rng, "last_name", n)
+
+        password_chars = string.ascii_letters + string.digits + PASSWORD_SPECIAL_CHARS
+        passwords = []
+        for length in DataGenerator._integers(rng, 8, 20, n):
+            # Те же требования, что и в generate_random_password: минимум 1 буква и 1 цифра
+            chars = [rng.choice(string.ascii_letters), rng.choice(string.digits)]
+            chars += rng.choices(password_chars, k=int(length) - 2)
+            rng.shuffle(chars)
+            passwords.append("".join(chars))
+
+        return {
+            "email": [f"kek{token}@gmail.com" for token in DataGenerator._tokens(rng, n)],
+            "fullName": [f"{first} {last}" for first, last in zip(first_names, last_names)],
+            "password": passwords,
+        }
+
+    @staticmethod
+    @replayable("movies")
+    def generate_movies(n, seed=None):
+        """
+        Пакетная генерация данных n фильмов в колоночном виде.
+        Названия уникальны в пределах батча и всего прогона (процесса).
+        :param n: Количество фильмов.
+        :param seed: Зерно батча (по умолчанию - от генератора модуля, см. DataGenerator.seed).
+        :return: Словарь колонок с ключами полей MoviesData; числовые колонки - numpy-массивы, если numpy установлен.
+        """
+        rng = DataGenerator._batch_rng(seed)
+
+        return {
+            "name": [
+                f"{phrase} {token}"
+                for phrase, token in zip(DataGenerator._faker_column(rng, "catch_phrase", n), DataGenerator._tokens(rng, n))
+            ],
+            "price": DataGenerator._integers(rng, 100, 1000, n),
+            "description": DataGenerator._faker_column(rng, "description", n),
+            "location": DataGenerator._sample(rng, MOVIE_LOCATIONS, n),
+            "published": [True] * n,
+            "rating": DataGenerator._integers(rng, 1, 5, n),
+            "genreId": [3] * n,
+        }
+
+    @staticmethod
+    def to_rows(columns):
+        """
+        Преобразование колонок батча в список словарей (по одному на пользователя или фильм).
+        """
+        values = [column.tolist() if hasattr(column, "tolist") else column for column in columns.values()]
+        return [dict(zip(columns, row)) for row in zip(*values)]
@@ -0,0 +1,163 @@
+import copy
+import functools
+import hashlib
+import json
+import os
+import random
+import threading
+from collections import defaultdict
+from contextlib import contextmanager
+
+# Зерно прогона: задается для воспроизведения данных предыдущего прогона (печатается в отчете)
+SEED_ENV = "CINESCOPE_SEED"
+# Путь к JSON-lines файлу, в который записываются все сгенерированные данные прогона
+RECORD_ENV = "CINESCOPE_DATA_RECORD"
+# Путь к записанному ранее файлу, данные из которого возвращаются вместо генерации
+REPLAY_ENV = "CINESCOPE_DATA_REPLAY"
+
+
+def derive_seed(run_seed, key):
+    """
+    Детерминированное зерно для ключа (id теста, воркера нагрузки) от зерна прогона.
+    Не зависит от того, на каком xdist-воркере и в каком порядке выполняется тест.
+    """
+    digest = hashlib.sha256(f"{run_seed}:{key}".encode("utf-8")).digest()
+    return int.from_bytes(digest[:8], "big")
+
+
+def _jsonable(value):
+    if hasattr(value, "tolist"):
+        return value.tolist()
+    if isinstance(value, dict):
+        return {key: _jsonable(item) for key, item in value.items()}
+    return value
+
+
+class DataReplay:
+    """
+    Зерно прогона, запись и воспроизведение сгенерированных данных.
+    Каждое значение DataGenerator адресуется ключом (текущий тест, вид данных, порядковый номер),
+    поэтому воспроизведение не зависит от распределения тестов по xdist-воркерам.
+    """
+
+    def __init__(self):
+        self.run_seed = None
+        self.record_path = None
+        self.replay_path = None
+        self.key = "session"
+        self._recorded = {}
+        self._positions = defaultdict(int)
+        # Номера значений фиксированных ключей scope(): продолжаются между входами в scope
+        self._scope_positions = {}
+        self._record_file = None
+        self._lock = threading.Lock()
+
+    def configure(self, run_seed=None, record_path=None, replay_path=None, writer=True):
+        """
+        Настройка прогона.
+        :param run_seed: Зерно прогона (по умолчанию из записи воспроизведения, CINESCOPE_SEED или случайное).
+        :param record_path: Файл для записи данных.
+        :param replay_path: Файл с данными для воспроизведения.
+        :param writer: Процесс создает файл записи (контроллер или единственный процесс);
+                       остальные процессы (xdist-воркеры) дописывают в него.
+        """
+        self.replay_path = replay_path
+        self._recorded = {}
+        if replay_path:
+            run_seed = self._load(replay_path) if run_seed is None else run_seed
+        if run_seed is None:
+            run_seed = int(os.getenv(SEED_ENV) or random.SystemRandom().getrandbits(32))
+        self.run_seed = int(run_seed)
+
+        self.close()
+        self.record_path = record_path
+        if record_path:
+            if writer:
+                with open(record_path, "w", encoding="utf-8") as file:
+                    file.write(json.dumps({"run_seed": self.run_seed}) + "\n")
+            # Без буферизации каждая строка пишется одним write() в режиме append,
+            # поэтому строки разных процессов (xdist-воркеров) не перемешиваются
+            self._record_file = open(record_path, "ab", buffering=0)
+        return self.run_seed
+
+    def configure_from_env(self, run_seed=None, writer=True):
+        return self.configure(run_seed, os.getenv(RECORD_ENV), os.getenv(REPLAY_ENV), writer)
+
+    def _load(self, path):
+        run_seed = None
+        with open(path, encoding="utf-8") as file:
+            for line in file:
+                entry = json.loads(line)
+                if "run_seed" in entry:
+                    run_seed = entry["run_seed"]
+                    continue
+                self._recorded[(entry["key"], entry["kind"], entry["index"])] = entry["value"]
+        return run_seed
+
+    def start(self, key):
+        """
+        Начало генерации данных для ключа (id теста).
+        :return: Зерно ключа, производное от зерна прогона.
+        """
+        with self._lock:
+            self.key = key
+            self._positions.clear()
+        return derive_seed(self.run_seed, key)
+
+    @contextmanager
+    def scope(self, key):
+        """
+        Генерация под фиксированным ключом (фикстуры уровня сессии, наполнение пулов), а не под id теста,
+        который первым к ним обратился. По выходе восстанавливаются ключ и номера значений текущего теста.
+        :return: Зерно ключа, производное от зерна прогона.
+        """
+        with self._lock:
+            outer = self.key, self._positions
+            self.key = key
+            self._positions = self._scope_positions.setdefault(key, defaultdict(int))
+        try:
+            yield derive_seed(self.run_seed, key)
+        finally:
+            with self._lock:
+                self.key, self._positions = outer
+
+    def value(self, kind, factory):
+        """
+        Очередное значение вида kind: из записи воспроизведения или от factory (с записью, если она включена).
+        """
+        with self._lock:
+            key = self.key
+            index = self._positions[kind]
+            self._positions[kind] += 1
+        recorded_key = (key, kind, index)
+        if recorded_key in self._recorded:
+            value = copy.deepcopy(self._recorded[recorded_key])
+        else:
+            value = factory()
+        if self._record_file is not None:
+            line = json.dumps({"key": key, "kind": kind, "index": index, "value": _jsonable(value)},
+                              ensure_ascii=False)
+            with self._lock:
+                self._record_file.write((line + "\n").encode("utf-8"))
+        return value
+
+    def close(self):
+        if self._record_file is not None:
+            self._record_file.close()
+            self._record_file = None
+
+
+DATA_REPLAY = DataReplay()
+
+
+def replayable(kind):
+    """
+    Декоратор генератора данных: значения записываются и воспроизводятся через DATA_REPLAY.
+    :param kind: Вид данных (например, "movie", "email").
+    """
+    def decorator(function):
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            return DATA_REPLAY.value(kind, lambda: function(*args, **kwargs))
+        return wrapper
+    return decorator
@@ -0,0 +1,133 @@
+import mmap
+import os
+from array import array
+from functools import lru_cache
+from importlib.metadata import version
+
+from tools.tools import Tools
+
+# Версия формата и состава корпуса: при изменении корпус пересобирается
+CORPUS_VERSION = 1
+# Зерно Faker при сборке: одинаковые версия корпуса и Faker дают одинаковый корпус на всех машинах
+CORPUS_SEED = 20250601
+CORPUS_SIZES = {
+    "first_name": 2000,
+    "last_name": 2000,
+    "catch_phrase": 5000,
+    "description": 5000,
+}
+CORPUS_FACTORIES = {
+    "first_name": lambda faker: faker.first_name(),
+    "last_name": lambda faker: faker.last_name(),
+    "catch_phrase": lambda faker: faker.catch_phrase(),
+    "description": lambda faker: faker.text(max_nb_chars=200),
+}
+
+
+@lru_cache(maxsize=None)
+def live_faker(locale="ru_RU"):
+    """
+    Ленивое создание Faker: импорт и загрузка провайдеров происходят только при первом обращении.
+    """
+    from faker import Faker
+    return Faker(locale)
+
+
+class CorpusColumn:
+    """
+    Колонка корпуса - последовательность строк в memory-mapped файле.
+    Файл <name>.bin содержит строки UTF-8 подряд, <name>.idx - смещения их начал (uint32) и конец данных.
+    """
+
+    def __init__(self, path):
+        with open(f"{path}.idx", "rb") as file:
+            self.offsets = array("I")
+            self.offsets.frombytes(file.read())
+        with open(f"{path}.bin", "rb") as file:
+            self.data = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+    def __len__(self):
+        return len(self.offsets) - 1
+
+    def __getitem__(self, index):
+        return self.data[self.offsets[index]:self.offsets[index + 1]].decode("utf-8")
+
+    def sample(self, rng):
+        """
+        Случайная строка колонки.
+        :param rng: Генератор random.Random.
+        """
+        return self[rng.randrange(len(self))]
+
+    @staticmethod
+    def write(path, values):
+        offsets = array("I", [0])
+        with open(f"{path}.bin", "wb") as file:
+            for value in values:
+                encoded = value.encode("utf-8")
+                file.write(encoded)
+                offsets.append(offsets[-1] + len(encoded))
+        with open(f"{path}.idx", "wb") as file:
+            file.write(offsets.tobytes())
+
+
+class FakerCorpus:
+    """
+    Заранее сгенерированный корпус значений Faker (имена, фамилии, слоганы, описания).
+    Собирается один раз на машину в files/faker_corpus (под файловой блокировкой, общей для xdist-воркеров),
+    затем открывается через mmap - без импорта Faker и загрузки его провайдеров.
+    """
+
+    def __init__(self, locale="ru_RU", directory=None):
+        """
+        :param locale: Локаль Faker.
+        :param directory: Директория корпуса (по умолчанию files/faker_corpus/<locale>_v<версия>_faker<версия Faker>).
+        """
+        self.locale = locale
+        self._directory = directory
+        self._columns = {}
+
+    @property
+    def directory(self):
+        if self._directory is None:
+            name = f"{self.locale}_v{CORPUS_VERSION}_faker{version('Faker')}"
+            self._directory = str(Tools.files_dir("faker_corpus", name))
+        return self._directory
+
+    def _path(self, name):
+        return os.path.join(self.directory, name)
+
+    def _is_built(self):
+        return all(os.path.exists(f"{self._path(name)}.idx") for name in CORPUS_SIZES)
+
+    def build(self):
+        """
+        Генерация корпуса через Faker. Файлы каждой колонки сначала пишутся во временные,
+        индекс переименовывается последним - наличие .idx означает готовую колонку.
+        """
+        from faker import Faker
+
+        os.makedirs(self.directory, exist_ok=True)
+        faker = Faker(self.locale)
+        faker.seed_instance(CORPUS_SEED)
+        for name, size in CORPUS_SIZES.items():
+            factory = CORPUS_FACTORIES[name]
+            tmp_path = self._path(f"{name}.tmp")
+            CorpusColumn.write(tmp_path, (factory(faker) for _ in range(size)))
+            os.replace(f"{tmp_path}.bin", f"{self._path(name)}.bin")
+            os.replace(f"{tmp_path}.idx", f"{self._path(name)}.idx")
+
+    def column(self, name):
+        """
+        Колонка корпуса; при первом обращении корпус собирается, если его еще нет.
+        :param name: Одно из CORPUS_SIZES.
+        """
+        if name not in self._columns:
+            if not self._is_built():
+                from filelock import FileLock
+
+                with FileLock(f"{self.directory}.lock"):
+                    if not self._is_built():
+                        self.build()
+            self._columns[name] = CorpusColumn(self._path(name))
+        return self._columns[name]